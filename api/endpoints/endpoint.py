@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 @dataclass
@@ -10,3 +10,5 @@ class Endpoint:
     method: str
     endpoint: str
     body: Dict[str, Any] = field(default_factory=dict)
+    cache: bool = True
+    pagination: Optional[Dict[str, Any]] = None
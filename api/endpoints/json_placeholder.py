@@ -2,7 +2,7 @@
 Autobuilds API endpoint class
 """
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Dict
 from api.endpoints.endpoint import Endpoint
 
 
@@ -14,6 +14,11 @@ class Posts_Post_Body:
     body: str
     userId: int
 
+    def to_dict(self, omit_none: bool = True) -> Dict[str, Any]:
+        """Request payload; optional fields set to None are omitted"""
+        return {"title": self.title, "body": self.body, "userId": self.userId}
+
+
 @dataclass
 class Posts_Id_Put_Body:
     """Request body for posts_id PUT operation."""
@@ -23,6 +28,11 @@ class Posts_Id_Put_Body:
     body: str
     userId: int
 
+    def to_dict(self, omit_none: bool = True) -> Dict[str, Any]:
+        """Request payload; optional fields set to None are omitted"""
+        return {"id": self.id, "title": self.title, "body": self.body, "userId": self.userId}
+
+
 @dataclass
 class Posts_Id_Patch_Body:
     """Request body for posts_id PATCH operation."""
@@ -31,6 +41,18 @@ class Posts_Id_Patch_Body:
     body: str = None
     userId: int = None
 
+    def to_dict(self, omit_none: bool = True) -> Dict[str, Any]:
+        """Request payload; optional fields set to None are omitted"""
+        data = {}
+        if not omit_none or self.title is not None:
+            data["title"] = self.title
+        if not omit_none or self.body is not None:
+            data["body"] = self.body
+        if not omit_none or self.userId is not None:
+            data["userId"] = self.userId
+        return data
+
+
 @dataclass
 class Default:
     """
@@ -45,7 +67,8 @@ class Default:
         """
         method = "GET"
         endpoint = "/posts"
-        return Endpoint(method, endpoint)
+        pagination = {"style": "page", "page_param": "_page", "limit_param": "_limit", "limit": 10}
+        return Endpoint(method, endpoint, pagination=pagination)
 
     @property
     def posts_post(self) -> Endpoint:
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import sys
 import re
+import hashlib
+import json
 from collections import defaultdict
 from pathlib import Path
 
@@ -51,7 +53,8 @@ def first_content_type(request_body: dict | None) -> str | None:
 
 def resolve_schema_ref(ref: str, openapi: dict) -> dict:
     """
-    Resolve $ref to actual schema definition.
+    Resolve $ref to actual schema definition by walking the spec from
+    its root; SchemaResolver.lookup() is the indexed, memoized variant.
 
     :param ref: Reference string like '#/components/schemas/CarWriteRequest'
     :type ref: str
@@ -63,19 +66,147 @@ def resolve_schema_ref(ref: str, openapi: dict) -> dict:
     if not ref.startswith("#/"):
         return {}
 
-    parts = ref.lstrip("#/").split("/")
+    parts = ref[2:].split("/")
     obj = openapi
 
     for part in parts:
         if isinstance(obj, dict):
-            obj = obj.get(part, {})
+            obj = obj.get(part.replace("~1", "/").replace("~0", "~"), {})
         else:
             return {}
 
     return obj if isinstance(obj, dict) else {}
 
 
-def get_body_schema(request_body: dict | None, openapi: dict) -> dict:
+def _direct_refs(node):
+    """$ref strings inside node, without following them"""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str):
+            yield ref
+        for value in node.values():
+            yield from _direct_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _direct_refs(value)
+
+
+class SchemaResolver:
+    """
+    Resolves local $refs of one OpenAPI document.
+
+    `components` are indexed once and every referenced schema is resolved
+    once, so resolving a whole spec is linear in its size. Nested refs,
+    allOf, properties, items and oneOf/anyOf are followed; where a schema
+    recurses into itself the cycle is closed with its {"$ref": ...}.
+    A ref resolves the same whatever was resolved before: results are
+    memoized per ref and per set of refs of its closure that were being
+    resolved around it (the refs where its expansion is cut).
+    Resolved schemas are shared between callers: do not mutate them.
+    """
+
+    SUBSCHEMA = ("items", "additionalProperties", "not")
+    SUBSCHEMA_LISTS = ("oneOf", "anyOf")
+
+    def __init__(self, openapi: dict):
+        self.openapi = openapi
+        self.index = {}
+        for section, entries in (openapi.get("components") or {}).items():
+            if isinstance(entries, dict):
+                for name, node in entries.items():
+                    pointer = str(name).replace("~", "~0").replace("/", "~1")
+                    self.index[f"#/components/{section}/{pointer}"] = node
+        self._resolved = {}
+        self._active = set()
+        self._closures = {}
+
+    def lookup(self, ref: str) -> dict:
+        """Target of ref as written in the spec, {} when it does not exist"""
+        node = self.index.get(ref)
+        if node is None:
+            node = self.index[ref] = resolve_schema_ref(ref, self.openapi)
+        return node if isinstance(node, dict) else {}
+
+    def resolve(self, schema: dict) -> dict:
+        """Schema with every $ref replaced by its target and allOf merged"""
+        if not isinstance(schema, dict):
+            return {}
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            if ref in self._active:
+                return {"$ref": ref}  # recursive schema
+            # the expansion depends only on which refs it can reach are active
+            key = (ref, frozenset(self._active & self._closure(ref)))
+            if key in self._resolved:
+                return self._resolved[key]
+            self._active.add(ref)
+            try:
+                resolved = self.resolve(self.lookup(ref))
+            finally:
+                self._active.discard(ref)
+            self._resolved[key] = resolved
+            return resolved
+
+        resolved = {key: value for key, value in schema.items() if key != "allOf"}
+        if isinstance(schema.get("properties"), dict):
+            resolved["properties"] = {
+                name: self.resolve(prop) for name, prop in schema["properties"].items()
+            }
+        for key in self.SUBSCHEMA:
+            if isinstance(schema.get(key), dict):
+                resolved[key] = self.resolve(schema[key])
+        for key in self.SUBSCHEMA_LISTS:
+            if isinstance(schema.get(key), list):
+                resolved[key] = [self.resolve(part) for part in schema[key]]
+        if isinstance(schema.get("allOf"), list):
+            parts = [self.resolve(part) for part in schema["allOf"]]
+            resolved = merge_all_of(parts + [resolved])
+        return resolved
+
+    def dependencies(self, node) -> list:
+        """Refs reachable from node, transitively, sorted"""
+        found = set()
+        for ref in _direct_refs(node):
+            found |= self._closure(ref)
+        return sorted(found)
+
+    def _closure(self, ref: str) -> frozenset:
+        closure = self._closures.get(ref)
+        if closure is None:
+            seen, stack = {ref}, [ref]
+            while stack:
+                for nested in _direct_refs(self.lookup(stack.pop())):
+                    if nested not in seen:
+                        seen.add(nested)
+                        stack.append(nested)
+            closure = self._closures[ref] = frozenset(seen)
+        return closure
+
+
+def merge_all_of(parts: list) -> dict:
+    """
+    One schema from resolved allOf parts: properties and required are
+    combined, for other keywords the last part wins.
+    """
+    merged, properties, required = {}, {}, []
+    for part in parts:
+        properties.update(part.get("properties") or {})
+        required.extend(r for r in part.get("required") or [] if r not in required)
+        merged.update(
+            (key, value)
+            for key, value in part.items()
+            if key not in ("properties", "required")
+        )
+    if properties:
+        merged["properties"] = properties
+    if required:
+        merged["required"] = required
+    return merged
+
+
+def get_body_schema(
+    request_body: dict | None, openapi: dict, resolver: SchemaResolver | None = None
+) -> dict:
     """
     Extract body schema from request body, resolving references if needed.
 
@@ -83,21 +214,20 @@ def get_body_schema(request_body: dict | None, openapi: dict) -> dict:
     :type request_body: dict | None
     :param openapi: OpenAPI specification
     :type openapi: dict
+    :param resolver: SchemaResolver shared by one generation run
     :return: Schema definition
     :rtype: dict
     """
     if not request_body:
         return {}
+    if resolver is None:
+        resolver = SchemaResolver(openapi)
+    if "$ref" in request_body:
+        request_body = resolver.lookup(request_body["$ref"])
 
     content = request_body.get("content") or {}
     for _, cval in content.items():
-        schema = cval.get("schema") or {}
-
-        # Handle $ref
-        if "$ref" in schema:
-            return resolve_schema_ref(schema["$ref"], openapi)
-
-        return schema
+        return resolver.resolve(cval.get("schema") or {})
 
     return {}
 
@@ -149,7 +279,9 @@ def openapi_type_to_python(openapi_type: str, openapi_format: str | None = None)
     return "Any"
 
 
-def extract_body_fields(request_body: dict | None, openapi: dict) -> list[dict]:
+def extract_body_fields(
+    request_body: dict | None, openapi: dict, resolver: SchemaResolver | None = None
+) -> list[dict]:
     """
     Extract body fields with their types and required status.
 
@@ -157,13 +289,14 @@ def extract_body_fields(request_body: dict | None, openapi: dict) -> list[dict]:
     :type request_body: dict | None
     :param openapi: OpenAPI specification
     :type openapi: dict
+    :param resolver: SchemaResolver shared by one generation run
     :return: List of field dicts with keys: name, type, required
     :rtype: list[dict]
     """
     if not request_body:
         return []
 
-    schema = get_body_schema(request_body, openapi)
+    schema = get_body_schema(request_body, openapi, resolver)
     properties = schema.get("properties") or {}
     required_fields = set(schema.get("required") or [])
 
@@ -187,17 +320,26 @@ def extract_body_fields(request_body: dict | None, openapi: dict) -> list[dict]:
     return fields
 
 
-def extract_method_info(path: str, op: dict, openapi: dict | None = None) -> dict:
+def extract_method_info(
+    path: str,
+    op: dict,
+    openapi: dict | None = None,
+    resolver: SchemaResolver | None = None,
+) -> dict:
     """Extract method information from OpenAPI operation."""
     if openapi is None:
         openapi = {}
+    if resolver is None:
+        resolver = SchemaResolver(openapi)
 
     tags = op.get("tags") or ["Default"]
     class_name = sanitize_class_name(tags[0])
 
     rb = op.get("requestBody", {})
+    if "$ref" in rb:
+        rb = resolver.lookup(rb["$ref"])
     props = list(schema_properties(rb).keys())
-    body_fields = extract_body_fields(rb, openapi)
+    body_fields = extract_body_fields(rb, openapi, resolver)
 
     method_name = sanitize_method_name(path)
     description = (op.get("description") or op.get("summary") or "").strip()
@@ -218,20 +360,33 @@ def extract_method_info(path: str, op: dict, openapi: dict | None = None) -> dic
         "props": props,
         "body_fields": body_fields,
         "description": description,
+        "pagination": op.get("x-pagination"),
     }
 
 
-def build_class_methods(openapi: dict) -> dict:
-    """Build class methods dictionary from OpenAPI spec."""
+def build_class_methods(
+    openapi: dict,
+    only: set | None = None,
+    resolver: SchemaResolver | None = None,
+) -> dict:
+    """
+    Build class methods dictionary from OpenAPI spec, limited to the
+    classes named in `only` when given. Refs are always resolved against
+    the whole spec.
+    """
     paths = openapi.get("paths") or {}
     class_methods = defaultdict(list)
+    if resolver is None:
+        resolver = SchemaResolver(openapi)
 
     for path, methods in paths.items():
         for http_method, op in (methods or {}).items():
             if http_method.startswith("x-"):
                 continue
+            if only is not None and _class_of(op) not in only:
+                continue
 
-            info = extract_method_info(path, op, openapi)
+            info = extract_method_info(path, op, openapi, resolver)
             info["http_method"] = http_method.upper()
             class_methods[info["class_name"]].append(info)
 
@@ -273,10 +428,58 @@ def generate_body_dataclass(method_info: dict, ident: str) -> list:
         field_type = field["type"]
         lines.append(f"{ident}{field_name}: {field_type} = None")
 
+    lines.append("")
+    lines.extend(generate_body_serializer(required_fields, optional_fields, ident))
+    # second blank line: PEP 8 spacing before the next top-level class
     lines.append("")
     return lines
 
 
+def generate_body_serializer(
+    required_fields: list, optional_fields: list, ident: str
+) -> list:
+    """
+    Generate to_dict() for a Body dataclass: a flat dict literal instead
+    of dataclasses.asdict (no recursive deep copy); None optional fields
+    are left out unless omit_none is False.
+    """
+    body = ident * 2
+    lines = [
+        f"{ident}def to_dict(self, omit_none: bool = True) -> Dict[str, Any]:",
+        f'{body}"""Request payload; optional fields set to None are omitted"""',
+    ]
+    items = ", ".join(f'"{f["name"]}": self.{f["name"]}' for f in required_fields)
+    if not optional_fields:
+        lines.append(f"{body}return {{{items}}}")
+        lines.append("")
+        return lines
+    lines.append(f"{body}data = {{{items}}}")
+    for field in optional_fields:
+        name = field["name"]
+        lines.append(f"{body}if not omit_none or self.{name} is not None:")
+        lines.append(f'{body}{ident}data["{name}"] = self.{name}')
+    lines.append(f"{body}return data")
+    lines.append("")
+    return lines
+
+
+def python_literal(value) -> str:
+    """
+    Python source for plain data, strings in double quotes like the rest
+    of the generated code (repr() would use single quotes)
+    """
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{python_literal(k)}: {python_literal(v)}" for k, v in value.items()
+        )
+        return f"{{{items}}}"
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(python_literal(v) for v in value)}]"
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return repr(value)
+
+
 def generate_method(method_info: dict, ident: str) -> list:
     """Generate Python code for a single method."""
     lines = []
@@ -294,15 +497,19 @@ def generate_method(method_info: dict, ident: str) -> list:
     lines.append(f'{ident}method = "{m["http_method"]}"')
     lines.append(f'{ident}endpoint = "{m["endpoint"]}"')
 
+    args = "method, endpoint"
     # Generate body if request has body fields
     if m.get("body_fields"):
         method_name = m["method_name"]
         http_method = m["http_method"].lower()
         body_class_name = sanitize_class_name(f"{method_name}_{http_method}_body")
         lines.append(f"{ident}body = {body_class_name}")
-        lines.append(f"{ident}return Endpoint(method, endpoint, body)")
-    else:
-        lines.append(f"{ident}return Endpoint(method, endpoint)")
+        args += ", body"
+    # x-pagination extension of the operation
+    if m.get("pagination"):
+        lines.append(f"{ident}pagination = {python_literal(m['pagination'])}")
+        args += ", pagination=pagination"
+    lines.append(f"{ident}return Endpoint({args})")
 
     lines.append("")
     return lines
@@ -342,7 +549,7 @@ def generate_endpoint_class():
     ident = "    "
     class_name = "Endpoint"
     lines.append("from dataclasses import dataclass, field")
-    lines.append("from typing import Dict, Any\n\n")
+    lines.append("from typing import Dict, Any, Optional\n\n")
 
     lines.append("@dataclass")
     lines.append(f"class {class_name}:")
@@ -351,26 +558,138 @@ def generate_endpoint_class():
     )
     lines.append(f"{ident}method: str")
     lines.append(f"{ident}endpoint: str")
-    lines.append(f"{ident}body: Dict[str, Any] = field(default_factory=dict)\n")
+    lines.append(f"{ident}body: Dict[str, Any] = field(default_factory=dict)")
+    lines.append(f"{ident}cache: bool = True")
+    lines.append(f"{ident}pagination: Optional[Dict[str, Any]] = None\n")
 
     return "\n".join(lines).rstrip() + "\n"
 
 
+IDENT = "    "
+HEADER = [
+    '"""\nAutobuilds API endpoint class\n"""',
+    "from dataclasses import dataclass",
+    "from typing import Any, Dict",
+    "from api.endpoints.endpoint import Endpoint\n\n",
+]
+
+
+def assemble(chunks: dict) -> str:
+    """Module text from generated class chunks, in class name order"""
+    classes = "\n\n".join(chunks[name] for name in sorted(chunks))
+    return ("\n".join(HEADER) + "\n" + classes).rstrip() + "\n"
+
+
 def generate(openapi: dict) -> str:
     """Generate Python code from OpenAPI specification."""
     class_methods = build_class_methods(openapi)
+    chunks = {
+        name: "\n".join(generate_class(name, methods, IDENT))
+        for name, methods in class_methods.items()
+    }
+    return assemble(chunks)
 
-    lines = []
-    ident = "    "
-    lines.append('"""\nAutobuilds API endpoint class\n"""')
-    lines.append("from dataclasses import dataclass")
-    lines.append("from typing import Any")
-    lines.append("from api.endpoints.endpoint import Endpoint\n\n")
 
-    for class_name in sorted(class_methods.keys()):
-        lines.extend(generate_class(class_name, class_methods[class_name], ident))
+def _digest(data) -> str:
+    text = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
-    return "\n".join(lines).rstrip() + "\n"
+
+def operation_digests(openapi: dict, resolver: SchemaResolver | None = None) -> dict:
+    """
+    Per class: hash of each of its operations together with the schemas
+    they reference, in spec order, so any input change of a class shows.
+    """
+    resolver = resolver if resolver is not None else SchemaResolver(openapi)
+    schema_digests, closure_digests = {}, {}
+
+    def closure_digest(ref: str) -> str:
+        """Hash of ref's target and of every schema reachable from it"""
+        if ref not in closure_digests:
+            deps = resolver.dependencies({"$ref": ref})
+            for dep in deps:
+                if dep not in schema_digests:
+                    schema_digests[dep] = _digest(resolver.lookup(dep))
+            closure_digests[ref] = _digest([(d, schema_digests[d]) for d in deps])
+        return closure_digests[ref]
+
+    digests = defaultdict(list)
+    for path, methods in (openapi.get("paths") or {}).items():
+        for http_method, op in (methods or {}).items():
+            if http_method.startswith("x-"):
+                continue
+            refs = {ref: closure_digest(ref) for ref in _direct_refs(op)}
+            digests[_class_of(op)].append(_digest([path, http_method, op, refs]))
+    return digests
+
+
+def generator_digest() -> str:
+    """Hash of this generator: editing it invalidates every manifest entry"""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def generate_incremental(openapi: dict, manifest: dict | None = None) -> tuple:
+    """
+    Like generate(), but reuse the code of classes whose operations and
+    referenced schemas hash the same as in manifest. Changed classes are
+    built against the whole spec with one resolver, as in generate(), so
+    the code is always identical to a full generation.
+    Returns (code, new manifest, names of regenerated classes).
+    """
+    generator = generator_digest()
+    previous = {}
+    if manifest and manifest.get("generator") == generator:
+        previous = manifest.get("classes") or {}
+
+    resolver = SchemaResolver(openapi)
+    digests = operation_digests(openapi, resolver)
+    chunks, entries, changed = {}, {}, []
+    for name, ops in digests.items():
+        digest = _digest(ops)
+        cached = previous.get(name)
+        if cached is not None and cached["digest"] == digest:
+            chunks[name] = cached["code"]
+        else:
+            changed.append(name)
+        entries[name] = {"digest": digest, "code": chunks.get(name)}
+
+    if changed:
+        class_methods = build_class_methods(openapi, set(changed), resolver)
+        for name in changed:
+            chunks[name] = "\n".join(generate_class(name, class_methods[name], IDENT))
+            entries[name]["code"] = chunks[name]
+
+    code = assemble(chunks)
+    new_manifest = {
+        "generator": generator,
+        "output": hashlib.sha256(code.encode("utf-8")).hexdigest(),
+        "classes": entries,
+    }
+    return code, new_manifest, sorted(changed)
+
+
+def _class_of(op: dict) -> str:
+    """Generated class of an operation: its first tag"""
+    return sanitize_class_name((op.get("tags") or ["Default"])[0])
+
+
+def build(yaml_file: Path, pyfile: Path, full: bool = False) -> list:
+    """
+    Regenerate pyfile from yaml_file, touching only changed classes. The
+    manifest (<pyfile>.manifest.json) is trusted only while pyfile still
+    holds what was last generated. Returns names of regenerated classes.
+    """
+    manifest_file = pyfile.with_suffix(".manifest.json")
+    manifest = None
+    if not full and manifest_file.exists() and pyfile.exists():
+        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        current = hashlib.sha256(pyfile.read_bytes()).hexdigest()
+        if manifest.get("output") != current:
+            manifest = None
+    code, manifest, changed = generate_incremental(load_spec(yaml_file), manifest)
+    save_to_file(pyfile, code)
+    save_to_file(manifest_file, json.dumps(manifest, indent=1) + "\n")
+    return changed
 
 
 def main(yaml_file: Path):
@@ -380,31 +699,45 @@ def main(yaml_file: Path):
     :param yaml_file: path to file
     :type yaml_file: Path
     """
-    incoming_data = yaml_file.read_text(encoding="utf-8")
-    data = yaml.safe_load(incoming_data)
-    out_data = generate(data)
+    out_data = generate(load_spec(yaml_file))
     return out_data
 
 
-def save_to_file(filename: str | Path, content: str) -> None:
+def load_spec(yaml_file: Path) -> dict:
+    """Parse the OpenAPI file, with libyaml when available"""
+    incoming_data = yaml_file.read_text(encoding="utf-8")
+    return yaml.load(
+        incoming_data, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    )
+
+
+def save_to_file(filename: str | Path, content: str) -> bool:
     """
-    Save resilt to .py file
+    Save resilt to .py file, unless it already holds exactly this content:
+    an untouched file keeps its mtime and its cached bytecode stays valid
 
     :param filename: Description
     :type filename: str
     :param content: Description
+    :return: True when the file was written
     """
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
+    path = Path(filename)
+    data = content.encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.write_bytes(data)
+    return True
 
 
 if __name__ == "__main__":
+    # usage: endpoint_generator.py [name] [--full]
     wd = Path(__file__).parent
-    name = sys.argv[1] if len(sys.argv) > 1 else "car_api"
+    args = [arg for arg in sys.argv[1:] if arg != "--full"]
+    name = args[0] if args else "car_api"
     openapi_file = wd / f"{name}.yaml"
-    py_text = main(openapi_file)
     pyfile = wd.parent / "endpoints" / f"{name.lower()}.py"
-    save_to_file(pyfile, py_text)
+    changed = build(openapi_file, pyfile, full="--full" in sys.argv)
+    print(f"regenerated: {', '.join(changed) or 'nothing'}")
     endpoint_content = generate_endpoint_class()
     endpoint_file = wd.parent / "endpoints" / "endpoint.py"
     save_to_file(endpoint_file, endpoint_content)
@@ -0,0 +1,72 @@
+"""
+python -m benchmarks run [--output PATH] [--iterations N] [--repeats N] [--only NAME ...]
+python -m benchmarks compare BASELINE CURRENT [--threshold 0.1]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from benchmarks.suite import (
+    BENCHMARKS,
+    compare,
+    format_comparison,
+    load,
+    run_suite,
+    save,
+)
+
+BASELINES = Path(__file__).resolve().parent / "baselines"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="API client benchmarks"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite and store a JSON result")
+    run.add_argument("--output", default=str(BASELINES / "current.json"))
+    run.add_argument("--iterations", type=int, default=500)
+    run.add_argument("--repeats", type=int, default=3)
+    run.add_argument("--only", nargs="+", choices=BENCHMARKS)
+
+    cmp = commands.add_parser("compare", help="flag regressions against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument(
+        "--threshold", type=float, default=0.10, help="allowed worsening, 0.1 = 10%%"
+    )
+    cmp.add_argument("--json", action="store_true", help="print rows as JSON")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        result = run_suite(args.iterations, args.only, args.repeats)
+        path = save(result, args.output)
+        for name, metric in result["metrics"].items():
+            print(f"{name:34} {metric['value']:>12.1f} {metric['unit']}")
+        print(f"saved to {path}")
+        return 0
+
+    rows = compare(load(args.baseline), load(args.current), args.threshold)
+    print(json.dumps(rows, indent=2) if args.json else format_comparison(rows))
+    missing = [row["metric"] for row in rows if row.get("missing")]
+    regressions = [
+        row["metric"] for row in rows if row["regressed"] and not row.get("missing")
+    ]
+    if missing:
+        print(f"{len(missing)} baseline metric(s) missing", file=sys.stderr)
+    if regressions:
+        print(
+            f"{len(regressions)} regression(s) past {args.threshold:.0%}",
+            file=sys.stderr,
+        )
+    if missing or regressions:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,342 @@
+"""
+Micro-benchmarks of the API client layer against the in-process mock server.
+
+Every benchmark returns metrics as {name: (value, unit, better)} where
+better is "lower" or "higher"; compare() uses it to flag regressions.
+Tail percentiles are stored for reference but too noisy to gate on.
+"""
+
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from api.endpoints.json_placeholder import Default
+from framework_api.async_client import AsyncApiClient
+from framework_api.cache import ResponseCache
+from framework_api.client import ApiClient
+from framework_api.mock_server import MockServer
+from framework_api.pool import SessionPool
+from framework_api.request_spec import RequestSpec
+
+SPEC = (
+    Path(__file__).resolve().parent.parent / "api" / "models" / "json_placeholder.yaml"
+)
+
+Metric = Tuple[float, str, str]
+Metrics = Dict[str, Metric]
+
+
+class Post(BaseModel):
+    id: int
+    title: str
+    body: str
+    userId: int
+
+
+def _time_calls(call: Callable[[], Any], iterations: int) -> List[float]:
+    """Seconds per call, after a few warm-up calls"""
+    for _ in range(min(iterations, 5)):
+        call()
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _latency_metrics(prefix: str, samples: List[float]) -> Metrics:
+    ordered = sorted(samples)
+    return {
+        f"{prefix}.mean_us": (statistics.fmean(samples) * 1e6, "us", "lower"),
+        f"{prefix}.p50_us": (ordered[len(ordered) // 2] * 1e6, "us", "lower"),
+        f"{prefix}.p99_us": (ordered[int(len(ordered) * 0.99)] * 1e6, "us", "lower"),
+        f"{prefix}.rps": (len(samples) / sum(samples), "req/s", "higher"),
+    }
+
+
+class ClientBenchmarks:
+    """Benchmarks sharing one mock server and session pool"""
+
+    def __init__(self, server: MockServer, iterations: int = 500) -> None:
+        self.server = server
+        self.iterations = iterations
+        self.pool = SessionPool()
+        default = Default()
+        self.item = RequestSpec.from_endpoint(
+            default.posts_id_get, server.url, {"id": 1}
+        )
+        self.listing = RequestSpec.from_endpoint(default.posts_get, server.url)
+
+    def plain(self) -> Metrics:
+        """
+        ApiClient GET next to a bare session GET of the same URL. Calls
+        alternate so server and scheduler noise hits both alike; the
+        difference of medians is the client's own per-call overhead.
+        """
+        session = self.pool.acquire(self.item.url, True, {})
+        raw: List[float] = []
+        client: List[float] = []
+        for _ in range(5):
+            session.get(self.item.url).json()
+            ApiClient(self.item, pool=self.pool).request()
+        for _ in range(self.iterations):
+            started = time.perf_counter()
+            session.get(self.item.url).json()
+            middle = time.perf_counter()
+            ApiClient(self.item, pool=self.pool).request()
+            raw.append(middle - started)
+            client.append(time.perf_counter() - middle)
+        overhead = statistics.median(client) - statistics.median(raw)
+        return {
+            **_latency_metrics("raw_session", raw),
+            **_latency_metrics("plain", client),
+            "overhead.plain_us": (overhead * 1e6, "us", "lower"),
+        }
+
+    def validated(self) -> Metrics:
+        samples = _time_calls(
+            lambda: ApiClient(
+                self.listing, schema=list[Post], validate_response=True, pool=self.pool
+            ).request(),
+            self.iterations,
+        )
+        return _latency_metrics("validated", samples)
+
+    def cached(self) -> Metrics:
+        cache = ResponseCache()
+        samples = _time_calls(
+            lambda: ApiClient(self.item, pool=self.pool, cache=cache).request(),
+            self.iterations,
+        )
+        return _latency_metrics("cached", samples)
+
+    def stream(self) -> Metrics:
+        samples = _time_calls(
+            lambda: list(ApiClient(self.listing, pool=self.pool).stream()),
+            self.iterations,
+        )
+        return _latency_metrics("stream", samples)
+
+    def async_many(self, batch: int = 50) -> Metrics:
+        """request_many() fan-out; reported per request"""
+
+        async def run() -> float:
+            async with AsyncApiClient(self.item) as client:
+                await client.request_many([self.item] * batch)
+                started = time.perf_counter()
+                for _ in range(max(self.iterations // batch, 1)):
+                    await client.request_many([self.item] * batch, concurrency=10)
+                return time.perf_counter() - started
+
+        rounds = max(self.iterations // batch, 1)
+        elapsed = asyncio.run(run())
+        per_call = elapsed / (rounds * batch)
+        return {
+            "async_many.mean_us": (per_call * 1e6, "us", "lower"),
+            "async_many.rps": (1 / per_call, "req/s", "higher"),
+        }
+
+    def connections(self) -> Metrics:
+        """Cold (new pool and connection per call) versus warm (pooled) cost"""
+        cold_rounds = max(self.iterations // 10, 10)
+
+        def cold() -> None:
+            pool = SessionPool()
+            ApiClient(self.item, pool=pool).request()
+            pool.close()
+
+        cold_samples = _time_calls(cold, cold_rounds)
+        warm_samples = _time_calls(
+            lambda: ApiClient(self.item, pool=self.pool).request(), cold_rounds
+        )
+        cold_mean = statistics.fmean(cold_samples)
+        warm_mean = statistics.fmean(warm_samples)
+        # noise can make a warm call slower than a cold one on a fast host
+        setup = max(cold_mean - warm_mean, 0.0)
+        return {
+            "connection.cold_us": (cold_mean * 1e6, "us", "lower"),
+            "connection.warm_us": (warm_mean * 1e6, "us", "lower"),
+            "connection.setup_us": (setup * 1e6, "us", "lower"),
+        }
+
+    def memory(self) -> Metrics:
+        """Bytes allocated and retained per request (tracemalloc)"""
+        count = max(self.iterations // 5, 20)
+        for _ in range(5):
+            ApiClient(self.item, pool=self.pool).request()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            for _ in range(count):
+                ApiClient(self.item, pool=self.pool).request()
+            gc.collect()
+            after, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return {
+            "memory.peak_per_request_b": ((peak - before) / count, "B", "lower"),
+            "memory.retained_per_request_b": ((after - before) / count, "B", "lower"),
+        }
+
+    def run(self, only: Optional[List[str]] = None) -> Metrics:
+        metrics: Metrics = {}
+        for name in only or BENCHMARKS:
+            metrics.update(getattr(self, name)())
+        return metrics
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+# suffixes of metrics that are informational only
+NOISY = ("p99_us",)
+
+BENCHMARKS = (
+    "plain",
+    "validated",
+    "cached",
+    "stream",
+    "async_many",
+    "connections",
+    "memory",
+)
+
+
+def run_suite(
+    iterations: int = 500, only: Optional[List[str]] = None, repeats: int = 3
+) -> Dict[str, Any]:
+    """
+    Run benchmarks against a fresh mock server, baseline-ready result.
+    Each metric is the median over `repeats` runs of the suite.
+    """
+    runs: List[Metrics] = []
+    with MockServer(SPEC) as server:
+        bench = ClientBenchmarks(server, iterations)
+        try:
+            for _ in range(repeats):
+                runs.append(bench.run(only))
+        finally:
+            bench.close()
+    metrics = {
+        name: (statistics.median(run[name][0] for run in runs), unit, better)
+        for name, (_, unit, better) in runs[0].items()
+    }
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "iterations": iterations,
+            "repeats": repeats,
+        },
+        "metrics": {
+            name: {
+                "value": round(value, 3),
+                "unit": unit,
+                "better": better,
+                "gate": not name.endswith(NOISY),
+            }
+            for name, (value, unit, better) in sorted(metrics.items())
+        },
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def save(result: Dict[str, Any], path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def load(path: str | Path) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10
+) -> List[Dict[str, Any]]:
+    """
+    Per-metric change of current against baseline. `change` is signed so
+    that positive always means worse; regressed is set past `threshold`
+    for gating metrics. A baseline metric absent from current is reported
+    as missing and counts as a regression, so a broken or skipped
+    benchmark cannot pass the gate.
+    """
+    rows = []
+    for name, base in sorted(baseline["metrics"].items()):
+        now = current["metrics"].get(name)
+        if now is None:
+            rows.append(
+                {
+                    "metric": name,
+                    "unit": base["unit"],
+                    "baseline": base["value"],
+                    "current": None,
+                    "change": None,
+                    "regressed": True,
+                    "missing": True,
+                }
+            )
+            continue
+        if base["value"] == 0:
+            change = 0.0
+        else:
+            change = (now["value"] - base["value"]) / abs(base["value"])
+        if base["better"] == "higher":
+            change = -change
+        rows.append(
+            {
+                "metric": name,
+                "unit": base["unit"],
+                "baseline": base["value"],
+                "current": now["value"],
+                "change": change,
+                "regressed": base.get("gate", True) and change > threshold,
+            }
+        )
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'metric':34} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for row in rows:
+        if row.get("missing"):
+            lines.append(
+                f"{row['metric']:34} {row['baseline']:>12.1f} {'missing':>12} "
+                f"{'':>8}  REGRESSION"
+            )
+            continue
+        flag = "  REGRESSION" if row["regressed"] else ""
+        lines.append(
+            f"{row['metric']:34} {row['baseline']:>12.1f} {row['current']:>12.1f} "
+            f"{row['change']:>+8.1%}{flag}"
+        )
+    return "\n".join(lines)
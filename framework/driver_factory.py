@@ -1,9 +1,14 @@
 from framework.logger import log_waning
 
-try:
-    from playwright.sync_api import sync_playwright
-except ImportError:
-    log_waning("Playwright not installed, Playwright browser factory will not work")
+
+def _sync_playwright():
+    """Playwright context manager, imported on first browser launch"""
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        log_waning("Playwright not installed, Playwright browser factory will not work")
+        raise
+    return sync_playwright()
 
 
 class DriverFactory:
@@ -15,7 +20,7 @@ class DriverFactory:
     ):
         """Create local Playwright browser"""
 
-        p = sync_playwright().start()
+        p = _sync_playwright().start()
 
         browser_map = {
             "chromium": p.chromium,
@@ -32,7 +37,7 @@ class DriverFactory:
     ):
         """Create remote Playwright browser via WebSocket"""
 
-        p = sync_playwright().start()
+        p = _sync_playwright().start()
 
         browser_map = {
             "chromium": p.chromium,
@@ -1,8 +1,6 @@
 from typing import Optional, Any
 from framework.logger import setup_logger
 
-from playwright.sync_api import expect
-
 
 class PlaywrightWaitManager:
     """Playwright wait implementation"""
@@ -28,6 +26,9 @@ class PlaywrightWaitManager:
         self, locator: str, timeout: Optional[int] = None
     ) -> Optional[Any]:
         """Wait for element to be clickable"""
+        # deferred, so importing framework.element does not load playwright
+        from playwright.sync_api import expect
+
         try:
             actual_timeout = timeout or self.timeout
             locator_obj = self.page.locator(locator)
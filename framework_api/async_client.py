@@ -0,0 +1,262 @@
+"""
+Asyncio API client built on niquests.AsyncSession.
+"""
+
+import asyncio
+import inspect
+import time
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import niquests
+from pydantic import BaseModel
+from api.endpoints.endpoint import Endpoint
+from framework_api.cache import CacheEntry, ResponseCache
+from framework_api.cassette import Cassette
+from framework_api.client import APIError, ApiClient
+from framework_api.circuit import CircuitBreakers
+from framework_api.codec import JsonCodec
+from framework_api.rate_limit import RateLimiter
+from framework_api.report import ReportWriter
+from framework_api.request_spec import RequestSpec
+from framework_api.retry import RetryPolicy
+from framework_api.singleflight import SingleFlight
+from framework_api.timing import TimingRecorder
+from framework_api.validation import Sampling
+
+Target = Union[Endpoint, RequestSpec]
+EndpointItem = Union[Target, Tuple[Target, type[BaseModel]]]
+
+
+class AsyncApiClient(ApiClient):
+    """
+    Async counterpart of ApiClient with the same Endpoint and validation
+    semantics. Use as `async with AsyncApiClient(endpoint) as client`.
+    stream() and paginate() are sync-only and raise TypeError here.
+    """
+
+    def __init__(
+        self,
+        endpoint: Target,
+        schema="",
+        headers: Dict = None,
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        validate_response: bool = False,
+        session: Optional[niquests.AsyncSession] = None,
+        pool_maxsize: int = 10,
+        retry: Optional[RetryPolicy] = None,
+        max_response_time: Optional[float] = None,
+        enforce_response_time: bool = False,
+        recorder: Optional[TimingRecorder] = None,
+        cache: Optional[ResponseCache] = None,
+        cassette: Optional[Cassette] = None,
+        codec: JsonCodec | str = "auto",
+        sampling: Optional[Sampling] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        reporter: Optional[ReportWriter] = None,
+    ) -> None:
+        """
+        endpoint: Endpoint dataclass object with a full url, or a RequestSpec
+        session = shared AsyncSession, created on first request when None
+        pool_maxsize = keep-alive connections of the owned session
+        """
+        self._session = session
+        self._owns_session = session is None
+        self.pool_maxsize = pool_maxsize
+        super().__init__(
+            endpoint,
+            schema=schema,
+            headers=headers,
+            timeout=timeout,
+            verify_ssl=verify_ssl,
+            validate_response=validate_response,
+            retry=retry,
+            max_response_time=max_response_time,
+            enforce_response_time=enforce_response_time,
+            recorder=recorder,
+            cache=cache,
+            cassette=cassette,
+            codec=codec,
+            sampling=sampling,
+            rate_limiter=rate_limiter,
+            single_flight=single_flight,
+            circuit_breakers=circuit_breakers,
+            reporter=reporter,
+        )
+
+    def _acquire_session(self) -> Optional[niquests.AsyncSession]:
+        return self._session
+
+    def _get_session(self) -> niquests.AsyncSession:
+        if self._session is None:
+            self._session = niquests.AsyncSession(
+                pool_connections=self.pool_maxsize,
+                pool_maxsize=self.pool_maxsize,
+            )
+            self._session.verify = self.verify_ssl
+        self.session = self._session
+        return self._session
+
+    async def request(self) -> Any:
+        """
+        Send request and return decoded body.
+
+        :rtype: Any
+        """
+        session = self._get_session()
+        kwargs = self._request_kwargs()
+        cache_key, entry = self._cache_lookup(kwargs)
+        if entry is not None and entry.is_fresh():
+            return self._handle_response(entry.to_response(), from_cache=True)
+
+        flight_key = self._flight_key(kwargs)
+        fetch = partial(self._fetch_async, session, kwargs, cache_key, entry)
+        if flight_key is not None:
+            led = []
+
+            async def lead() -> niquests.Response:
+                led.append(True)
+                return await fetch()
+
+            started = time.perf_counter()
+            resp = await self.single_flight.do_async(flight_key, lead)
+            if not led:
+                self._record_follower(resp, started)
+        else:
+            resp = await fetch()
+        return self._handle_response(resp)
+
+    async def _fetch_async(
+        self,
+        session: niquests.AsyncSession,
+        kwargs: Dict[str, Any],
+        cache_key: Optional[str],
+        entry: Optional[CacheEntry],
+    ) -> niquests.Response:
+        """Replay or send, then record and cache the response"""
+        resp = self._replay(kwargs)
+        if resp is None:
+            resp = await self._send_async(session, kwargs)
+            self._record(kwargs, resp)
+        if cache_key is not None:
+            resp = self.cache.update(cache_key, resp, entry)
+        return resp
+
+    async def _send_async(
+        self, session: niquests.AsyncSession, kwargs: Dict[str, Any]
+    ) -> niquests.Response:
+        """Send with retries, recording timing of every attempt"""
+        breaker = self._breaker()
+        attempt = 0
+        while True:
+            self._check_circuit(breaker)
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.bucket(self.url).acquire_async()
+                started = time.perf_counter()
+                resp = await session.request(**kwargs)
+            except niquests.RequestException as exc:
+                self._circuit_feedback(breaker, None)
+                self._record_failure(kwargs, exc, started, attempt)
+                delay = self._retry_delay(attempt, error=exc)
+                if delay is None:
+                    raise APIError(-1, str(exc)) from exc
+            except BaseException:  # including task cancellation
+                self._circuit_release(breaker)
+                raise
+            else:
+                self._circuit_feedback(breaker, resp)
+                self._record_timing(resp, started, attempt)
+                self._rate_feedback(resp)
+                delay = self._retry_delay(attempt, resp=resp)
+                if delay is None:
+                    return resp
+                # release the connection before waiting; streamed responses
+                # close asynchronously
+                closing = resp.close()
+                if inspect.isawaitable(closing):
+                    await closing
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _send(self, kwargs: Dict[str, Any]) -> niquests.Response:
+        raise TypeError("AsyncApiClient sends with _send_async(), not _send()")
+
+    def stream(self, *args, **kwargs):
+        """Not available on the async client, use ApiClient.stream()"""
+        raise TypeError("AsyncApiClient does not support stream(); use ApiClient")
+
+    def paginate(self, *args, **kwargs):
+        """Not available on the async client, use ApiClient.paginate()"""
+        raise TypeError("AsyncApiClient does not support paginate(); use ApiClient")
+
+    def sibling(
+        self, endpoint: Target, schema: Optional[type[BaseModel]] = None
+    ) -> "AsyncApiClient":
+        """Client for another endpoint sharing this client's session and settings"""
+        return AsyncApiClient(
+            endpoint,
+            schema=schema if schema is not None else self.schema,
+            headers=self.headers,
+            timeout=self.timeout,
+            verify_ssl=self.verify_ssl,
+            validate_response=self.validate_response,
+            session=self._get_session(),
+            retry=self.retry,
+            max_response_time=self.max_response_time,
+            enforce_response_time=self.enforce_response_time,
+            recorder=self.recorder,
+            cache=self.cache,
+            cassette=self.cassette,
+            codec=self.codec,
+            sampling=self.sampling,
+            rate_limiter=self.rate_limiter,
+            single_flight=self.single_flight,
+            circuit_breakers=self.circuit_breakers,
+            reporter=self.reporter,
+        )
+
+    async def request_many(
+        self,
+        endpoints: Iterable[EndpointItem],
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Send requests concurrently, at most `concurrency` in flight.
+        Items are Endpoint/RequestSpec or (target, schema); results keep
+        input order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        semaphore = asyncio.Semaphore(concurrency)
+        clients = []
+        for item in endpoints:
+            if isinstance(item, tuple):
+                clients.append(self.sibling(*item))
+            else:
+                clients.append(self.sibling(item))
+
+        async def run(client: AsyncApiClient) -> Any:
+            async with semaphore:
+                return await client.request()
+
+        return await asyncio.gather(
+            *(run(client) for client in clients), return_exceptions=return_exceptions
+        )
+
+    async def aclose(self) -> None:
+        """Close owned session"""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        self._get_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,365 @@
+"""
+HTTP-aware response cache for idempotent GET requests.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+from urllib.parse import urlencode
+
+import niquests
+from niquests.structures import CaseInsensitiveDict
+from framework_api.response import build_response
+
+# headers dropped from cached copies: they describe one transfer, not the resource
+_HOP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "date", "age"}
+# request headers that select a representation: always part of the cache key
+KEY_HEADERS = frozenset({"accept", "accept-language", "authorization", "cookie"})
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """'no-cache, max-age=60' -> {'no-cache': None, 'max-age': '60'}"""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+
+@dataclass
+class CacheEntry:
+    """Stored response with freshness and validators"""
+
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    stored_at: float = field(default_factory=time.time)
+    # request header values the response varies on (lower-case names)
+    vary: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def matches(self, headers: Mapping[str, str]) -> bool:
+        """True when request headers select the same variant (Vary)"""
+        lowered = {str(k).lower(): str(v) for k, v in headers.items()}
+        return all(lowered.get(name) == value for name, value in self.vary.items())
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Validators for a conditional revalidation request"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> niquests.Response:
+        return build_response(self.status_code, self.headers, self.content, self.url)
+
+    def to_json(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["content"] = base64.b64encode(self.content).decode("ascii")
+        return data
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "CacheEntry":
+        data = dict(data)
+        data["content"] = base64.b64decode(data["content"])
+        return cls(**data)
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache with TTL and byte-size cap plus optional disk tier;
+    the disk tier drops its oldest files beyond max_disk_bytes.
+
+    Freshness follows Cache-Control (no-store, no-cache, max-age) and
+    Expires; responses without them live for default_ttl. Stale entries
+    with ETag/Last-Modified are revalidated with conditional requests.
+    Entries are keyed by KEY_HEADERS too and honour the response's Vary.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+        default_ttl: float = 60.0,
+        disk_dir: Optional[str | Path] = None,
+        max_disk_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._disk_bytes = 0
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(p.stat().st_size for p in self._disk_files())
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    @staticmethod
+    def make_key(
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> str:
+        """
+        Cache key of a GET request: url, sorted query params and a digest
+        of the KEY_HEADERS sent, so credentials never share entries
+        """
+        key = url
+        if params:
+            key = f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+        selected = sorted(
+            (str(k).lower(), str(v))
+            for k, v in (headers or {}).items()
+            if str(k).lower() in KEY_HEADERS
+        )
+        if selected:
+            digest = hashlib.sha256(json.dumps(selected).encode("utf-8"))
+            key = f"{key}#{digest.hexdigest()[:16]}"
+        return key
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Entry for key (fresh or stale) from memory, then from disk"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._put(key, entry, write_disk=False)
+        return entry
+
+    def lookup(
+        self, key: str, headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[CacheEntry]:
+        """
+        get() that also counts hits and misses of fresh entries. With
+        request headers, an entry stored for another Vary variant is a miss.
+        """
+        entry = self.get(key)
+        if entry is not None and headers is not None and not entry.matches(headers):
+            entry = None
+        with self._lock:
+            if entry is not None and entry.is_fresh():
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry
+
+    def update(
+        self, key: str, resp: niquests.Response, entry: Optional[CacheEntry] = None
+    ) -> niquests.Response:
+        """
+        Store resp for key. A 304 answer to a conditional request refreshes
+        `entry` and returns its cached body as a 200 response.
+        """
+        if resp.status_code == 304 and entry is not None:
+            with self._lock:
+                self.revalidations += 1
+            refreshed = self._entry_from(resp, entry)
+            if refreshed is not None:
+                self._put(key, refreshed)
+            return entry.to_response()
+        if resp.status_code == 200:
+            new_entry = self._entry_from(resp)
+            if new_entry is not None:
+                self._put(key, new_entry)
+            else:
+                self.invalidate(key)
+        return resp
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+        path = self._disk_path(key)
+        if path is not None and path.exists():
+            size = path.stat().st_size
+            path.unlink()
+            with self._lock:
+                self._disk_bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._disk_bytes = 0
+        if self.disk_dir:
+            for path in self._disk_files():
+                path.unlink()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def _entry_from(
+        self, resp: niquests.Response, previous: Optional[CacheEntry] = None
+    ) -> Optional[CacheEntry]:
+        """
+        Entry for a 200 (or 304 + previous), None when not storable.
+        Freshness of a 304 comes from the stored headers updated with the
+        304's own, so a stored no-cache or max-age is kept.
+        """
+        merged = CaseInsensitiveDict(previous.headers if previous else {})
+        merged.update(self._storable_headers(resp))
+        directives = parse_cache_control(merged.get("Cache-Control"))
+        vary = [
+            name.strip().lower()
+            for name in merged.get("Vary", "").split(",")
+            if name.strip()
+        ]
+        if "no-store" in directives or "*" in vary:
+            return None
+        now = time.time()
+        if "no-cache" in directives:
+            ttl = 0.0
+        elif directives.get("max-age") and directives["max-age"].isdigit():
+            ttl = float(directives["max-age"])
+        elif merged.get("Expires"):
+            try:
+                ttl = parsedate_to_datetime(merged["Expires"]).timestamp() - now
+            except (TypeError, ValueError):
+                ttl = 0.0
+        else:
+            ttl = self.default_ttl
+        headers = dict(merged)
+        if previous is not None:
+            content, status_code = previous.content, previous.status_code
+        else:
+            content, status_code = resp.content or b"", resp.status_code
+        etag = merged.get("ETag")
+        last_modified = merged.get("Last-Modified")
+        if ttl <= 0 and not (etag or last_modified):
+            return None
+        if resp.request is not None:
+            varies_on = {name: resp.request.headers.get(name) for name in vary}
+        else:
+            varies_on = previous.vary if previous else {name: None for name in vary}
+        return CacheEntry(
+            url=str(resp.url or (previous.url if previous else "")),
+            status_code=status_code,
+            headers=headers,
+            content=content,
+            expires_at=now + max(ttl, 0.0),
+            etag=etag,
+            last_modified=last_modified,
+            vary=varies_on,
+        )
+
+    @staticmethod
+    def _storable_headers(resp: niquests.Response) -> Dict[str, str]:
+        return {
+            key: value
+            for key, value in resp.headers.items()
+            if key.lower() not in _HOP_HEADERS
+        }
+
+    def _put(self, key: str, entry: CacheEntry, write_disk: bool = True) -> None:
+        if entry.size > self.max_bytes:
+            # too big to keep: the older copy must not be served instead
+            self.invalidate(key)
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+        if write_disk:
+            self._write_disk(key, entry)
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.disk_dir / f"{digest}.json"
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        data = json.dumps(entry.to_json()).encode("utf-8")
+        replaced = path.stat().st_size if path.exists() else 0
+        # unique temp name: concurrent writers of one key never share it
+        with tempfile.NamedTemporaryFile(
+            dir=self.disk_dir, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(data)
+        try:
+            os.replace(tmp.name, path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+        with self._lock:
+            self._disk_bytes += len(data) - replaced
+            over = self._disk_bytes > self.max_disk_bytes
+        if over:
+            self._prune_disk()
+
+    def _disk_files(self) -> List[Path]:
+        return list(self.disk_dir.glob("*.json")) if self.disk_dir else []
+
+    def _prune_disk(self) -> None:
+        """Delete the oldest written files until the disk tier fits its cap"""
+        files = []
+        for path in self._disk_files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed by a concurrent writer
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        path = self._disk_path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return CacheEntry.from_json(json.loads(path.read_text(encoding="utf-8")))
+        except (ValueError, KeyError, TypeError):
+            return None
@@ -0,0 +1,159 @@
+"""
+Record/replay of ApiClient traffic to a JSON-lines cassette.
+"""
+
+import base64
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import niquests
+from framework_api.response import build_response
+
+MODES = ("off", "record", "append", "replay")
+
+CassetteKey = Tuple[str, str, str]
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when no recorded response matches a request"""
+
+
+def body_hash(body: Any) -> str:
+    """Stable sha256 of a request body; empty string for no body"""
+    if body is None or body == {} or body == b"" or body == "":
+        return ""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, bytes):
+        body = json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(body).hexdigest()
+
+
+def full_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    if not params:
+        return url
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}{urlencode(sorted(params.items()), doseq=True)}"
+
+
+class Cassette:
+    """
+    JSON-lines cassette of request/response pairs.
+
+    record: the cassette is truncated, then every exchange is written (and
+    flushed) as one line. append: like record, but keeps existing lines.
+    replay: an index of (method, url, body hash) -> line offsets is built
+    once when the cassette is opened; lookups are O(1) and read a single
+    line. Repeated identical requests are served in recorded order and the
+    last recording repeats once they run out.
+    """
+
+    def __init__(self, path: str | Path, mode: str = "replay") -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._index: Dict[CassetteKey, List[int]] = {}
+        self._served: Dict[CassetteKey, int] = {}
+        self._file = None
+        if mode == "replay":
+            self._build_index()
+            self._file = open(self.path, "rb")
+        elif self.recording:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "wb" if mode == "record" else "ab")
+
+    @property
+    def recording(self) -> bool:
+        return self.mode in ("record", "append")
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @staticmethod
+    def make_key(
+        method: str, url: str, params: Optional[Dict] = None, body: Any = None
+    ) -> CassetteKey:
+        return method.upper(), full_url(url, params), body_hash(body)
+
+    def _build_index(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    key = (record["method"], record["url"], record["body_hash"])
+                except (ValueError, KeyError, TypeError):
+                    # foreign or truncated lines are skipped, not fatal
+                    offset += len(line)
+                    continue
+                self._index.setdefault(key, []).append(offset)
+                offset += len(line)
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self._index.values())
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        body: Any,
+        resp: niquests.Response,
+    ) -> None:
+        """Append one exchange to the cassette"""
+        key = self.make_key(method, url, params, body)
+        content = resp.content or b""
+        record = {
+            "method": key[0],
+            "url": key[1],
+            "body_hash": key[2],
+            "status_code": resp.status_code,
+            "reason": resp.reason,
+            "headers": dict(resp.headers),
+            "body_b64": base64.b64encode(content).decode("ascii"),
+        }
+        line = json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def replay(
+        self, method: str, url: str, params: Optional[Dict], body: Any
+    ) -> niquests.Response:
+        """Recorded response for the request, CassetteMiss when there is none"""
+        key = self.make_key(method, url, params, body)
+        with self._lock:
+            offsets = self._index.get(key)
+            if not offsets:
+                raise CassetteMiss(f"No recorded response for {key[0]} {key[1]}")
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+            self._file.seek(offsets[min(served, len(offsets) - 1)])
+            record = json.loads(self._file.readline())
+        return build_response(
+            record["status_code"],
+            record["headers"],
+            base64.b64decode(record["body_b64"]),
+            record["url"],
+            record.get("reason"),
+        )
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,152 @@
+"""
+Circuit breakers per endpoint: fail fast while an endpoint is down.
+"""
+
+import re
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# path segments that are ids rather than part of the route
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{32,36}|[0-9a-fA-F]{16,})$")
+_TEMPLATE_PARAM = re.compile(r"\{[^}]*\}")
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed -> open -> half-open state machine.
+
+    `failure_threshold` consecutive failures open the circuit. After
+    `recovery_timeout` seconds up to `half_open_calls` trial calls are let
+    through: a success closes the circuit, a failure opens it again.
+    A trial that never reports back (release() was not reached) is
+    written off after another recovery_timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_calls: int = 1,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = half_open_calls
+        self.state = CLOSED
+        self.failures = 0
+        self.rejected = 0
+        self.opened_at = 0.0
+        self._trials = 0
+        self._trial_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> Optional[float]:
+        """None when a call may proceed, otherwise seconds until the next trial"""
+        with self._lock:
+            if self.state == CLOSED:
+                return None
+            now = time.monotonic()
+            if self.state == OPEN:
+                remaining = self.opened_at + self.recovery_timeout - now
+                if remaining > 0:
+                    self.rejected += 1
+                    return remaining
+                self.state = HALF_OPEN
+                self._trials = 0
+            if (
+                self._trials >= self.half_open_calls
+                and now - self._trial_at >= self.recovery_timeout
+            ):
+                self._trials = 0  # trials lost without feedback
+            if self._trials < self.half_open_calls:
+                self._trials += 1
+                self._trial_at = now
+                return None
+            self.rejected += 1
+            return 0.0
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+
+    def on_failure(self) -> None:
+        with self._lock:
+            if self.state == OPEN:
+                return  # late result of a call let through before opening
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Hand back a half-open trial whose call ended without a result"""
+        with self._lock:
+            if self.state == HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+
+class CircuitBreakers:
+    """Registry of CircuitBreakers keyed by method, host and path template"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_calls: int = 1,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = half_open_calls
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, test_config) -> Optional["CircuitBreakers"]:
+        """Breakers from TestConfig, None when circuit_failure_threshold is unset"""
+        if not test_config.circuit_failure_threshold:
+            return None
+        return cls(
+            failure_threshold=test_config.circuit_failure_threshold,
+            recovery_timeout=test_config.circuit_recovery_timeout,
+            half_open_calls=test_config.circuit_half_open_calls,
+        )
+
+    @staticmethod
+    def make_key(method: str, url: str, template: Optional[str] = None) -> str:
+        """
+        'GET host/posts/{}'. Template params, or without a template id-like
+        path segments of url, are folded into '{}' so /posts/1, /posts/2
+        and /posts/{id} share a breaker.
+        """
+        parts = urlsplit(url)
+        if template is not None:
+            template = _TEMPLATE_PARAM.sub("{}", template)
+        else:
+            segments = parts.path.split("/")
+            template = "/".join(
+                "{}" if _ID_SEGMENT.match(segment) else segment for segment in segments
+            )
+        return f"{method.upper()} {parts.netloc.lower()}{template}"
+
+    def get(self, key: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    self.failure_threshold,
+                    self.recovery_timeout,
+                    self.half_open_calls,
+                )
+                self._breakers[key] = breaker
+            return breaker
+
+    def states(self) -> Dict[str, str]:
+        """Current state of every breaker"""
+        with self._lock:
+            return {key: breaker.state for key, breaker in self._breakers.items()}
@@ -2,12 +2,28 @@
 Minimal, robust API client using niquests.
 """
 
-from dataclasses import asdict, is_dataclass
-from typing import Any, Dict, Optional
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import niquests
+from niquests.structures import CaseInsensitiveDict
 from pydantic import BaseModel, ValidationError
 from api.endpoints.endpoint import Endpoint
+from framework_api.cache import CacheEntry, ResponseCache
+from framework_api.cassette import Cassette, CassetteMiss
+from framework_api.circuit import CircuitBreaker, CircuitBreakers
+from framework_api.codec import EncodedBody, JsonCodec, get_codec, to_payload
+from framework_api.pagination import Pagination, iter_pages
+from framework_api.pool import SessionPool, get_default_pool
+from framework_api.rate_limit import RateLimiter
+from framework_api.report import ReportWriter
+from framework_api.request_spec import RequestSpec
+from framework_api.retry import RetryPolicy
+from framework_api.singleflight import SingleFlight
+from framework_api.streaming import iter_json_array
+from framework_api.timing import RequestTiming, TimingRecorder
+from framework_api.validation import Sampling, validate_payload
 
 
 class ApiClient:
@@ -18,46 +34,73 @@ class ApiClient:
     @staticmethod
     def check_serialize_body(body: Any) -> Dict[str, Any]:
         """Конвертує dataclass або dict в dict для API запиту"""
-        if is_dataclass(body) and not isinstance(body, type):
-            return asdict(body)
-        return body
+        return to_payload(body)
 
     def __init__(
         self,
-        endpoint: Endpoint,
+        endpoint: Endpoint | RequestSpec,
         schema="",
         headers: Dict = None,
         timeout: int = 30,
         verify_ssl: bool = True,
         validate_response: bool = False,
+        pool: Optional[SessionPool] = None,
+        retry: Optional[RetryPolicy] = None,
+        max_response_time: Optional[float] = None,
+        enforce_response_time: bool = False,
+        recorder: Optional[TimingRecorder] = None,
+        cache: Optional[ResponseCache] = None,
+        cassette: Optional[Cassette] = None,
+        codec: JsonCodec | str = "auto",
+        sampling: Optional[Sampling] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: Optional[SingleFlight] = None,
+        circuit_breakers: Optional[CircuitBreakers] = None,
+        reporter: Optional[ReportWriter] = None,
     ) -> None:
         """
-        endpoint: Endpoint dataclass object
+        endpoint: Endpoint dataclass object with a full url, or a RequestSpec
         url = "",
         schema = "",
         headers = "",
         timeout = "",
         verify_ssl = True,
         validate_response = False,
+        pool = shared SessionPool, process-wide default when None
+        retry = RetryPolicy for transient failures, no retries when None
+        max_response_time = latency budget in seconds (TestConfig.max_response_time)
+        enforce_response_time = fail when a call exceeds max_response_time
+        recorder = shared TimingRecorder that also receives every timing
+        cache = ResponseCache for GETs, Endpoint.cache=False opts an endpoint out
+        cassette = Cassette to record traffic to or replay it from
+        codec = JsonCodec or backend name (orjson, msgspec, stdlib, auto)
+        sampling = validate only sampled items of list responses
+        rate_limiter = shared per-host RateLimiter, unlimited when None
+        single_flight = SingleFlight that coalesces concurrent identical GETs
+        circuit_breakers = shared CircuitBreakers, fail fast on a downed endpoint
+        reporter = ReportWriter that gets a record of every attempt
         """
-        self.session = niquests.Session()
-        if headers is not None:
-            self.session.headers.update(headers)
+        self.headers: Dict[str, str] = dict(headers or {})
         ua_header = {
             "Accept": "application/json",
             "User-Agent": "upc-qa-api-client/1.1",
         }
-        self.session.headers.update(ua_header)
-        endpoint: Endpoint = endpoint
-        self.url = endpoint.endpoint
-        self.method = endpoint.method
+        self.headers.update(ua_header)
         self.params: Dict[str, Any] = {}
         self.data: Dict[str, Any] = {}
+        self.template: Optional[str] = None
+        if isinstance(endpoint, RequestSpec):
+            self.url = endpoint.url
+            self.params = dict(endpoint.params)
+            self.template = endpoint.template
+        else:
+            self.url = endpoint.endpoint
+        self.method = endpoint.method
 
         if endpoint.body:
             serialized_body = self.check_serialize_body(endpoint.body)
-            if self.method.lower() == "get":
-                self.params = serialized_body
+            if self.method.lower() == "get" and isinstance(serialized_body, dict):
+                self.params = {**serialized_body, **self.params}
             else:
                 self.data = serialized_body
 
@@ -65,56 +108,422 @@ class ApiClient:
         self.timeout = timeout
         self.verify_ssl = verify_ssl
         self.validate_response = validate_response
+        self.retry = retry
+        self.max_response_time = max_response_time
+        self.enforce_response_time = enforce_response_time
+        self.recorder = recorder
+        self.cache = cache
+        self.cassette = cassette
+        self.codec = get_codec(codec) if isinstance(codec, str) else codec
+        self.sampling = sampling
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight
+        self.circuit_breakers = circuit_breakers
+        self.reporter = reporter
+        self.endpoint_cache = getattr(endpoint, "cache", True)
+        self.pagination = getattr(endpoint, "pagination", None)
+        self.timings: List[RequestTiming] = []
+        self.pool = pool if pool is not None else get_default_pool()
+        self.session = self._acquire_session()
 
-    def request(self) -> Any:
-        """
-        Docstring for request
+    def _acquire_session(self):
+        """Borrow session for this client's host from the pool"""
+        return self.pool.acquire(self.url, self.verify_ssl, self.headers)
 
-        :param self: Description
-        :rtype: Any
-        """
-        if is_dataclass(self.data):
-            self.data = asdict(self.data)
-        try:
-            resp = self.session.request(
-                method=self.method,
-                url=self.url,
-                params=self.params,
-                json=self.data,
-                headers=self.session.headers,
-                timeout=self.timeout,
-                verify=self.verify_ssl,
-            )
-        except niquests.RequestException as exc:
-            raise APIError(-1, str(exc)) from exc
+    @contextmanager
+    def _borrowed_session(self) -> Iterator[niquests.Session]:
+        """Hold the pooled session so idle eviction cannot close it mid-use"""
+        with self.pool.borrow(self.url, self.verify_ssl, self.headers) as session:
+            self.session = session
+            yield session
 
+    def _request_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for session.request()"""
+        self.data = self.check_serialize_body(self.data)
+        headers = self.headers
+        content = None
+        if isinstance(self.data, EncodedBody):
+            content = self.data.content
+            headers = {**headers, "Content-Type": self.data.content_type}
+        elif self.data:
+            content = self.codec.dumps(self.data)
+            headers = {**headers, "Content-Type": self.codec.content_type}
+        return {
+            "method": self.method,
+            "url": self.url,
+            "params": self.params,
+            "data": content,
+            "headers": headers,
+            "timeout": self.timeout,
+            "verify": self.verify_ssl,
+        }
+
+    def _handle_response(
+        self, resp: niquests.Response, from_cache: bool = False
+    ) -> Any:
+        """
+        Decode response body, check status and validate schema. A fresh
+        cache hit made no request, so the response time budget is skipped.
+        """
         content_type = resp.headers.get("Content-Type", "")
         body = None
 
-        if resp.text:
+        if resp.content:
             if "application/json" in str(content_type):
                 try:
-                    body = resp.json()
+                    # decode from raw bytes, no intermediate resp.text
+                    body = self.codec.loads(resp.content)
                 except ValueError:
                     body = resp.text
             else:
                 body = resp.text or None
 
         if not resp.ok and self.validate_response:
-            message = (
-                body.get("error") if isinstance(body, dict) else (body or resp.reason)
+            raise APIError(
+                resp.status_code, self._error_message(resp, body), response=resp
             )
-            raise APIError(resp.status_code, message, response=resp)
-        elif self.validate_response:
-            self.validate(body, self.schema)
-        
+        elif self.validate_response and self.schema:
+            self.validate(body, self.schema, self.sampling)
+
+        if self.enforce_response_time and not from_cache:
+            self.check_response_time()
+
         return body
 
     @staticmethod
-    def validate(response_json, schema: type[BaseModel]) -> BaseModel:
-        """Response pydanic validation"""
+    def _error_message(resp: niquests.Response, body: Any) -> Any:
+        return body.get("error") if isinstance(body, dict) else (body or resp.reason)
+
+    def request(self) -> Any:
+        """
+        Send request and return decoded body.
+
+        :param self: Description
+        :rtype: Any
+        """
+        # re-borrow: the pooled session may have been evicted while idle
+        with self._borrowed_session():
+            kwargs = self._request_kwargs()
+            cache_key, entry = self._cache_lookup(kwargs)
+            if entry is not None and entry.is_fresh():
+                return self._handle_response(entry.to_response(), from_cache=True)
+
+            flight_key = self._flight_key(kwargs)
+            if flight_key is not None:
+                led = []
+
+                def lead() -> niquests.Response:
+                    led.append(True)
+                    return self._fetch(kwargs, cache_key, entry)
+
+                started = time.perf_counter()
+                resp = self.single_flight.do(flight_key, lead)
+                if not led:
+                    self._record_follower(resp, started)
+            else:
+                resp = self._fetch(kwargs, cache_key, entry)
+            # decoded per caller, so coalesced callers never share a body object
+            return self._handle_response(resp)
+
+    def _fetch(
+        self,
+        kwargs: Dict[str, Any],
+        cache_key: Optional[str],
+        entry: Optional[CacheEntry],
+    ) -> niquests.Response:
+        """Replay or send, then record and cache the response"""
+        resp = self._replay(kwargs)
+        if resp is None:
+            resp = self._send(kwargs)
+            self._record(kwargs, resp)
+        if cache_key is not None:
+            resp = self.cache.update(cache_key, resp, entry)
+        resp.content  # load the body before it is handed to other callers
+        return resp
+
+    def _flight_key(self, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Single-flight key, None when this request is not coalesced"""
+        if self.single_flight is None:
+            return None
+        return self.single_flight.make_key(
+            kwargs["method"], kwargs["url"], kwargs["params"], kwargs["headers"]
+        )
+
+    def _send(self, kwargs: Dict[str, Any]) -> niquests.Response:
+        """Send with retries, recording timing of every attempt"""
+        breaker = self._breaker()
+        attempt = 0
+        while True:
+            self._check_circuit(breaker)
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.bucket(self.url).acquire()
+                started = time.perf_counter()
+                resp = self.session.request(**kwargs)
+            except niquests.RequestException as exc:
+                self._circuit_feedback(breaker, None)
+                self._record_failure(kwargs, exc, started, attempt)
+                delay = self._retry_delay(attempt, error=exc)
+                if delay is None:
+                    raise APIError(-1, str(exc)) from exc
+            except BaseException:
+                self._circuit_release(breaker)
+                raise
+            else:
+                self._circuit_feedback(breaker, resp)
+                streamed = kwargs.get("stream", False)
+                self._record_timing(resp, started, attempt, streamed)
+                self._rate_feedback(resp)
+                delay = self._retry_delay(attempt, resp=resp)
+                if delay is None:
+                    return resp
+                resp.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def stream(
+        self,
+        item_schema: Optional[type[BaseModel]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[Any]:
+        """
+        Yield items of a JSON array response as the body arrives.
+
+        Each item is validated against item_schema when given. Stop
+        iterating (or close the generator) to drop the rest of the body.
+        Cache and cassette are bypassed in this mode. A non-2xx status
+        raises APIError.
+        """
+        with self._borrowed_session():
+            kwargs = self._request_kwargs()
+            kwargs["stream"] = True
+            resp = self._send(kwargs)
+            try:
+                if not resp.ok:
+                    # an error body holds no items: fail instead of yielding none
+                    body = self._handle_response(resp)
+                    raise APIError(
+                        resp.status_code, self._error_message(resp, body), response=resp
+                    )
+                for item in iter_json_array(resp.iter_content(chunk_size)):
+                    if item_schema is not None:
+                        self.validate(item, item_schema)
+                    yield item
+            finally:
+                resp.close()
+
+    def paginate(
+        self,
+        pagination: Optional[Pagination | Dict[str, Any]] = None,
+        prefetch: int = 2,
+    ) -> Iterator[Any]:
+        """
+        Yield items of a paged collection, fetching pages lazily.
+
+        pagination defaults to the endpoint's x-pagination settings.
+        Up to `prefetch` next pages are fetched in the background while
+        the current one is consumed. Each page is checked like request()
+        (status, schema); cache and cassette are bypassed.
+        """
+        config = pagination if pagination is not None else self.pagination
+        if config is None:
+            raise ValueError(f"{self.method} {self.url} has no pagination settings")
+        if not isinstance(config, Pagination):
+            config = Pagination.from_dict(config)
+        with self._borrowed_session():
+            for items in iter_pages(self._fetch_page, config, prefetch):
+                yield from items
+
+    def _fetch_page(self, page_params: Dict[str, Any]) -> Any:
+        """Decoded body of one page"""
+        kwargs = self._request_kwargs()
+        kwargs["params"] = {**kwargs["params"], **page_params}
+        return self._handle_response(self._send(kwargs))
+
+    def _replay(self, kwargs: Dict[str, Any]) -> Optional[niquests.Response]:
+        """Recorded response when replaying a cassette, None otherwise"""
+        if self.cassette is None or not self.cassette.replaying:
+            return None
         try:
-            return schema.model_validate(response_json)
+            return self.cassette.replay(
+                kwargs["method"], kwargs["url"], kwargs["params"], self._payload
+            )
+        except CassetteMiss as exc:
+            raise APIError(-1, str(exc)) from exc
+
+    def _record(self, kwargs: Dict[str, Any], resp: niquests.Response) -> None:
+        """Append exchange to the cassette when recording"""
+        if self.cassette is not None and self.cassette.recording:
+            self.cassette.record(
+                kwargs["method"], kwargs["url"], kwargs["params"], self._payload, resp
+            )
+
+    @property
+    def _payload(self) -> Any:
+        """Request body as plain data, also for pre-encoded bodies"""
+        if isinstance(self.data, EncodedBody):
+            return self.data.payload
+        return self.data
+
+    @property
+    def use_cache(self) -> bool:
+        """Cache only GETs, and only when both client and endpoint allow it"""
+        return (
+            self.cache is not None
+            and self.endpoint_cache
+            and self.method.upper() == "GET"
+        )
+
+    def _cache_lookup(
+        self, kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[CacheEntry]]:
+        """
+        Find cached entry for this request. Stale entries add conditional
+        headers to kwargs so the server can answer 304.
+        """
+        if not self.use_cache:
+            return None, None
+        headers = CaseInsensitiveDict(self.session.headers if self.session else {})
+        headers.update(kwargs["headers"])
+        cache_key = self.cache.make_key(self.url, self.params, headers)
+        entry = self.cache.lookup(cache_key, headers)
+        if entry is not None and not entry.is_fresh():
+            kwargs["headers"] = {**kwargs["headers"], **entry.conditional_headers()}
+        return cache_key, entry
+
+    @property
+    def last_timing(self) -> Optional[RequestTiming]:
+        """Timing of the latest attempt"""
+        return self.timings[-1] if self.timings else None
+
+    def _record_timing(
+        self,
+        resp: niquests.Response,
+        started: float,
+        attempt: int,
+        streamed: bool = False,
+    ) -> RequestTiming:
+        """Store latency breakdown of one attempt on client, recorder and report"""
+        total = time.perf_counter() - started
+        timing = RequestTiming.from_response(
+            self.method, resp, total, attempt, streamed
+        )
+        self.timings.append(timing)
+        if self.recorder is not None:
+            self.recorder.add(timing)
+        if self.reporter is not None:
+            self.reporter.record_request(timing, resp, streamed)
+        return timing
+
+    def _record_follower(self, resp: niquests.Response, started: float) -> None:
+        """
+        Timing of a coalesced caller: its own wait for the shared response,
+        so the response time budget applies to it too. Kept on the client
+        only; the upstream call is recorded once, by the leader.
+        """
+        total = time.perf_counter() - started
+        self.timings.append(RequestTiming.from_response(self.method, resp, total))
+
+    def _record_failure(
+        self,
+        kwargs: Dict[str, Any],
+        exc: BaseException,
+        started: float,
+        attempt: int,
+    ) -> RequestTiming:
+        """Store an attempt that got no response on client, recorder and report"""
+        timing = RequestTiming.from_error(
+            self.method, kwargs["url"], exc, time.perf_counter() - started, attempt
+        )
+        self.timings.append(timing)
+        if self.recorder is not None:
+            self.recorder.add(timing)
+        if self.reporter is not None:
+            self.reporter.record_failure(timing, exc)
+        return timing
+
+    def check_response_time(self) -> None:
+        """Assert latest call fits into max_response_time"""
+        timing = self.last_timing
+        if timing is None or self.max_response_time is None:
+            return
+        if timing.total > self.max_response_time:
+            raise AssertionError(
+                f"{timing.key} took {timing.total:.3f}s, "
+                f"budget is {self.max_response_time:.3f}s"
+            )
+
+    def _rate_feedback(self, resp: niquests.Response) -> None:
+        """Let the host's bucket adapt: back off on 429, ramp up otherwise"""
+        if self.rate_limiter is None:
+            return
+        bucket = self.rate_limiter.bucket(self.url)
+        if resp.status_code == 429:
+            retry_after = resp.headers.get("Retry-After")
+            bucket.on_throttle(RetryPolicy.parse_retry_after(retry_after))
+        else:
+            bucket.on_success()
+
+    def _breaker(self) -> Optional[CircuitBreaker]:
+        """Breaker of this client's method and path template"""
+        if self.circuit_breakers is None:
+            return None
+        key = CircuitBreakers.make_key(self.method, self.url, self.template)
+        return self.circuit_breakers.get(key)
+
+    def _check_circuit(self, breaker: Optional[CircuitBreaker]) -> None:
+        """Fail fast instead of sending when the circuit is open"""
+        if breaker is None:
+            return
+        retry_in = breaker.allow()
+        if retry_in is not None:
+            raise CircuitOpenError(
+                f"circuit open for {self.method} {self.url}", retry_in
+            )
+
+    @staticmethod
+    def _circuit_feedback(
+        breaker: Optional[CircuitBreaker], resp: Optional[niquests.Response]
+    ) -> None:
+        """Connection errors and 5xx count as failures, anything else as success"""
+        if breaker is None:
+            return
+        if resp is None or resp.status_code >= 500:
+            breaker.on_failure()
+        else:
+            breaker.on_success()
+
+    @staticmethod
+    def _circuit_release(breaker: Optional[CircuitBreaker]) -> None:
+        """The call was interrupted before a result: no success, no failure"""
+        if breaker is not None:
+            breaker.release()
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        resp: Optional[niquests.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """Backoff before the next attempt, None when it should not be retried"""
+        if self.retry is None:
+            return None
+        if error is not None:
+            return self.retry.delay_for_error(self.method, attempt, error)
+        return self.retry.delay_for_response(self.method, attempt, resp)
+
+    @staticmethod
+    def validate(
+        response_json, schema: Any, sampling: Optional[Sampling] = None
+    ) -> Any:
+        """
+        Response pydanic validation with cached compiled validators.
+        schema: BaseModel, list[BaseModel] or any type TypeAdapter accepts;
+        a list payload with a model schema is validated item-wise,
+        `sampling` limits that to every Nth item or a random subset.
+        """
+        try:
+            return validate_payload(response_json, schema, sampling)
         except ValidationError as e:
             raise AssertionError(f"Schema validation failed:\n{e}") from e
 
@@ -132,3 +541,11 @@ class APIError(Exception):
         self.status_code = status_code
         self.message = message
         self.response = response
+
+
+class CircuitOpenError(APIError):
+    """Raised without sending when the endpoint's circuit breaker is open."""
+
+    def __init__(self, message: str, retry_in: float):
+        super().__init__(-1, message)
+        self.retry_in = retry_in
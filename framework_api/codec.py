@@ -0,0 +1,131 @@
+"""
+Pluggable JSON codecs for request and response bodies.
+
+orjson and msgspec are optional; `get_codec("auto")` picks the fastest
+installed backend and falls back to the standard library.
+"""
+
+import json
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+class JsonCodec:
+    """Standard library codec; base class for the faster backends"""
+
+    name = "stdlib"
+    content_type = "application/json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode straight from bytes; raises ValueError on invalid JSON"""
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+CODECS: Dict[str, Callable[[], JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "stdlib": JsonCodec,
+}
+_AUTO_ORDER = ("orjson", "msgspec", "stdlib")
+_instances: Dict[str, JsonCodec] = {}
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """
+    Codec by name: orjson, msgspec, stdlib or auto.
+    auto tries backends in that order and skips the ones not installed.
+    """
+    if name in _instances:
+        return _instances[name]
+    if name == "auto":
+        for candidate in _AUTO_ORDER:
+            try:
+                codec = get_codec(candidate)
+            except ImportError:
+                continue
+            _instances["auto"] = codec
+            return codec
+    if name not in CODECS:
+        raise ValueError(f"Unsupported codec: {name}")
+    codec = CODECS[name]()
+    _instances[name] = codec
+    return codec
+
+
+@dataclass(frozen=True)
+class EncodedBody:
+    """
+    Request body encoded once, sent as-is by every request that uses it.
+    payload keeps the plain data for cassette matching.
+    """
+
+    payload: Any
+    content: bytes
+    content_type: str = "application/json"
+
+
+def to_payload(body: Any, omit_none: bool = True) -> Any:
+    """
+    Plain request payload of a body: generated Body dataclasses use their
+    to_dict(), other dataclass instances fall back to asdict(). A Body
+    class (the endpoint's schema, not a value) means no body yet;
+    an EncodedBody is returned as is.
+    """
+    if isinstance(body, type):
+        return {}
+    if isinstance(body, EncodedBody):
+        return body
+    to_dict = getattr(body, "to_dict", None)
+    if to_dict is not None and is_dataclass(body):
+        return to_dict(omit_none=omit_none)
+    if is_dataclass(body):
+        return asdict(body)
+    return body
+
+
+def encode_body(
+    body: Any, codec: Optional[JsonCodec | str] = None, omit_none: bool = True
+) -> EncodedBody:
+    """Serialize and encode body once, for requests sending it repeatedly"""
+    codec = get_codec(codec or "auto") if not isinstance(codec, JsonCodec) else codec
+    payload = to_payload(body, omit_none)
+    return EncodedBody(payload, codec.dumps(payload), codec.content_type)
@@ -4,14 +4,15 @@ Config for API Testing Framework
 
 import os
 import json
-import yaml
+import threading
 
-from dotenv import load_dotenv
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 from pydantic import BaseModel, Field, ConfigDict
 from pathlib import Path
 
-load_dotenv()
+# path of a JSON snapshot written by ConfigManager.write_snapshot()
+SNAPSHOT_ENV = "API_CONFIG_SNAPSHOT"
 
 
 class APIConfig(BaseModel):
@@ -21,6 +22,14 @@ class APIConfig(BaseModel):
     timeout: int = Field(default=30, ge=1)
     verify_ssl: bool = True
     headers: Dict[str, str] = Field(default_factory=dict)
+    pool_connections: int = Field(default=10, ge=1)
+    pool_maxsize: int = Field(default=10, ge=1)
+    pool_idle_timeout: Optional[float] = Field(default=300.0, gt=0)
+    dns_cache_ttl: Optional[float] = Field(default=300.0, ge=0)
+    warmup_connections: int = Field(default=0, ge=0)
+    rate_limit: Optional[float] = Field(default=None, gt=0)
+    rate_burst: int = Field(default=10, ge=1)
+    rate_limit_min: float = Field(default=1.0, gt=0)
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -29,6 +38,14 @@ class APIConfig(BaseModel):
                 "timeout": 30,
                 "verify_ssl": True,
                 "headers": {"Content-Type": "application/json"},
+                "pool_connections": 10,
+                "pool_maxsize": 10,
+                "pool_idle_timeout": 300.0,
+                "dns_cache_ttl": 300.0,
+                "warmup_connections": 4,
+                "rate_limit": 50.0,
+                "rate_burst": 10,
+                "rate_limit_min": 1.0,
             }
         }
     )
@@ -38,8 +55,14 @@ class TestConfig(BaseModel):
     """Test configuration"""
 
     max_response_time: float = Field(default=5.0, gt=0)
+    enforce_response_time: bool = False
     retry_count: int = Field(default=0, ge=0)
     retry_delay: float = Field(default=1.0, ge=0)
+    retry_max_delay: float = Field(default=30.0, ge=0)
+    retry_budget: Optional[int] = Field(default=50, ge=0)
+    circuit_failure_threshold: Optional[int] = Field(default=5, ge=1)
+    circuit_recovery_timeout: float = Field(default=30.0, ge=0)
+    circuit_half_open_calls: int = Field(default=1, ge=1)
     log_level: str = Field(
         default="INFO", pattern="^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$"
     )
@@ -53,6 +76,7 @@ class ReportConfig(BaseModel):
     include_timestamps: bool = True
     include_request_details: bool = True
     include_response_body: bool = False
+    max_body_bytes: int = Field(default=1024, ge=0)
 
 
 class EnvironmentConfig(BaseModel):
@@ -69,6 +93,7 @@ class ConfigManager:
     """Configuration manager"""
 
     def __init__(self, config_path: Optional[str] = None):
+        load_env()
         self.config_path = config_path
         self.config: Optional[EnvironmentConfig] = None
 
@@ -76,25 +101,47 @@ class ConfigManager:
             self.load_config(config_path)
 
     def load_config(self, path: str) -> EnvironmentConfig:
-        """Loads configuration from file"""
+        """
+        Loads configuration from file. Parsed configs are cached per process
+        by path, mtime and size, so an edited file is always read again.
+        """
         config_file = Path(path)
 
-        if not config_file.exists():
-            raise FileNotFoundError(f"Config file not found: {path}")
-
-        # Detect file format
-        if config_file.suffix == ".json":
-            with open(config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        elif config_file.suffix in [".yaml", ".yml"]:
-            with open(config_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-        else:
-            raise ValueError(f"Unsupported config format: {config_file.suffix}")
-
-        self.config = EnvironmentConfig(**data)
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {path}") from None
+        key = (str(config_file.resolve()), stat.st_mtime_ns, stat.st_size)
+
+        config = _cached_config(key)
+        if config is None:
+            config = _snapshot_config(key) or _parse_config(config_file)
+            _store_config(key, config)
+        # callers may mutate their config, the cached one stays pristine
+        self.config_path = path
+        self.config = config.model_copy(deep=True)
         return self.config
 
+    def write_snapshot(self, path: str) -> Path:
+        """
+        Save the validated config as JSON tied to the source file's mtime.
+        Processes started with SNAPSHOT_ENV pointing to it (e.g. pytest-xdist
+        workers) load that instead of parsing YAML.
+        """
+        if not self.config or not self.config_path:
+            raise ValueError("Config not loaded")
+        stat = Path(self.config_path).stat()
+        snapshot = {
+            "source": str(Path(self.config_path).resolve()),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "config": self.config.model_dump(mode="json"),
+        }
+        snapshot_file = Path(path)
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        snapshot_file.write_text(json.dumps(snapshot), encoding="utf-8")
+        return snapshot_file
+
     def save_config(self, path: str, config: EnvironmentConfig):
         """Saves configuration to file"""
         config_file = Path(path)
@@ -108,6 +155,8 @@ class ConfigManager:
             with open(config_file, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
         elif config_file.suffix in [".yaml", ".yml"]:
+            import yaml
+
             with open(config_file, "w", encoding="utf-8") as f:
                 yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
         else:
@@ -138,7 +187,73 @@ class ConfigManager:
         return self.config.variables.get(key, default)
 
 
+@lru_cache(maxsize=None)
+def load_env() -> None:
+    """Load .env into os.environ once, on first use of the configuration"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+ConfigKey = Tuple[str, int, int]
+_config_cache: Dict[str, Tuple[ConfigKey, EnvironmentConfig]] = {}
+_config_lock = threading.Lock()
+
+
+def _cached_config(key: ConfigKey) -> Optional[EnvironmentConfig]:
+    with _config_lock:
+        cached = _config_cache.get(key[0])
+    if cached is None or cached[0] != key:
+        return None
+    return cached[1]
+
+
+def _store_config(key: ConfigKey, config: EnvironmentConfig) -> None:
+    with _config_lock:
+        _config_cache[key[0]] = (key, config)
+
+
+def clear_config_cache() -> None:
+    """Forget parsed configs, the next load reads files again"""
+    with _config_lock:
+        _config_cache.clear()
+
+
+def _parse_config(config_file: Path) -> EnvironmentConfig:
+    """Read and validate a JSON or YAML config file"""
+    # Detect file format
+    if config_file.suffix == ".json":
+        with open(config_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    elif config_file.suffix in [".yaml", ".yml"]:
+        import yaml
+
+        # libyaml parser when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(config_file, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=loader)
+    else:
+        raise ValueError(f"Unsupported config format: {config_file.suffix}")
+
+    return EnvironmentConfig(**data)
+
+
+def _snapshot_config(key: ConfigKey) -> Optional[EnvironmentConfig]:
+    """Config from the SNAPSHOT_ENV snapshot if it matches this file version"""
+    snapshot_path = os.getenv(SNAPSHOT_ENV)
+    if not snapshot_path:
+        return None
+    try:
+        snapshot = json.loads(Path(snapshot_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (snapshot.get("source"), snapshot.get("mtime_ns"), snapshot.get("size")) != key:
+        return None
+    return EnvironmentConfig.model_validate(snapshot["config"])
+
+
 def work_config(name: str):
+    load_env()
     return APIConfig(
         base_portal=os.getenv(f"{name}", "127.0.0.1:8000"),
         timeout=10,
@@ -0,0 +1,78 @@
+"""
+Per-run DNS cache feeding niquests sessions an in-memory resolver.
+"""
+
+import ipaddress
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class DnsCache:
+    """
+    Resolves each host once per `ttl` seconds. Sessions built by SessionPool
+    get the cached addresses as an in-memory resolver (with the system
+    resolver as fallback), so no request of the run waits on DNS again.
+    """
+
+    def __init__(self, ttl: Optional[float] = 300.0) -> None:
+        """ttl: seconds to keep an answer, forever when None"""
+        self.ttl = ttl
+        self.lookups = 0
+        self.hits = 0
+        self._entries: Dict[str, Tuple[List[str], float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, api_config) -> Optional["DnsCache"]:
+        """Cache from APIConfig, None when dns_cache_ttl is 0"""
+        if api_config.dns_cache_ttl == 0:
+            return None
+        return cls(ttl=api_config.dns_cache_ttl)
+
+    def resolve(self, host: str, port: int = 443) -> List[str]:
+        """IP addresses of host (cached), [] when it does not resolve"""
+        host = host.lower()
+        if _is_ip(host):
+            return [host]
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(host)
+            if cached is not None and (self.ttl is None or cached[1] > now):
+                self.hits += 1
+                return list(cached[0])
+        try:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            return []
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self.lookups += 1
+            expires = now + self.ttl if self.ttl is not None else float("inf")
+            self._entries[host] = (addresses, expires)
+        return list(addresses)
+
+    def resolver_for(self, host: str, port: int = 443) -> Optional[List[str]]:
+        """niquests `resolver` argument pinning host to its cached addresses"""
+        if _is_ip(host):
+            return None
+        addresses = self.resolve(host, port)
+        if not addresses:
+            return None
+        records = ",".join(
+            f"{host}:[{ip}]" if ":" in ip else f"{host}:{ip}" for ip in addresses
+        )
+        return [f"in-memory://default/?hosts={records}", "system://"]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+    except ValueError:
+        return False
+    return True
@@ -0,0 +1,111 @@
+"""
+HDR-style latency histogram: log-linear buckets with bounded relative error.
+"""
+
+from typing import Dict, Iterable, Optional
+
+# 11 bits of mantissa keep the relative error of a bucket below 0.1 %
+_PRECISION_BITS = 11
+_MANTISSA = 1 << _PRECISION_BITS
+
+
+class LatencyHistogram:
+    """
+    Records latencies as integer microseconds in log-linear buckets.
+    Memory depends on the value range, not on the number of samples, and
+    histograms from different threads or processes merge exactly.
+    """
+
+    PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us: Optional[int] = None
+
+    @staticmethod
+    def _index(value_us: int) -> int:
+        shift = max(value_us.bit_length() - _PRECISION_BITS, 0)
+        return (shift << _PRECISION_BITS) + (value_us >> shift)
+
+    @staticmethod
+    def _value(index: int) -> int:
+        """Midpoint of the bucket, in microseconds"""
+        shift, mantissa = divmod(index, _MANTISSA)
+        return (mantissa << shift) + ((1 << shift) >> 1)
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        value_us = max(int(round(seconds * 1_000_000)), 0)
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total_us += value_us * count
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = value_us if self.max_us is None else max(self.max_us, value_us)
+
+    def record_many(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.record(value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add other's samples into this histogram (exact)"""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        for attr, pick in (("min_us", min), ("max_us", max)):
+            mine, theirs = getattr(self, attr), getattr(other, attr)
+            if theirs is not None:
+                setattr(self, attr, theirs if mine is None else pick(mine, theirs))
+        return self
+
+    def percentile(self, percent: float) -> float:
+        """Value in seconds at or below which `percent` of samples fall"""
+        if not self.count:
+            return 0.0
+        threshold = max(int(self.count * percent / 100.0 + 0.5), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= threshold:
+                value = min(max(self._value(index), self.min_us), self.max_us)
+                return value / 1_000_000
+        return self.max_us / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1_000_000 if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        """count, min, mean, max and p50/p90/p99/p99.9 in seconds"""
+        result = {
+            "count": self.count,
+            "min": (self.min_us or 0) / 1_000_000,
+            "mean": self.mean,
+            "max": (self.max_us or 0) / 1_000_000,
+        }
+        for percent in self.PERCENTILES:
+            result[f"p{percent:g}"] = self.percentile(percent)
+        return result
+
+    def to_dict(self) -> Dict:
+        """Plain-data form for pickling/JSON between processes"""
+        return {
+            "counts": {str(k): v for k, v in self.counts.items()},
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = {int(k): v for k, v in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total_us = data["total_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
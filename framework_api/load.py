@@ -0,0 +1,397 @@
+"""
+Open-loop load generation with ApiClient and the generated Endpoint classes.
+
+Requests are started on a fixed schedule (rate per second) regardless of
+how fast earlier ones complete. Latency is measured from the *intended*
+start time, so time spent waiting for a free worker is counted and
+coordinated omission does not hide server stalls.
+"""
+
+import argparse
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from api.endpoints.endpoint import Endpoint
+from framework_api.client import APIError, ApiClient, CircuitOpenError
+from framework_api.histogram import LatencyHistogram
+from framework_api.pool import SessionPool
+from framework_api.request_spec import RequestSpec
+
+Target = Union[Endpoint, RequestSpec]
+ClientFactory = Callable[[Target], ApiClient]
+
+
+@dataclass
+class LoadProfile:
+    """
+    What to drive and how hard.
+    targets: RequestSpecs (or Endpoints with full URLs), picked
+    round-robin by weight
+    rate: requests started per second
+    duration: seconds to keep starting requests
+    requests: number of requests to start, round(rate * duration) when None
+    """
+
+    targets: Sequence[Target]
+    rate: float
+    duration: float
+    weights: Optional[Sequence[int]] = None
+    max_workers: int = 64
+    requests: Optional[int] = None
+
+    @property
+    def total(self) -> int:
+        """Requests this profile starts"""
+        if self.requests is not None:
+            return self.requests
+        # round: 0.57 * 100 is 56.99999999999999 in floating point
+        return round(self.rate * self.duration)
+
+    def schedule(self) -> List[Target]:
+        """Endpoint order for one weighted round-robin cycle"""
+        weights = self.weights or [1] * len(self.targets)
+        return [t for t, w in zip(self.targets, weights) for _ in range(w)]
+
+
+@dataclass
+class LoadResult:
+    """Latency histograms and counters of one run"""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    service_time: LatencyHistogram = field(default_factory=LatencyHistogram)
+    sent: int = 0
+    errors: int = 0
+    errors_by_status: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.sent if self.sent else 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+    def merge(self, other: "LoadResult") -> "LoadResult":
+        """Exact merge of another run (another thread or process)"""
+        self.latency.merge(other.latency)
+        self.service_time.merge(other.service_time)
+        self.sent += other.sent
+        self.errors += other.errors
+        for status, count in other.errors_by_status.items():
+            self.errors_by_status[status] = self.errors_by_status.get(status, 0) + count
+        self.elapsed = max(self.elapsed, other.elapsed)
+        return self
+
+    def report(self) -> Dict[str, Any]:
+        """Percentiles (seconds), throughput and error rate"""
+        return {
+            "sent": self.sent,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "errors_by_status": dict(self.errors_by_status),
+            "throughput": self.throughput,
+            "latency": self.latency.summary(),
+            "service_time": self.service_time.summary(),
+        }
+
+    def format(self) -> str:
+        latency = self.latency.summary()
+        percentiles = "  ".join(
+            f"p{p:g}={latency[f'p{p:g}'] * 1000:.2f}ms"
+            for p in LatencyHistogram.PERCENTILES
+        )
+        return (
+            f"sent={self.sent} rps={self.throughput:.1f} "
+            f"errors={self.errors} ({self.error_rate:.2%})  {percentiles}"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency": self.latency.to_dict(),
+            "service_time": self.service_time.to_dict(),
+            "sent": self.sent,
+            "errors": self.errors,
+            "errors_by_status": dict(self.errors_by_status),
+            "elapsed": self.elapsed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadResult":
+        return cls(
+            latency=LatencyHistogram.from_dict(data["latency"]),
+            service_time=LatencyHistogram.from_dict(data["service_time"]),
+            sent=data["sent"],
+            errors=data["errors"],
+            errors_by_status=dict(data["errors_by_status"]),
+            elapsed=data["elapsed"],
+        )
+
+
+def default_client_factory(pool: Optional[SessionPool] = None) -> ClientFactory:
+    """Factory of validating clients sharing one session pool"""
+
+    def factory(endpoint: Target) -> ApiClient:
+        return ApiClient(endpoint, validate_response=True, pool=pool)
+
+    return factory
+
+
+def run_load(
+    profile: LoadProfile,
+    client_factory: Optional[ClientFactory] = None,
+    on_progress: Optional[Callable[[LoadResult], None]] = None,
+    progress_interval: float = 1.0,
+) -> LoadResult:
+    """
+    Drive profile with an open-loop scheduler and return the result.
+    on_progress receives the running result every progress_interval seconds.
+    """
+    if profile.rate <= 0:
+        raise ValueError("rate must be > 0")
+    own_pool = None
+    if client_factory is None:
+        own_pool = SessionPool(pool_maxsize=profile.max_workers)
+        client_factory = default_client_factory(own_pool)
+    result = LoadResult()
+    lock = threading.Lock()
+    targets = itertools.cycle(profile.schedule())
+    interval = 1.0 / profile.rate
+    total = profile.total
+
+    def fire(endpoint: Target, intended: float) -> None:
+        started = time.perf_counter()
+        status = None
+        try:
+            client_factory(endpoint).request()
+        except CircuitOpenError:
+            status = "circuit_open"
+        except APIError as exc:
+            status = str(exc.status_code)
+        except AssertionError:
+            status = "validation"
+        except Exception as exc:  # every scheduled request must be counted
+            status = type(exc).__name__
+        finished = time.perf_counter()
+        with lock:
+            result.latency.record(finished - intended)
+            result.service_time.record(finished - started)
+            result.sent += 1
+            if status is not None:
+                result.errors += 1
+                result.errors_by_status[status] = (
+                    result.errors_by_status.get(status, 0) + 1
+                )
+
+    begin = time.perf_counter()
+    next_progress = begin + progress_interval
+    with ThreadPoolExecutor(max_workers=profile.max_workers) as executor:
+        for n in range(total):
+            intended = begin + n * interval
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(fire, next(targets), intended)
+            if on_progress is not None and time.perf_counter() >= next_progress:
+                next_progress += progress_interval
+                with lock:
+                    result.elapsed = time.perf_counter() - begin
+                    on_progress(result)
+    result.elapsed = time.perf_counter() - begin
+    if own_pool is not None:
+        own_pool.close()
+    return result
+
+
+def shard_profile(profile: LoadProfile, shards: int) -> List[LoadProfile]:
+    """
+    Split profile into `shards` profiles of rate / shards each. Shard i
+    takes every shards-th slot of the weighted schedule starting at i,
+    so together (with start offsets of i / rate) they reproduce the
+    original request sequence and mix. Request n of the original goes to
+    shard n % shards, so the first total % shards shards start one
+    request more and the shard counts add up to profile.total.
+    """
+    schedule = profile.schedule()
+    workers = -(-profile.max_workers // shards)
+    total = profile.total
+    return [
+        LoadProfile(
+            targets=[
+                schedule[(i + k * shards) % len(schedule)]
+                for k in range(len(schedule))
+            ],
+            rate=profile.rate / shards,
+            duration=profile.duration,
+            max_workers=workers,
+            requests=total // shards + (i < total % shards),
+        )
+        for i in range(shards)
+    ]
+
+
+def _load_worker(
+    index: int,
+    profile: LoadProfile,
+    offset: float,
+    progress_interval: float,
+    results: Any,
+    go: Any,
+    start: Any,
+) -> None:
+    """Process entry point: run one shard, report snapshots and the result"""
+    try:
+        results.put(("ready", index, None))
+        go.wait()
+        delay = start.value + offset - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        result = run_load(
+            profile,
+            on_progress=lambda r: results.put(("progress", index, r.to_dict())),
+            progress_interval=progress_interval,
+        )
+        results.put(("done", index, result.to_dict()))
+    except BaseException:
+        results.put(("error", index, traceback.format_exc()))
+
+
+def run_load_multiprocess(
+    profile: LoadProfile,
+    processes: Optional[int] = None,
+    on_progress: Optional[Callable[[LoadResult], None]] = None,
+    progress_interval: float = 1.0,
+    mp_context: Optional[str] = None,
+) -> LoadResult:
+    """
+    run_load() sharded over worker processes, each with its own session
+    pool. Worker histograms and counters are merged exactly; on_progress
+    receives the merged running result every progress_interval seconds.
+    """
+    if profile.rate <= 0:
+        raise ValueError("rate must be > 0")
+    processes = processes or os.cpu_count() or 1
+    context = multiprocessing.get_context(mp_context)
+    results = context.Queue()
+    go = context.Event()
+    start = context.Value("d", 0.0)
+    workers = [
+        context.Process(
+            target=_load_worker,
+            args=(i, shard, i / profile.rate, progress_interval, results, go, start),
+            name=f"load-{i}",
+            daemon=True,
+        )
+        for i, shard in enumerate(shard_profile(profile, processes))
+    ]
+    for worker in workers:
+        worker.start()
+
+    ready = 0
+    latest: Dict[int, Dict[str, Any]] = {}
+    finished: Dict[int, Dict[str, Any]] = {}
+    next_progress = time.monotonic() + progress_interval
+    try:
+        while len(finished) < len(workers):
+            try:
+                kind, index, payload = results.get(timeout=progress_interval)
+            except queue.Empty:
+                dead = [w.name for w in workers if w.exitcode not in (None, 0)]
+                if dead:
+                    raise RuntimeError(f"load workers died: {dead}")
+                continue
+            if kind == "error":
+                raise RuntimeError(f"load worker {index} failed:\n{payload}")
+            if kind == "ready":
+                ready += 1
+                if ready == len(workers):
+                    # all shards imported and waiting: start on one shared clock
+                    start.value = time.time() + 0.05
+                    go.set()
+                continue
+            latest[index] = payload
+            if kind == "done":
+                finished[index] = payload
+            if on_progress is not None and time.monotonic() >= next_progress:
+                next_progress += progress_interval
+                on_progress(_merge_results(latest.values()))
+    finally:
+        go.set()
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        results.close()
+    return _merge_results(finished.values())
+
+
+def _merge_results(snapshots: Iterable[Dict[str, Any]]) -> LoadResult:
+    merged = LoadResult()
+    for snapshot in snapshots:
+        merged.merge(LoadResult.from_dict(snapshot))
+    return merged
+
+
+def targets_from_names(
+    endpoints: Any, host: str, specs: Sequence[str]
+) -> List[RequestSpec]:
+    """
+    Endpoints from generated-class property names, e.g.
+    ['posts_get', 'posts_id_get:id=1'] on an instance of Default.
+    """
+    targets = []
+    for spec in specs:
+        name, _, raw_params = spec.partition(":")
+        params = dict(p.split("=", 1) for p in raw_params.split(",") if p)
+        point = getattr(endpoints, name)
+        targets.append(RequestSpec.from_endpoint(point, host, params))
+    return targets
+
+
+def main(argv: Optional[Sequence[str]] = None) -> LoadResult:
+    from api.endpoints.json_placeholder import Default
+
+    parser = argparse.ArgumentParser(description="Open-loop API load generator")
+    parser.add_argument("--host", required=True, help="e.g. http://127.0.0.1:8000")
+    parser.add_argument(
+        "--endpoint",
+        action="append",
+        required=True,
+        help="Default property name with optional path params: posts_id_get:id=1",
+    )
+    parser.add_argument("--rate", type=float, default=100.0)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=64)
+    parser.add_argument(
+        "--processes", type=int, default=1, help="worker processes, 0 = one per CPU"
+    )
+    args = parser.parse_args(argv)
+
+    profile = LoadProfile(
+        targets=targets_from_names(Default(), args.host, args.endpoint),
+        rate=args.rate,
+        duration=args.duration,
+        max_workers=args.workers,
+    )
+    if args.processes == 1:
+        result = run_load(profile, on_progress=lambda r: print(r.format()))
+    else:
+        result = run_load_multiprocess(
+            profile,
+            processes=args.processes or None,
+            on_progress=lambda r: print(r.format()),
+        )
+    print(result.format())
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,385 @@
+"""
+Local stand-in HTTP server generated from an OpenAPI specification.
+
+Path templates become routes over in-memory stateful collections:
+`/posts` is a collection, `/posts/{id}` an item of it and
+`/posts/{id}/comments` a collection scoped to one post via `postId`.
+Request bodies are checked against the request schema and stored items
+are shaped by the response schema.
+"""
+
+import argparse
+import itertools
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import yaml
+
+_PARAM = re.compile(r"{([^}/]+)}")
+_JSON_TYPES = {
+    "integer": (int,),
+    "number": (int, float),
+    "string": (str,),
+    "boolean": (bool,),
+    "array": (list,),
+    "object": (dict,),
+}
+
+
+def resolve_ref(schema: Dict[str, Any], spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Follow local $ref chain of a schema"""
+    seen = set()
+    while isinstance(schema, dict) and "$ref" in schema:
+        ref = schema["$ref"]
+        if ref in seen or not ref.startswith("#/"):
+            return {}
+        seen.add(ref)
+        node: Any = spec
+        for part in ref[2:].split("/"):
+            node = node.get(part, {}) if isinstance(node, dict) else {}
+        schema = node
+    return schema if isinstance(schema, dict) else {}
+
+
+def check_schema(
+    value: Any, schema: Dict[str, Any], spec: Dict[str, Any], partial: bool = False
+) -> List[str]:
+    """Errors of value against a JSON schema subset (type, required, properties)"""
+    schema = resolve_ref(schema, spec)
+    expected = schema.get("type")
+    if expected in _JSON_TYPES:
+        is_bool = isinstance(value, bool)
+        if not isinstance(value, _JSON_TYPES[expected]) or (
+            is_bool and expected != "boolean"
+        ):
+            return [f"expected {expected}, got {type(value).__name__}"]
+    if expected == "array":
+        item_schema = schema.get("items") or {}
+        errors = []
+        for index, item in enumerate(value):
+            errors += [f"[{index}] {e}" for e in check_schema(item, item_schema, spec)]
+        return errors
+    if not isinstance(value, dict):
+        return []
+    errors = []
+    if not partial:
+        errors += [
+            f"{name}: required"
+            for name in schema.get("required", [])
+            if name not in value
+        ]
+    for name, prop in (schema.get("properties") or {}).items():
+        if name in value and value[name] is not None:
+            errors += [f"{name}: {e}" for e in check_schema(value[name], prop, spec)]
+    return errors
+
+
+def example_for(schema: Dict[str, Any], spec: Dict[str, Any]) -> Any:
+    """Example value from a schema: `example`, else a typed placeholder"""
+    schema = resolve_ref(schema, spec)
+    if "example" in schema:
+        return schema["example"]
+    kind = schema.get("type")
+    if kind == "object" or "properties" in schema:
+        return {
+            name: example_for(prop, spec)
+            for name, prop in (schema.get("properties") or {}).items()
+        }
+    return {
+        "integer": 0,
+        "number": 0.0,
+        "string": "",
+        "boolean": False,
+        "array": [],
+    }.get(kind)
+
+
+class Route:
+    """Compiled path template bound to a collection"""
+
+    def __init__(self, template: str, operations: Dict[str, Any]) -> None:
+        self.template = template
+        self.operations = {
+            m.upper(): op for m, op in operations.items() if not m.startswith("x-")
+        }
+        self.params = _PARAM.findall(template)
+        pattern = _PARAM.sub(r"([^/]+)", template.rstrip("/"))
+        self.regex = re.compile(f"^{pattern}/?$")
+        parts = template.strip("/").split("/")
+        # item route ends with a parameter, collection route with a name
+        self.is_item = bool(parts) and _PARAM.fullmatch(parts[-1]) is not None
+        names = [p for p in parts if not _PARAM.fullmatch(p)]
+        self.collection = names[-1] if names else ""
+        self.parent = names[-2] if len(names) > 1 else None
+
+    @property
+    def parent_key(self) -> Optional[str]:
+        """Foreign key linking nested items to the parent: posts -> postId"""
+        if self.parent is None:
+            return None
+        singular = self.parent[:-1] if self.parent.endswith("s") else self.parent
+        return f"{singular}Id"
+
+    def match(self, path: str) -> Optional[Dict[str, str]]:
+        found = self.regex.match(path)
+        if found is None:
+            return None
+        return dict(zip(self.params, found.groups()))
+
+
+class MockApi:
+    """In-memory state and request dispatch, independent of the transport"""
+
+    def __init__(self, spec: Dict[str, Any], seed: int = 10) -> None:
+        self.spec = spec
+        self.seed = seed
+        self.routes = [
+            Route(t, ops or {}) for t, ops in (spec.get("paths") or {}).items()
+        ]
+        self.schemas: Dict[str, Dict[str, Any]] = {}
+        for route in self.routes:
+            schema = self._item_schema(route)
+            if schema and route.collection not in self.schemas:
+                self.schemas[route.collection] = schema
+        self._lock = threading.Lock()
+        self.reset()
+
+    def _item_schema(self, route: Route) -> Dict[str, Any]:
+        """Item schema of a collection from its GET 200 response"""
+        op = route.operations.get("GET") or {}
+        content = ((op.get("responses") or {}).get("200") or {}).get("content") or {}
+        schema = resolve_ref(
+            (content.get("application/json") or {}).get("schema") or {}, self.spec
+        )
+        if schema.get("type") == "array":
+            schema = resolve_ref(schema.get("items") or {}, self.spec)
+        return schema
+
+    def reset(self) -> None:
+        """Drop all changes and re-seed collections from schema examples"""
+        with self._lock:
+            self.store: Dict[str, Dict[int, Dict[str, Any]]] = {}
+            self._ids: Dict[str, itertools.count] = {}
+            parents = {r.collection: r.parent_key for r in self.routes if r.parent}
+            for name, schema in self.schemas.items():
+                items = self.store.setdefault(name, {})
+                for n in range(1, self.seed + 1):
+                    item = example_for(schema, self.spec) or {}
+                    item["id"] = n
+                    if name in parents:
+                        # one seeded child per parent: comment n -> post n
+                        item[parents[name]] = n
+                    items[n] = item
+                self._ids[name] = itertools.count(self.seed + 1)
+
+    def _request_schema(self, op: Dict[str, Any]) -> Dict[str, Any]:
+        content = (op.get("requestBody") or {}).get("content") or {}
+        return (content.get("application/json") or {}).get("schema") or {}
+
+    def _shape(self, item: Dict[str, Any], collection: str) -> Dict[str, Any]:
+        """Keep only properties of the response schema"""
+        props = (self.schemas.get(collection) or {}).get("properties")
+        if not props:
+            return dict(item)
+        return {k: v for k, v in item.items() if k in props}
+
+    def handle(self, method: str, target: str, body: bytes) -> Tuple[int, Any]:
+        """Dispatch one request, returns (status, json-serializable body)"""
+        split = urlsplit(target)
+        path = split.path
+        for route in self.routes:
+            params = route.match(path)
+            if params is None:
+                continue
+            op = route.operations.get(method)
+            if op is None:
+                return 405, {"error": f"{method} not allowed on {route.template}"}
+            payload = None
+            if method in ("POST", "PUT", "PATCH"):
+                try:
+                    payload = json.loads(body or b"{}")
+                except ValueError:
+                    return 400, {"error": "invalid JSON body"}
+                if not isinstance(payload, dict):
+                    return 400, {"error": "JSON body must be an object"}
+                errors = check_schema(
+                    payload,
+                    self._request_schema(op),
+                    self.spec,
+                    partial=method == "PATCH",
+                )
+                if errors:
+                    return 400, {"error": "; ".join(errors)}
+            query = dict(parse_qsl(split.query))
+            with self._lock:
+                if route.is_item:
+                    return self._item(route, method, params, payload)
+                return self._collection(route, method, params, payload, query)
+        return 404, {"error": f"no route for {path}"}
+
+    def _collection(self, route, method, params, payload, query) -> Tuple[int, Any]:
+        items = self.store.setdefault(route.collection, {})
+        scope = {}
+        if route.parent_key and route.params:
+            scope[route.parent_key] = _coerce(params[route.params[-1]])
+        if method == "POST":
+            item = {**payload, **scope, "id": next(self._ids[route.collection])}
+            items[item["id"]] = item
+            return 201, self._shape(item, route.collection)
+        filters = {
+            **{k: _coerce(v) for k, v in query.items() if not k.startswith("_")},
+            **scope,
+        }
+        result = [
+            self._shape(item, route.collection)
+            for item in items.values()
+            if all(item.get(k) == v for k, v in filters.items())
+        ]
+        if "_page" in query or "_limit" in query:
+            # json-server paging: 1-based _page, 10 items unless _limit
+            limit = _positive_int(query.get("_limit", "10"))
+            page = _positive_int(query.get("_page", "1"))
+            if limit is None or page is None:
+                return 400, {"error": "_page and _limit must be integers >= 1"}
+            start = (page - 1) * limit
+            result = result[start : start + limit]
+        return 200, result
+
+    def _item(self, route, method, params, payload) -> Tuple[int, Any]:
+        items = self.store.setdefault(route.collection, {})
+        item_id = _coerce(params[route.params[-1]])
+        item = items.get(item_id)
+        if item is None:
+            return 404, {}
+        if method == "GET":
+            return 200, self._shape(item, route.collection)
+        if method == "DELETE":
+            del items[item_id]
+            return 200, {}
+        if method == "PUT":
+            item = {**payload, "id": item_id}
+        else:
+            item = {
+                **item,
+                **{k: v for k, v in payload.items() if v is not None},
+                "id": item_id,
+            }
+        items[item_id] = item
+        return 200, self._shape(item, route.collection)
+
+
+def _coerce(value: str) -> Any:
+    """Path/query strings to int when they look like one"""
+    return int(value) if value.lstrip("-").isdigit() else value
+
+
+def _positive_int(value: str) -> Optional[int]:
+    """int >= 1 from a query string value, None when it is not one"""
+    try:
+        number = int(value)
+    except ValueError:
+        return None
+    return number if number >= 1 else None
+
+
+class MockServer:
+    """
+    Threaded HTTP/1.1 keep-alive server around MockApi.
+    Binds an ephemeral port by default; use as a context manager.
+    """
+
+    def __init__(
+        self,
+        spec: Dict[str, Any] | str | Path,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 10,
+    ) -> None:
+        if not isinstance(spec, dict):
+            spec = yaml.safe_load(Path(spec).read_text(encoding="utf-8"))
+        self.api = MockApi(spec, seed=seed)
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_portal(self) -> str:
+        """host:port, same shape as APIConfig.base_portal"""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def _handler(self):
+        api = self.api
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body go out as separate writes; without TCP_NODELAY
+            # Nagle + delayed ACK add ~40 ms to every keep-alive response
+            disable_nagle_algorithm = True
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                # HEAD is GET without the body
+                method = "GET" if self.command == "HEAD" else self.command
+                status, body = api.handle(method, self.path, raw)
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(payload)
+
+            do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = _serve
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until stop() or KeyboardInterrupt"""
+        self._server.serve_forever(0.05)
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve OpenAPI spec as a mock API")
+    parser.add_argument("spec", nargs="?", default="api/models/json_placeholder.yaml")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--seed", type=int, default=100)
+    args = parser.parse_args()
+    server = MockServer(args.spec, args.host, args.port, args.seed)
+    print(f"Mock API on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,193 @@
+"""
+Lazy pagination over collection endpoints with background prefetch.
+
+The pagination style of an endpoint comes from the `x-pagination`
+extension of its OpenAPI operation, emitted into `Endpoint.pagination`:
+
+    x-pagination:
+      style: page          # page | cursor
+      page_param: _page
+      limit_param: _limit
+      limit: 10
+"""
+
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+PageFetcher = Callable[[Dict[str, Any]], Any]
+STYLES = ("page", "cursor")
+
+
+@dataclass(frozen=True)
+class Pagination:
+    """
+    How an endpoint pages.
+    page style: page_param/limit_param, numbered from first_page; the last
+    page is the first empty one or one shorter than limit.
+    cursor style: cursor_param is sent with the value found at next_cursor
+    in the previous body until it is missing.
+    items: dotted path of the item list in the body, the body itself when None
+    """
+
+    style: str = "page"
+    page_param: str = "page"
+    limit_param: str = "limit"
+    limit: Optional[int] = None
+    first_page: int = 1
+    cursor_param: str = "cursor"
+    next_cursor: str = "next_cursor"
+    items: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.style not in STYLES:
+            raise ValueError(f"Unsupported pagination style: {self.style}")
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Pagination":
+        """From the x-pagination mapping; unknown keys are an error"""
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown x-pagination keys: {sorted(unknown)}")
+        return cls(**data)
+
+    def base_params(self) -> Dict[str, Any]:
+        return {self.limit_param: self.limit} if self.limit else {}
+
+    def items_of(self, body: Any) -> List[Any]:
+        items = _pick(body, self.items)
+        if not isinstance(items, list):
+            raise ValueError(f"Page body has no item list at {self.items or '.'}")
+        return items
+
+    def cursor_of(self, body: Any) -> Any:
+        return _pick(body, self.next_cursor)
+
+    def is_last(self, items: List[Any]) -> bool:
+        return not items or (self.limit is not None and len(items) < self.limit)
+
+
+def _pick(body: Any, path: Optional[str]) -> Any:
+    """body['a']['b'] for path 'a.b', None when missing"""
+    if not path:
+        return body
+    for key in path.split("."):
+        if not isinstance(body, dict):
+            return None
+        body = body.get(key)
+    return body
+
+
+def iter_pages(
+    fetch: PageFetcher, pagination: Pagination, prefetch: int = 2
+) -> Iterator[List[Any]]:
+    """
+    Yield item lists page by page. `fetch(params)` returns a decoded body.
+    Up to `prefetch` pages beyond the current one are fetched in the
+    background, so at most prefetch + 1 pages are held in memory.
+    """
+    if prefetch < 1:
+        if pagination.style == "page":
+            yield from _numbered_pages(fetch, pagination)
+        else:
+            yield from _cursor_pages(fetch, pagination)
+    elif pagination.style == "page":
+        yield from _prefetch_numbered(fetch, pagination, prefetch)
+    else:
+        yield from _prefetch_cursor(fetch, pagination, prefetch)
+
+
+def _numbered_pages(fetch: PageFetcher, config: Pagination) -> Iterator[List[Any]]:
+    page = config.first_page
+    while True:
+        items = config.items_of(
+            fetch({**config.base_params(), config.page_param: page})
+        )
+        if items:
+            yield items
+        if config.is_last(items):
+            return
+        page += 1
+
+
+def _prefetch_numbered(
+    fetch: PageFetcher, config: Pagination, prefetch: int
+) -> Iterator[List[Any]]:
+    """Page numbers are known upfront: keep the next pages in flight at once"""
+    executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="page")
+    pending: deque = deque()
+    page = config.first_page
+    try:
+        while True:
+            while len(pending) <= prefetch:
+                params = {**config.base_params(), config.page_param: page}
+                pending.append(executor.submit(fetch, params))
+                page += 1
+            items = config.items_of(pending.popleft().result())
+            if items:
+                yield items
+            if config.is_last(items):
+                return
+    finally:
+        # pages past the end are dropped; unstarted ones are never sent
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _cursor_pages(fetch: PageFetcher, config: Pagination) -> Iterator[List[Any]]:
+    params = config.base_params()
+    while True:
+        body = fetch(params)
+        items = config.items_of(body)
+        if items:
+            yield items
+        cursor = config.cursor_of(body)
+        if not items or cursor in (None, ""):
+            return
+        params = {**config.base_params(), config.cursor_param: cursor}
+
+
+_DONE = object()
+
+
+def _prefetch_cursor(
+    fetch: PageFetcher, config: Pagination, prefetch: int
+) -> Iterator[List[Any]]:
+    """Each cursor depends on the previous page: a producer thread reads ahead"""
+    pages: queue.Queue = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for items in _cursor_pages(fetch, config):
+                if not put(items):
+                    return
+        except BaseException as exc:  # re-raised in the consumer
+            put(exc)
+        else:
+            put(_DONE)
+
+    producer = threading.Thread(target=produce, name="cursor-page", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = pages.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
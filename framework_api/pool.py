@@ -0,0 +1,171 @@
+"""
+Process-wide pool of keep-alive niquests sessions shared by ApiClient.
+"""
+
+import atexit
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+import niquests
+from framework_api.dns import DnsCache
+
+SessionKey = Tuple[str, bool, Tuple[Tuple[str, str], ...]]
+
+
+class SessionPool:
+    """
+    Registry of niquests sessions keyed by origin, TLS settings and headers.
+
+    Clients that talk to the same host with the same settings borrow the
+    same session, so TCP/TLS connections are reused between calls.
+    Sessions held through borrow() are never closed as idle.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        idle_timeout: Optional[float] = 300.0,
+        dns_cache: Optional[DnsCache] = None,
+    ) -> None:
+        """
+        pool_connections: number of per-host connection pools in a session
+        pool_maxsize: max keep-alive connections kept per host
+        idle_timeout: seconds after which an unused session is closed
+        dns_cache: resolve each host once and pin new sessions to the answer
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self.dns_cache = dns_cache
+        self._sessions: Dict[SessionKey, niquests.Session] = {}
+        self._last_used: Dict[SessionKey, float] = {}
+        self._borrowers: Dict[SessionKey, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, api_config) -> "SessionPool":
+        """Build pool from APIConfig"""
+        return cls(
+            pool_connections=api_config.pool_connections,
+            pool_maxsize=api_config.pool_maxsize,
+            idle_timeout=api_config.pool_idle_timeout,
+            dns_cache=DnsCache.from_config(api_config),
+        )
+
+    @staticmethod
+    def make_key(
+        url: str, verify_ssl: bool = True, headers: Optional[Dict] = None
+    ) -> SessionKey:
+        """Key for session lookup: scheme://host:port, verify flag, headers"""
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}".lower()
+        frozen_headers = tuple(
+            sorted((str(k).lower(), str(v)) for k, v in (headers or {}).items())
+        )
+        return origin, bool(verify_ssl), frozen_headers
+
+    def acquire(
+        self, url: str, verify_ssl: bool = True, headers: Optional[Dict] = None
+    ) -> niquests.Session:
+        """Return shared session for url, creating it on first use"""
+        return self._acquire(url, verify_ssl, headers, borrow=False)
+
+    @contextmanager
+    def borrow(
+        self, url: str, verify_ssl: bool = True, headers: Optional[Dict] = None
+    ) -> Iterator[niquests.Session]:
+        """acquire() that keeps the session from idle eviction until exit"""
+        key = self.make_key(url, verify_ssl, headers)
+        session = self._acquire(url, verify_ssl, headers, borrow=True)
+        try:
+            yield session
+        finally:
+            with self._lock:
+                count = self._borrowers.get(key, 0) - 1
+                if count > 0:
+                    self._borrowers[key] = count
+                else:
+                    self._borrowers.pop(key, None)
+                if key in self._sessions:
+                    self._last_used[key] = time.monotonic()
+
+    def _acquire(
+        self, url: str, verify_ssl: bool, headers: Optional[Dict], borrow: bool
+    ) -> niquests.Session:
+        key = self.make_key(url, verify_ssl, headers)
+        resolver = None
+        if self.dns_cache is not None and key not in self._sessions:
+            # resolve outside the lock, other hosts need not wait on DNS
+            parts = urlsplit(url)
+            default_port = 443 if parts.scheme == "https" else 80
+            resolver = self.dns_cache.resolver_for(
+                parts.hostname or "", parts.port or default_port
+            )
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            session = self._sessions.get(key)
+            if session is None:
+                session = niquests.Session(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    resolver=resolver,
+                )
+                session.verify = verify_ssl
+                if headers:
+                    session.headers.update(headers)
+                self._sessions[key] = session
+            self._last_used[key] = now
+            if borrow:
+                self._borrowers[key] = self._borrowers.get(key, 0) + 1
+            return session
+
+    def evict_idle(self) -> int:
+        """Close sessions unused for longer than idle_timeout and not borrowed"""
+        with self._lock:
+            return self._evict_idle(time.monotonic())
+
+    def _evict_idle(self, now: float) -> int:
+        if self.idle_timeout is None:
+            return 0
+        expired = [
+            key
+            for key, last_used in self._last_used.items()
+            if now - last_used > self.idle_timeout and key not in self._borrowers
+        ]
+        for key in expired:
+            self._last_used.pop(key, None)
+            self._sessions.pop(key).close()
+        return len(expired)
+
+    def close(self) -> None:
+        """Close every pooled session (shutdown hook)"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._last_used.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, key: SessionKey) -> bool:
+        return key in self._sessions
+
+
+_default_pool: Optional[SessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> SessionPool:
+    """Process-wide pool used when ApiClient gets no explicit pool"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SessionPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
@@ -0,0 +1,142 @@
+"""
+Adaptive per-host token-bucket rate limiting for ApiClient.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with burst.
+
+    The rate adapts AIMD-style: a 429 halves it (down to min_rate) and
+    honors Retry-After by pausing the bucket, each success adds back a
+    small step until max_rate is reached again.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = 1.0,
+        increase: Optional[float] = None,
+        decrease: float = 0.5,
+    ) -> None:
+        """
+        rate: tokens per second, also the ceiling the bucket ramps back to
+        burst: bucket capacity
+        increase: rate step per success, 1% of rate by default
+        decrease: rate multiplier on throttling
+        """
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = max(int(burst), 1)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.increase = increase if increase is not None else self.max_rate / 100
+        self.decrease = decrease
+        self.tokens = float(self.burst)
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+
+    def try_acquire(self) -> float:
+        """Take a token if available; otherwise seconds to wait before retrying"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self.blocked_until:
+                return self.blocked_until - now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is taken, returns total seconds waited"""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire()
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self) -> float:
+        """acquire() for event loops"""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire()
+            if delay <= 0:
+                return waited
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Server said 429: back off, and pause for Retry-After if given"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = 0.0
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class RateLimiter:
+    """Registry of TokenBuckets keyed by host, shared between clients"""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = 1.0,
+        per_host: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """per_host: rate overrides for individual host[:port] values"""
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.per_host = dict(per_host or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, api_config) -> Optional["RateLimiter"]:
+        """Limiter from APIConfig, None when rate_limit is not set"""
+        if not api_config.rate_limit:
+            return None
+        return cls(
+            rate=api_config.rate_limit,
+            burst=api_config.rate_burst,
+            min_rate=api_config.rate_limit_min,
+        )
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(
+                    self.per_host.get(host, self.rate), self.burst, self.min_rate
+                )
+                self._buckets[host] = bucket
+            return bucket
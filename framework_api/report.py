@@ -0,0 +1,414 @@
+"""
+Streaming run report: one JSON line per request and per test, appended as
+the run goes, so memory stays flat however long the run is. HTML and JUnit
+XML are rendered afterwards by reading the stream back line by line.
+
+    python -m framework_api.report reports/report.jsonl --format html
+"""
+
+import argparse
+import html
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+from xml.sax.saxutils import quoteattr
+
+if TYPE_CHECKING:  # the render CLI needs neither niquests nor the client
+    import niquests
+
+    from framework_api.timing import RequestTiming
+
+REPORT_FILE = "report.jsonl"
+RENDERED = {"html": "report.html", "xml": "junit.xml"}
+# secrets never written to the report
+REDACTED_HEADERS = frozenset({"authorization", "cookie", "proxy-authorization"})
+# characters XML 1.0 does not allow, even escaped
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
+
+
+class ReportWriter:
+    """
+    Thread-safe JSON-lines appender. Only counters are kept in memory;
+    every record is flushed as written, so a crashed run still leaves a
+    readable report.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        include_timestamps: bool = True,
+        include_request_details: bool = True,
+        include_response_body: bool = False,
+        max_body_bytes: int = 1024,
+    ) -> None:
+        """
+        path = JSON-lines file, truncated on open
+        max_body_bytes = bodies longer than this are cut, 0 leaves them out
+        """
+        self.path = Path(path)
+        self.include_timestamps = include_timestamps
+        self.include_request_details = include_request_details
+        self.include_response_body = include_response_body
+        self.max_body_bytes = max_body_bytes
+        self.counts: Dict[str, int] = {"request": 0, "test": 0}
+        self._lock = threading.Lock()
+        self._file: Optional[IO[str]] = None
+
+    @classmethod
+    def from_config(cls, report_config) -> "ReportWriter":
+        """Writer to <output_dir>/report.jsonl from ReportConfig"""
+        return cls(
+            Path(report_config.output_dir) / REPORT_FILE,
+            include_timestamps=report_config.include_timestamps,
+            include_request_details=report_config.include_request_details,
+            include_response_body=report_config.include_response_body,
+            max_body_bytes=report_config.max_body_bytes,
+        )
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append one record"""
+        if self.include_timestamps:
+            record["ts"] = round(time.time(), 6)
+        line = json.dumps(record, default=str, ensure_ascii=False) + "\n"
+        with self._lock:
+            stream = self._open()
+            stream.write(line)
+            stream.flush()
+            self.counts[record["type"]] = self.counts.get(record["type"], 0) + 1
+
+    def record_request(
+        self,
+        timing: "RequestTiming",
+        resp: "niquests.Response",
+        streamed: bool = False,
+    ) -> None:
+        """One HTTP attempt; a streamed body is never read for the report"""
+        record = self._request_record(timing, resp.request)
+        if self.include_response_body and not streamed:
+            record.update(self._body("response_body", resp.content))
+        self.write(record)
+
+    def record_failure(self, timing: "RequestTiming", exc: BaseException) -> None:
+        """One HTTP attempt that got no response (connect error, timeout)"""
+        record = self._request_record(timing, getattr(exc, "request", None))
+        record["error"] = f"{type(exc).__name__}: {exc}"
+        self.write(record)
+
+    def _request_record(
+        self, timing: "RequestTiming", request: "niquests.PreparedRequest | None"
+    ) -> Dict[str, Any]:
+        record: Dict[str, Any] = {
+            "type": "request",
+            "method": timing.method.upper(),
+            "url": timing.url,
+            "status": timing.status_code,
+            "attempt": timing.attempt,
+            "total": timing.total,
+            "ttfb": timing.ttfb,
+            "size": timing.size,
+        }
+        if self.include_request_details and request is not None:
+            record["request_headers"] = {
+                name: "***" if name.lower() in REDACTED_HEADERS else value
+                for name, value in request.headers.items()
+            }
+            record.update(self._body("request_body", request.body))
+        return record
+
+    def record_test(
+        self,
+        nodeid: str,
+        outcome: str,
+        duration: float,
+        message: Optional[str] = None,
+    ) -> None:
+        """
+        One test result. outcome: passed, failed, error (setup/teardown
+        failure) or skipped
+        """
+        record: Dict[str, Any] = {
+            "type": "test",
+            "nodeid": nodeid,
+            "outcome": outcome,
+            "duration": duration,
+        }
+        if message:
+            record["message"] = message
+        self.write(record)
+
+    def absorb(self, path: str | Path) -> None:
+        """Append the records of another report stream, line by line"""
+        with Path(path).open(encoding="utf-8") as stream:
+            for line in stream:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # torn last line of an interrupted worker
+                text = json.dumps(record, default=str, ensure_ascii=False) + "\n"
+                with self._lock:
+                    self._open().write(text)
+                    kind = record.get("type")
+                    self.counts[kind] = self.counts.get(kind, 0) + 1
+        with self._lock:
+            self._open().flush()
+
+    def _open(self) -> IO[str]:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("w", encoding="utf-8")
+        return self._file
+
+    def _body(self, key: str, body: Any) -> Dict[str, Any]:
+        if not body or not self.max_body_bytes:
+            return {}
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        elif not isinstance(body, (bytes, bytearray)):
+            return {}  # generator or file upload, not replayable here
+        fields: Dict[str, Any] = {
+            key: body[: self.max_body_bytes].decode("utf-8", errors="replace")
+        }
+        if len(body) > self.max_body_bytes:
+            fields[f"{key}_size"] = len(body)
+        return fields
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "ReportWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ReportPlugin:
+    """
+    pytest plugin feeding test results into a ReportWriter and rendering
+    the configured format at session end. Register it from a conftest:
+    config.pluginmanager.register(ReportPlugin(writer, "html"), "api-report")
+
+    Under pytest-xdist only the controller records tests (worker results
+    reach its pytest_runtest_logreport). Workers are registered with
+    worker=True and a writer of their own for request records; the
+    controller merges those files into its stream at session end.
+    """
+
+    def __init__(
+        self, writer: ReportWriter, fmt: str = "json", worker: bool = False
+    ) -> None:
+        self.writer = writer
+        self.format = fmt
+        self.worker = worker
+        # phases seen so far of tests still running, one entry per test
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+    def pytest_runtest_logreport(self, report) -> None:
+        """Fold setup, call and teardown into one record per test"""
+        if self.worker:
+            return
+        state = self._pending.setdefault(
+            report.nodeid, {"outcome": "passed", "duration": 0.0, "message": None}
+        )
+        state["duration"] += report.duration
+        if report.outcome != "passed" and state["outcome"] == "passed":
+            outcome = report.outcome
+            if report.when != "call" and outcome == "failed":
+                outcome = "error"
+            state["outcome"] = outcome
+            if report.longrepr is not None:
+                state["message"] = _short(report.longrepr)
+        if report.when == "teardown":
+            del self._pending[report.nodeid]
+            self.writer.record_test(
+                report.nodeid, state["outcome"], state["duration"], state["message"]
+            )
+
+    def pytest_sessionfinish(self, session) -> None:
+        if not self.worker:
+            for part in sorted(worker_streams(self.writer.path)):
+                self.writer.absorb(part)
+                part.unlink()
+        self.writer.close()
+        if not self.worker and self.format in RENDERED and self.writer.path.exists():
+            render(self.writer.path, self.format)
+
+
+def worker_stream(path: str | Path, worker_id: str) -> Path:
+    """Request stream of one xdist worker next to the main report"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.{worker_id}{path.suffix}")
+
+
+def worker_streams(path: str | Path) -> List[Path]:
+    path = Path(path)
+    return list(path.parent.glob(f"{path.stem}.*{path.suffix}"))
+
+
+def _xml_text(text: str) -> str:
+    return _XML_ILLEGAL.sub("\ufffd", text)
+
+
+def _short(longrepr: Any, limit: int = 2000) -> str:
+    """Tail of a failure, where the assertion is, or the reason of a skip"""
+    if isinstance(longrepr, tuple):  # skip: (path, lineno, reason)
+        return str(longrepr[-1])[:limit]
+    text = str(longrepr)
+    return text[-limit:]
+
+
+def iter_records(path: str | Path, kind: Optional[str] = None) -> Iterator[Dict]:
+    """Records of a report stream, of one type when kind is given"""
+    with Path(path).open(encoding="utf-8") as stream:
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # torn last line of an interrupted run
+            if kind is None or record.get("type") == kind:
+                yield record
+
+
+def summarize(path: str | Path) -> Dict[str, Any]:
+    """Outcome counts and totals, one pass over the stream"""
+    summary: Dict[str, Any] = {
+        "tests": 0,
+        "passed": 0,
+        "failed": 0,
+        "error": 0,
+        "skipped": 0,
+        "duration": 0.0,
+        "requests": 0,
+        "request_errors": 0,
+    }
+    for record in iter_records(path):
+        if record["type"] == "test":
+            summary["tests"] += 1
+            summary[record["outcome"]] = summary.get(record["outcome"], 0) + 1
+            summary["duration"] += record.get("duration", 0.0)
+        elif record["type"] == "request":
+            summary["requests"] += 1
+            if _failed_request(record):
+                summary["request_errors"] += 1
+    return summary
+
+
+def _failed_request(record: Dict[str, Any]) -> bool:
+    return bool(record.get("error")) or record.get("status", 0) >= 400
+
+
+def render_html(source: str | Path, target: str | Path) -> Path:
+    """HTML report streamed row by row from the JSON-lines file"""
+    target = Path(target)
+    summary = summarize(source)
+    with target.open("w", encoding="utf-8") as out:
+        out.write(
+            "<!DOCTYPE html>\n<html><head><meta charset='utf-8'>"
+            "<title>API test report</title><style>"
+            "body{font-family:sans-serif}table{border-collapse:collapse}"
+            "td,th{border:1px solid #ccc;padding:2px 6px;text-align:left}"
+            ".failed,.error{background:#fdd}.skipped{background:#ffd}"
+            "pre{margin:0;white-space:pre-wrap}</style></head><body>\n"
+            "<h1>API test report</h1>\n<p>"
+        )
+        out.write(
+            ", ".join(
+                f"{key}: {summary[key]}"
+                for key in ("tests", "passed", "failed", "error", "skipped")
+            )
+        )
+        out.write(
+            f"; {summary['requests']} requests, "
+            f"{summary['request_errors']} without response or with status &ge; 400"
+            "</p>\n"
+            "<h2>Tests</h2>\n<table><tr><th>test</th><th>outcome</th>"
+            "<th>duration, s</th><th>message</th></tr>\n"
+        )
+        for record in iter_records(source, "test"):
+            message = html.escape(record.get("message", ""))
+            out.write(
+                f"<tr class='{html.escape(record['outcome'])}'>"
+                f"<td>{html.escape(record['nodeid'])}</td>"
+                f"<td>{html.escape(record['outcome'])}</td>"
+                f"<td>{record['duration']:.3f}</td>"
+                f"<td><pre>{message}</pre></td></tr>\n"
+            )
+        out.write(
+            "</table>\n<h2>Requests</h2>\n<table><tr><th>method</th><th>url</th>"
+            "<th>status</th><th>attempt</th><th>total, ms</th><th>size, B</th></tr>\n"
+        )
+        for record in iter_records(source, "request"):
+            css = " class='failed'" if _failed_request(record) else ""
+            status = html.escape(record.get("error") or str(record["status"]))
+            out.write(
+                f"<tr{css}><td>{html.escape(record['method'])}</td>"
+                f"<td>{html.escape(record['url'])}</td>"
+                f"<td>{status}</td><td>{record['attempt']}</td>"
+                f"<td>{record['total'] * 1000:.1f}</td><td>{record['size']}</td></tr>\n"
+            )
+        out.write("</table>\n</body></html>\n")
+    return target
+
+
+def render_junit(source: str | Path, target: str | Path) -> Path:
+    """JUnit XML streamed testcase by testcase from the JSON-lines file"""
+    target = Path(target)
+    summary = summarize(source)
+    with target.open("w", encoding="utf-8") as out:
+        out.write('<?xml version="1.0" encoding="utf-8"?>\n<testsuites>\n')
+        out.write(
+            f'<testsuite name="api" tests="{summary["tests"]}" '
+            f'failures="{summary["failed"]}" errors="{summary["error"]}" '
+            f'skipped="{summary["skipped"]}" time="{summary["duration"]:.3f}">\n'
+        )
+        for record in iter_records(source, "test"):
+            path, _, name = _xml_text(record["nodeid"]).partition("::")
+            classname = path.removesuffix(".py").replace("/", ".")
+            out.write(
+                f"<testcase classname={quoteattr(classname)} "
+                f"name={quoteattr(name or path)} time=\"{record['duration']:.3f}\""
+            )
+            tag = {"failed": "failure", "error": "error", "skipped": "skipped"}.get(
+                record["outcome"]
+            )
+            if tag is None:
+                out.write("/>\n")
+                continue
+            message = _xml_text(record.get("message", ""))
+            out.write(
+                f">\n<{tag} message={quoteattr(message.splitlines()[-1] if message else '')}>"
+                f"{html.escape(message, quote=False)}</{tag}>\n</testcase>\n"
+            )
+        out.write("</testsuite>\n</testsuites>\n")
+    return target
+
+
+def render(source: str | Path, fmt: str, target: str | Path | None = None) -> Path:
+    """Render source as html or xml next to it unless target is given"""
+    renderer = {"html": render_html, "xml": render_junit}.get(fmt)
+    if renderer is None:
+        raise ValueError(f"Unsupported report format: {fmt}")
+    if target is None:
+        target = Path(source).with_name(RENDERED[fmt])
+    return renderer(source, target)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Render a JSON-lines run report")
+    parser.add_argument("source", help="report.jsonl written during the run")
+    parser.add_argument("--format", choices=sorted(RENDERED), default="html")
+    parser.add_argument("--output", help="target file, next to source by default")
+    args = parser.parse_args(argv)
+    print(render(args.source, args.format, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Precompiled URL templates and immutable request specs built from Endpoints.
+"""
+
+import re
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import quote
+
+from api.endpoints.endpoint import Endpoint
+
+_PARAM = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+_SCALARS = (str, int, float, bool)
+
+
+class UrlTemplate:
+    """
+    Path template such as "/posts/{id}", parsed once.
+    render() checks path params and percent-encodes their values, so a
+    value can never change the path structure.
+    """
+
+    __slots__ = ("path", "params", "_parts")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        # even indexes are literals, odd ones parameter names
+        self._parts: Tuple[str, ...] = tuple(_PARAM.split(path))
+        self.params: Tuple[str, ...] = self._parts[1::2]
+        if len(set(self.params)) != len(self.params):
+            raise ValueError(f"Duplicate path parameter in {path!r}")
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def compile(cls, path: str) -> "UrlTemplate":
+        """Shared compiled template for path"""
+        return cls(path)
+
+    def render(self, path_params: Optional[Mapping[str, Any]] = None) -> str:
+        """Path with params filled in; ValueError on missing or unknown ones"""
+        path_params = path_params or {}
+        missing = [name for name in self.params if name not in path_params]
+        unknown = [name for name in path_params if name not in self.params]
+        if missing or unknown:
+            raise ValueError(
+                f"{self.path}: missing path params {missing}, unknown {unknown}"
+            )
+        parts = list(self._parts)
+        for i in range(1, len(parts), 2):
+            value = path_params[parts[i]]
+            if not isinstance(value, _SCALARS) or value == "":
+                raise ValueError(f"{self.path}: bad value for {parts[i]}: {value!r}")
+            parts[i] = quote(str(value), safe="")
+        return "".join(parts)
+
+    def __repr__(self) -> str:
+        return f"UrlTemplate({self.path!r})"
+
+
+def _check_query(query: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy of query params without None values; scalars or lists of scalars"""
+    checked = {}
+    for key, value in query.items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else (value,)
+        if not isinstance(key, str) or not all(isinstance(v, _SCALARS) for v in values):
+            raise ValueError(f"Bad query param {key!r}: {value!r}")
+        checked[key] = value
+    return checked
+
+
+@dataclass(frozen=True)
+class RequestSpec:
+    """
+    Fully resolved request: absolute url, query params and body.
+    Immutable, so one spec can be shared between threads and load loops.
+    template: the unresolved path ("/posts/{id}") the url was built from
+    """
+
+    method: str
+    url: str
+    params: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    body: Any = None
+    cache: bool = True
+    template: Optional[str] = None
+    pagination: Optional[Mapping[str, Any]] = None
+
+    @classmethod
+    def from_endpoint(
+        cls,
+        point: Endpoint,
+        host: str,
+        path_params: Optional[Mapping[str, Any]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        body: Any = None,
+    ) -> "RequestSpec":
+        """
+        Spec for point on host; point itself is left untouched.
+        body replaces the endpoint's body, e.g. an EncodedBody reused by
+        every request of a load run.
+        """
+        path = UrlTemplate.compile(point.endpoint).render(path_params)
+        return cls(
+            method=point.method.upper(),
+            url=host.rstrip("/") + path,
+            params=MappingProxyType(_check_query(query or {})),
+            body=body if body is not None else (point.body or None),
+            cache=getattr(point, "cache", True),
+            template=point.endpoint,
+            pagination=getattr(point, "pagination", None),
+        )
+
+    def __reduce__(self):
+        # MappingProxyType does not pickle; specs are sent to load workers
+        state = {**self.__dict__, "params": dict(self.params)}
+        return _restore_spec, (state,)
+
+    def with_query(self, **query: Any) -> "RequestSpec":
+        """Copy with extra query params"""
+        params = {**self.params, **_check_query(query)}
+        return replace(self, params=MappingProxyType(params))
+
+
+def _restore_spec(state: Dict[str, Any]) -> RequestSpec:
+    return RequestSpec(**{**state, "params": MappingProxyType(state["params"])})
@@ -0,0 +1,33 @@
+"""
+Helpers for building niquests responses that did not come from the network
+(cache hits, replayed cassettes).
+"""
+
+from http import HTTPStatus
+from typing import Dict, Optional
+
+import niquests
+from niquests.structures import CaseInsensitiveDict
+
+
+def build_response(
+    status_code: int,
+    headers: Optional[Dict[str, str]] = None,
+    content: bytes = b"",
+    url: str = "",
+    reason: Optional[str] = None,
+) -> niquests.Response:
+    """Create a fully loaded niquests.Response from stored parts"""
+    resp = niquests.Response()
+    resp.status_code = status_code
+    resp.headers = CaseInsensitiveDict(headers or {})
+    resp._content = content
+    resp._content_consumed = True
+    resp.url = url
+    if reason is None:
+        try:
+            reason = HTTPStatus(status_code).phrase
+        except ValueError:
+            reason = ""
+    resp.reason = reason
+    return resp
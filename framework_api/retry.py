@@ -0,0 +1,165 @@
+"""
+Retry policy for ApiClient: exponential backoff, jitter, Retry-After
+and a shared per-run retry budget.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import niquests
+from niquests.packages.urllib3.exceptions import (
+    ConnectTimeoutError,
+    NewConnectionError,
+)
+
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset(
+    {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"}
+)
+RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    Thread-safe cap on the total number of retries in one run,
+    so a sick upstream cannot multiply the load.
+    """
+
+    def __init__(self, max_retries: Optional[int] = None) -> None:
+        """max_retries: total retries allowed, unlimited when None"""
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Take one retry from the budget, False when exhausted"""
+        with self._lock:
+            if self.max_retries is not None and self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.max_retries is None:
+            return None
+        return max(self.max_retries - self.used, 0)
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed attempt is retried and how long to wait.
+
+    Non-idempotent methods (POST, PATCH) are retried only on 429 or when a
+    connection could not be established, unless retry_non_idempotent is set.
+    A Retry-After longer than max_delay is not waited for: the response is
+    returned without retry.
+    """
+
+    def __init__(
+        self,
+        retry_count: int = 0,
+        retry_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: FrozenSet[int] = RETRY_STATUSES,
+        retry_non_idempotent: bool = False,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        self.retry_count = retry_count
+        self.retry_delay = retry_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.budget = budget if budget is not None else RetryBudget()
+
+    @classmethod
+    def from_config(cls, test_config, **kwargs) -> "RetryPolicy":
+        """Build policy from TestConfig; one budget shared by all its users"""
+        kwargs.setdefault("budget", RetryBudget(test_config.retry_budget))
+        return cls(
+            retry_count=test_config.retry_count,
+            retry_delay=test_config.retry_delay,
+            max_delay=test_config.retry_max_delay,
+            **kwargs,
+        )
+
+    def is_idempotent(self, method: str) -> bool:
+        return self.retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before retry number `attempt` (0-based). A server's
+        Retry-After is used as given, never shortened.
+        """
+        if retry_after is not None:
+            return max(retry_after, 0.0)
+        delay = min(self.retry_delay * (2**attempt), self.max_delay)
+        if self.jitter:
+            # equal jitter: keep half of the delay, randomize the rest
+            delay = delay / 2 + random.uniform(0, delay / 2)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After as seconds; accepts delta-seconds or HTTP-date"""
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(when.timestamp() - time.time(), 0.0)
+
+    def delay_for_response(
+        self, method: str, attempt: int, resp: niquests.Response
+    ) -> Optional[float]:
+        """Seconds to wait before retrying resp, None when not retried"""
+        if resp.status_code not in self.retry_statuses:
+            return None
+        if resp.status_code != 429 and not self.is_idempotent(method):
+            return None
+        retry_after = self.parse_retry_after(resp.headers.get("Retry-After"))
+        if retry_after is not None and retry_after > self.max_delay:
+            # retrying sooner would be refused again: hand resp to the caller
+            return None
+        if not self._allowed(attempt):
+            return None
+        return self.backoff(attempt, retry_after)
+
+    def delay_for_error(
+        self, method: str, attempt: int, exc: Exception
+    ) -> Optional[float]:
+        """Seconds to wait before retrying after exc, None when not retried"""
+        if not isinstance(exc, (niquests.ConnectionError, niquests.Timeout)):
+            return None
+        if not (self.not_sent(exc) or self.is_idempotent(method)):
+            return None
+        if not self._allowed(attempt):
+            return None
+        return self.backoff(attempt)
+
+    @staticmethod
+    def not_sent(exc: Exception) -> bool:
+        """
+        True when exc failed while connecting (refused, unresolvable host,
+        connect timeout), so the request never reached the server
+        """
+        if isinstance(exc, niquests.ConnectTimeout):
+            return True
+        # niquests wraps the urllib3 error: ConnectionError(MaxRetryError(reason))
+        cause = exc.args[0] if exc.args else None
+        reason = getattr(cause, "reason", None)
+        return any(
+            isinstance(err, (NewConnectionError, ConnectTimeoutError))
+            for err in (cause, reason)
+        )
+
+    def _allowed(self, attempt: int) -> bool:
+        return attempt < self.retry_count and self.budget.try_acquire()
@@ -0,0 +1,126 @@
+"""
+Single-flight coalescing: concurrent identical requests share one upstream call.
+"""
+
+import asyncio
+import hashlib
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+# only safe methods are coalesced, every caller of PUT/DELETE expects its own call
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class _Call:
+    """One in-flight upstream call and its outcome"""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread- and asyncio-safe registry of in-flight calls.
+
+    The first caller of a key (the leader) runs the call, callers arriving
+    while it is in flight wait for and share its result or exception.
+    Nothing is kept once the call completes, so this is not a cache.
+    """
+
+    def __init__(self) -> None:
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: Dict[str, _Call] = {}
+        self._futures: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[str]:
+        """Key of a request, None when its method must not be coalesced"""
+        method = method.upper()
+        if method not in SAFE_METHODS:
+            return None
+        digest = hashlib.sha256()
+        for part in (
+            method,
+            url,
+            sorted((params or {}).items()),
+            sorted((k.lower(), v) for k, v in (headers or {}).items()),
+        ):
+            digest.update(repr(part).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn, or wait for the identical call already in flight"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """do() for coroutines; calls are coalesced within one event loop"""
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        with self._lock:
+            future = self._futures.get(loop_key)
+            leader = future is None
+            if leader:
+                future = self._futures[loop_key] = loop.create_future()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            # shield: a cancelled follower must not cancel the shared call
+            return await asyncio.shield(future)
+        try:
+            result = await fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            # followers re-raise it; avoid "exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._futures[loop_key]
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._futures)
+
+    def stats(self) -> Dict[str, int]:
+        """Upstream calls made and requests served by joining one of them"""
+        with self._lock:
+            return {"executed": self.executed, "coalesced": self.coalesced}
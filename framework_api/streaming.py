@@ -0,0 +1,99 @@
+"""
+Incremental decoding of JSON array bodies.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+# drop consumed text once this many characters were parsed
+_COMPACT_AT = 64 * 1024
+
+# parser states: what the next non-whitespace character may be
+_OPEN = 0  # "["
+_FIRST = 1  # an item or "]"
+_ITEM = 2  # an item (after ",")
+_NEXT = 3  # "," or "]"
+_CLOSED = 4  # nothing but whitespace
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield items of a top-level JSON array as its bytes arrive.
+
+    Only the unparsed tail of the body is kept in memory, so peak memory is
+    bounded by the largest single item, not by the whole response. Items
+    must be separated by commas and nothing but whitespace may follow the
+    closing bracket; anything else raises ValueError.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    state = _OPEN
+    chunks = iter(chunks)
+    exhausted = False
+    # an incomplete item is decoded again only once the text after its start
+    # has doubled, so a large item costs amortized linear time
+    retry_at = 0
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos < len(buffer):
+            char = buffer[pos]
+            if state == _OPEN:
+                if char != "[":
+                    raise ValueError("Response body is not a JSON array")
+                state = _FIRST
+                pos += 1
+                continue
+            if state == _CLOSED:
+                raise ValueError(f"Unexpected data after JSON array at offset {pos}")
+            if state in (_FIRST, _NEXT) and char == "]":
+                state = _CLOSED
+                pos += 1
+                continue
+            if state == _NEXT:
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' at offset {pos}")
+                state = _ITEM
+                pos += 1
+                continue
+            if char in ",]":
+                raise ValueError(f"Expected an array item at offset {pos}")
+            if exhausted or len(buffer) - pos >= retry_at:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    item, end = None, -1
+                # a value is complete only when followed by a delimiter: a
+                # number cut as 12|3 or 1|.5 continues in the next chunk
+                if end != -1 and (
+                    exhausted or (end < len(buffer) and buffer[end] in _DELIMITERS)
+                ):
+                    yield item
+                    state = _NEXT
+                    retry_at = 0
+                    pos = end
+                    if pos > _COMPACT_AT:
+                        buffer, pos = buffer[pos:], 0
+                    continue
+                if exhausted:
+                    raise ValueError(f"Truncated JSON array at offset {pos}")
+                retry_at = 2 * (len(buffer) - pos)
+        elif exhausted:
+            if state != _CLOSED:
+                raise ValueError("Truncated JSON array")
+            return
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer += utf8.decode(b"", final=True)
+        else:
+            if pos > _COMPACT_AT:
+                buffer, pos = buffer[pos:], 0
+            buffer += utf8.decode(chunk)
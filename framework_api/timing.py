@@ -0,0 +1,157 @@
+"""
+Per-request latency breakdown for ApiClient.
+"""
+
+import json
+import statistics
+import threading
+from dataclasses import asdict, dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import niquests
+
+
+def _seconds(value: Optional[timedelta]) -> Optional[float]:
+    return value.total_seconds() if value is not None else None
+
+
+def _mean(values) -> float:
+    values = list(values)
+    return statistics.fmean(values) if values else 0.0
+
+
+@dataclass
+class RequestTiming:
+    """
+    Timing of one HTTP attempt, all durations in seconds.
+    dns/connect/tls are None or 0 when a pooled connection was reused.
+    An attempt that got no response has status_code -1 and `error` set
+    to the exception name; total is the time until it failed.
+    """
+
+    method: str
+    url: str
+    status_code: int
+    dns: Optional[float]
+    connect: Optional[float]
+    tls: Optional[float]
+    ttfb: float
+    download: float
+    total: float
+    size: int
+    attempt: int = 0
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Endpoint key used for grouping: 'METHOD /path'"""
+        return f"{self.method.upper()} {urlsplit(self.url).path or '/'}"
+
+    @classmethod
+    def from_response(
+        cls,
+        method: str,
+        resp: niquests.Response,
+        total: float,
+        attempt: int = 0,
+        streamed: bool = False,
+    ) -> "RequestTiming":
+        """
+        Build timing from a response and measured wall time. Streamed
+        bodies are not read here: size comes from Content-Length.
+        """
+        info = resp.conn_info
+        ttfb = _seconds(resp.elapsed) or 0.0
+        if streamed:
+            size = int(resp.headers.get("Content-Length") or 0)
+        else:
+            size = len(resp.content or b"")
+        return cls(
+            method=method.upper(),
+            url=str(resp.url),
+            status_code=resp.status_code,
+            dns=_seconds(getattr(info, "resolution_latency", None)),
+            connect=_seconds(getattr(info, "established_latency", None)),
+            tls=_seconds(getattr(info, "tls_handshake_latency", None)),
+            ttfb=ttfb,
+            download=max(total - ttfb, 0.0),
+            total=total,
+            size=size,
+            attempt=attempt,
+        )
+
+    @classmethod
+    def from_error(
+        cls, method: str, url: str, exc: BaseException, total: float, attempt: int = 0
+    ) -> "RequestTiming":
+        """Timing of an attempt that failed without a response"""
+        return cls(
+            method=method.upper(),
+            url=url,
+            status_code=-1,
+            dns=None,
+            connect=None,
+            tls=None,
+            ttfb=0.0,
+            download=0.0,
+            total=total,
+            size=0,
+            attempt=attempt,
+            error=type(exc).__name__,
+        )
+
+
+class TimingRecorder:
+    """
+    Thread-safe collection of RequestTiming records shared by clients.
+    Summaries and JSON dumps let runs be compared per endpoint.
+    """
+
+    def __init__(self) -> None:
+        self.records: List[RequestTiming] = []
+        self._lock = threading.Lock()
+
+    def add(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self.records.append(timing)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-endpoint count, errors, mean/median/max total time (failed
+        attempts included) and mean ttfb/size of answered attempts
+        """
+        with self._lock:
+            records = list(self.records)
+        grouped: Dict[str, List[RequestTiming]] = {}
+        for timing in records:
+            grouped.setdefault(timing.key, []).append(timing)
+        result = {}
+        for key, items in sorted(grouped.items()):
+            totals = [t.total for t in items]
+            answered = [t for t in items if t.error is None]
+            result[key] = {
+                "count": len(items),
+                "errors": len(items) - len(answered),
+                "mean": statistics.fmean(totals),
+                "median": statistics.median(totals),
+                "max": max(totals),
+                "mean_ttfb": _mean(t.ttfb for t in answered),
+                "mean_size": _mean(t.size for t in answered),
+            }
+        return result
+
+    def dump(self, path: str | Path) -> Path:
+        """Write records and summary to a JSON file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            records = [asdict(t) for t in self.records]
+        data = {"summary": self.summary(), "records": records}
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return path
+
+    def __len__(self) -> int:
+        return len(self.records)
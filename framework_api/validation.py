@@ -0,0 +1,80 @@
+"""
+Cached pydantic validators and sampled validation of large list payloads.
+"""
+
+import random
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, get_args, get_origin
+
+from pydantic import TypeAdapter
+
+_adapters: Dict[Tuple[Any, bool], TypeAdapter] = {}
+_adapters_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Sampling:
+    """
+    Which items of a list response to validate.
+    every: validate each Nth item (always including the first one)
+    size: validate a random subset of this many items
+    seed: makes the random subset reproducible
+    """
+
+    every: Optional[int] = None
+    size: Optional[int] = None
+    seed: Optional[int] = None
+
+    def pick(self, count: int) -> List[int]:
+        """Indices of items to validate out of `count`"""
+        if self.size is not None and self.size < count:
+            return sorted(random.Random(self.seed).sample(range(count), self.size))
+        if self.every is not None and self.every > 1:
+            return list(range(0, count, self.every))
+        return list(range(count))
+
+
+def item_type(schema: Any) -> Optional[Any]:
+    """Item type of list[X] / List[X] schemas, None for anything else"""
+    if get_origin(schema) in (list, List):
+        args = get_args(schema)
+        return args[0] if args else Any
+    return None
+
+
+def get_adapter(schema: Any, many: bool = False) -> TypeAdapter:
+    """
+    Compiled TypeAdapter for schema (or list[schema] when many), built once
+    per process and shared by every client.
+    """
+    key = (schema, many)
+    adapter = _adapters.get(key)
+    if adapter is None:
+        with _adapters_lock:
+            adapter = _adapters.get(key)
+            if adapter is None:
+                adapter = TypeAdapter(List[schema] if many else schema)
+                _adapters[key] = adapter
+    return adapter
+
+
+def validate_payload(
+    payload: Any, schema: Any, sampling: Optional[Sampling] = None
+) -> Any:
+    """
+    Validate payload against schema. A list payload checked against an
+    item model (or list[Model]) is validated as a list, optionally only
+    the sampled items. Raises pydantic.ValidationError.
+    """
+    inner = item_type(schema)
+    if isinstance(payload, list) and (inner is not None or _is_model(schema)):
+        item = inner if inner is not None else schema
+        if sampling is not None:
+            payload = [payload[i] for i in sampling.pick(len(payload))]
+        return get_adapter(item, many=True).validate_python(payload)
+    return get_adapter(schema).validate_python(payload)
+
+
+def _is_model(schema: Any) -> bool:
+    return isinstance(schema, type) and hasattr(schema, "model_validate")
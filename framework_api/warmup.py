@@ -0,0 +1,59 @@
+"""
+Connection pre-warming: pay DNS, TCP and TLS setup before the first test.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import niquests
+
+
+@dataclass
+class WarmupResult:
+    """What a warm-up achieved; failures are reported, never raised"""
+
+    url: str
+    requested: int
+    opened: int = 0
+    errors: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.opened == self.requested
+
+
+def warm_up(
+    session: niquests.Session,
+    url: str,
+    connections: int = 4,
+    timeout: float = 10.0,
+) -> WarmupResult:
+    """
+    Open `connections` keep-alive connections of session to url's origin
+    by sending that many concurrent HEAD requests. Any HTTP status counts:
+    the point is the completed handshake left in the session's pool.
+    """
+    result = WarmupResult(url=url, requested=connections)
+    if connections < 1:
+        return result
+    started = time.perf_counter()
+
+    def touch(_: int) -> Optional[str]:
+        try:
+            # body-less response: the connection goes straight back to the pool
+            session.head(url, timeout=timeout, allow_redirects=False)
+        except niquests.RequestException as exc:
+            return f"{type(exc).__name__}: {exc}"
+        return None
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        for error in executor.map(touch, range(connections)):
+            if error is None:
+                result.opened += 1
+            else:
+                result.errors.append(error)
+    result.elapsed = time.perf_counter() - started
+    return result
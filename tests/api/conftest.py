@@ -1,7 +1,69 @@
+import os
 import pytest
+from functools import partial
+from pathlib import Path
+from api.endpoints.endpoint import Endpoint
 from api.endpoints.json_placeholder import Default
-from framework_api.config import ConfigManager
+from framework_api.config import SNAPSHOT_ENV, ConfigManager
+from framework_api.circuit import CircuitBreakers
 from framework_api.client import ApiClient
+from framework_api.cassette import Cassette
+from framework_api.mock_server import MockServer
+from framework_api.pool import SessionPool
+from framework_api.rate_limit import RateLimiter
+from framework_api.report import (
+    ReportPlugin,
+    ReportWriter,
+    worker_stream,
+    worker_streams,
+)
+from framework_api.retry import RetryPolicy
+from framework_api.singleflight import SingleFlight
+from framework_api.timing import TimingRecorder
+from framework_api.warmup import warm_up
+
+CONFIG_SNAPSHOT = "api_config_snapshot"
+_manager_key = pytest.StashKey[ConfigManager]()
+_snapshot_key = pytest.StashKey[str]()
+
+
+def pytest_configure(config):
+    """Stream per-test and per-request records to the run report"""
+    worker = getattr(config, "workerinput", None)
+    if worker is not None and CONFIG_SNAPSHOT in worker:
+        # xdist worker: load the controller's snapshot instead of the YAML
+        os.environ[SNAPSHOT_ENV] = worker[CONFIG_SNAPSHOT]
+    manager = ConfigManager("./configs/test.yaml")
+    config.stash[_manager_key] = manager
+    report_config = manager.get_report_config()
+    writer = ReportWriter.from_config(report_config)
+    if worker is not None:
+        # xdist worker: own file for request records, tests go to the controller
+        writer.path = worker_stream(writer.path, worker["workerid"])
+    else:
+        for stale in worker_streams(writer.path):
+            stale.unlink()
+    config.pluginmanager.register(
+        ReportPlugin(writer, report_config.format, worker=worker is not None),
+        "api-report",
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist: snapshot the parsed config once and pass it to every worker"""
+    config = node.config
+    if _snapshot_key not in config.stash:
+        manager = config.stash[_manager_key]
+        path = Path(manager.get_report_config().output_dir) / "config.snapshot.json"
+        config.stash[_snapshot_key] = str(manager.write_snapshot(path).resolve())
+    node.workerinput[CONFIG_SNAPSHOT] = config.stash[_snapshot_key]
+
+
+@pytest.fixture(scope="session")
+def report_writer(pytestconfig) -> ReportWriter:
+    return pytestconfig.pluginmanager.get_plugin("api-report").writer
+
 
 @pytest.fixture(scope="session")
 def manager() -> ConfigManager:
@@ -16,8 +78,123 @@ def host(manager: ConfigManager) -> str:
 
 
 @pytest.fixture(scope="session")
-def api_client(host):
-    return ApiClient
+def session_pool(manager: ConfigManager):
+    """Keep-alive sessions shared by all API tests, closed at session end"""
+    pool = SessionPool.from_config(manager.get_api_config())
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def retry_policy(manager: ConfigManager) -> RetryPolicy:
+    """Retry policy with one retry budget for the whole run"""
+    return RetryPolicy.from_config(manager.get_test_config())
+
+
+@pytest.fixture(scope="session")
+def rate_limiter(manager: ConfigManager) -> RateLimiter | None:
+    """Per-host limiter shared by the run, disabled when rate_limit is unset"""
+    return RateLimiter.from_config(manager.get_api_config())
+
+
+@pytest.fixture(scope="session")
+def single_flight() -> SingleFlight:
+    """Coalesces identical GETs fired at the same time by parallel tests"""
+    return SingleFlight()
+
+
+@pytest.fixture(scope="session")
+def circuit_breakers(manager: ConfigManager) -> CircuitBreakers | None:
+    """Breakers shared by the run so a downed endpoint fails fast everywhere"""
+    return CircuitBreakers.from_config(manager.get_test_config())
+
+
+@pytest.fixture(scope="session")
+def timing_recorder(manager: ConfigManager):
+    """Collects per-request timings, dumped to the report dir at session end"""
+    recorder = TimingRecorder()
+    yield recorder
+    if len(recorder):
+        recorder.dump(f"{manager.get_report_config().output_dir}/timings.json")
+
+
+@pytest.fixture(scope="session")
+def cassette():
+    """
+    Record/replay cassette: API_CASSETTE_MODE=off|record|append|replay,
+    API_CASSETTE=path to the JSON-lines file (requests.jsonl by default)
+    """
+    mode = os.getenv("API_CASSETTE_MODE", "off").lower()
+    if mode == "off":
+        yield None
+        return
+    with Cassette(os.getenv("API_CASSETTE", "requests.jsonl"), mode) as tape:
+        yield tape
+
+
+@pytest.fixture(scope="session")
+def warm_pool(
+    host: str,
+    manager: ConfigManager,
+    session_pool: SessionPool,
+    cassette: Cassette | None,
+):
+    """
+    Opt-in: pre-open api.warmup_connections connections to base_portal so
+    the first live test does not pay DNS and TLS setup. Request it only from
+    tests that hit the real host; a replaying cassette never touches the
+    network, so nothing is warmed then. Best effort: failures are ignored.
+    """
+    connections = manager.get_api_config().warmup_connections
+    if not connections or (cassette is not None and cassette.replaying):
+        return None
+    # same session key as the api_client clients: default client headers
+    session = ApiClient(Endpoint("HEAD", host), pool=session_pool).session
+    return warm_up(session, host, connections, timeout=5)
+
+
+@pytest.fixture(scope="session")
+def api_client(
+    host,
+    manager: ConfigManager,
+    session_pool: SessionPool,
+    retry_policy: RetryPolicy,
+    timing_recorder: TimingRecorder,
+    cassette: Cassette | None,
+    rate_limiter: RateLimiter | None,
+    single_flight: SingleFlight,
+    circuit_breakers: CircuitBreakers | None,
+    report_writer: ReportWriter,
+):
+    """ApiClient factory bound to the shared pool, retry policy and timings"""
+    test_config = manager.get_test_config()
+    return partial(
+        ApiClient,
+        pool=session_pool,
+        retry=retry_policy,
+        max_response_time=test_config.max_response_time,
+        enforce_response_time=test_config.enforce_response_time,
+        recorder=timing_recorder,
+        cassette=cassette,
+        rate_limiter=rate_limiter,
+        single_flight=single_flight,
+        circuit_breakers=circuit_breakers,
+        reporter=report_writer,
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_server():
+    """Stateful stand-in for the API generated from the OpenAPI model"""
+    with MockServer("./api/models/json_placeholder.yaml") as server:
+        yield server
+
+
+@pytest.fixture()
+def mock_host(mock_server: MockServer) -> str:
+    """Base URL of the mock server with freshly seeded state"""
+    mock_server.api.reset()
+    return mock_server.url
 
 
 @pytest.fixture(scope="session")
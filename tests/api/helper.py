@@ -1,13 +1,20 @@
 """
 Helper functions can placed here
 """
+import json
+import threading
 from copy import deepcopy
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
 from api.endpoints.endpoint import Endpoint
+from framework_api.request_spec import UrlTemplate
 
 
 def endpoint_helper(point: Endpoint, host: str, put_in_path: dict | None = None) -> Endpoint:
     """
     Build final endpoint with host and path params replacement.
+    Returns a new Endpoint, `point` is not modified.
 
     Example:
         endpoint = "/posts/{id}"
@@ -15,13 +22,83 @@ def endpoint_helper(point: Endpoint, host: str, put_in_path: dict | None = None)
         put_in_path = {"id": 1}
         result: "http://127.0.0.1/posts/1"
     """
-    put_in_path = put_in_path or {}
+    path = UrlTemplate.compile(point.endpoint).render(put_in_path)
+    return replace(point, endpoint=host.rstrip("/") + path)
 
 
-    url = point.endpoint
+class LocalServer:
+    """
+    In-process HTTP server for offline client tests.
+
+    Replies come from `routes`: "METHOD /path" -> list of (status, headers, body).
+    Replies are served in order; the last one repeats. Unknown routes get 404.
+    Every request is recorded in `requests` as (method, path, headers, body).
+    """
+
+    def __init__(self, routes: dict | None = None):
+        self.routes = {key: list(value) for key, value in (routes or {}).items()}
+        self.requests: list[tuple[str, str, dict, bytes]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reply(self, method: str, path: str) -> tuple[int, dict, Any]:
+        with self._lock:
+            queue = self.routes.get(f"{method} {path}")
+            if not queue:
+                return 404, {}, {"error": "not found"}
+            return queue.pop(0) if len(queue) > 1 else queue[0]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                path = self.path.split("?", 1)[0]
+                with server._lock:
+                    server.requests.append(
+                        (self.command, self.path, dict(self.headers), raw)
+                    )
+                status, headers, body = server.reply(self.command, path)
+                if callable(body):
+                    body = body(self)
+                if isinstance(body, bytes):
+                    payload = body
+                else:
+                    payload = json.dumps(body).encode() if body is not None else b""
+                self.send_response(status)
+                if payload:
+                    self.send_header("Content-Type", "application/json")
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _serve
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
 
-    for key, value in put_in_path.items():
-        url = url.replace(f"{{{key}}}", str(value))
+    def __enter__(self) -> "LocalServer":
+        self._thread.start()
+        return self
 
-    point.endpoint = host.rstrip("/") + url
-    return point
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -1,5 +1,5 @@
 import pytest
-from framework_api.client import APIError, ApiClient
+from framework_api.client import APIError
 from api.endpoints.json_placeholder import (
     Default,
     Posts_Post_Body,
@@ -9,15 +9,18 @@ from api.endpoints.json_placeholder import (
 from api.endpoints.endpoint import Endpoint
 from tests.api.helper import endpoint_helper
 
+# these tests talk to the real base_portal: warm its connections up front
+pytestmark = pytest.mark.usefixtures("warm_pool")
 
-def test_get_posts(default: Default, host: str):
+
+def test_get_posts(default: Default, host: str, api_client):
     """
     GET /posts — verify list of posts
     """
     point: Endpoint = default.posts_get
     endpoint = endpoint_helper(point, host)
 
-    client = ApiClient(endpoint)
+    client = api_client(endpoint)
 
     try:
         data = client.request()
@@ -32,14 +35,14 @@ def test_get_posts(default: Default, host: str):
     assert "userId" in data[0]
 
 
-def test_get_post_by_id(default: Default, host: str):
+def test_get_post_by_id(default: Default, host: str, api_client):
     """
     GET /posts/{id} — verify single post
     """
     point: Endpoint = default.posts_id_get
     endpoint = endpoint_helper(point, host, put_in_path={"id": 1})
 
-    client = ApiClient(endpoint)
+    client = api_client(endpoint)
 
     try:
         data = client.request()
@@ -53,7 +56,7 @@ def test_get_post_by_id(default: Default, host: str):
     assert "userId" in data
 
 
-def test_create_post(default: Default, host: str):
+def test_create_post(default: Default, host: str, api_client):
     """
     POST /posts — create post
     """
@@ -66,7 +69,7 @@ def test_create_post(default: Default, host: str):
     )
 
     endpoint = endpoint_helper(point, host)
-    client = ApiClient(endpoint)
+    client = api_client(endpoint)
     client.data = body
     try:
         data = client.request()
@@ -80,7 +83,7 @@ def test_create_post(default: Default, host: str):
     assert "id" in data
 
 
-def test_update_post_put(default: Default, host: str):
+def test_update_post_put(default: Default, host: str, api_client):
     """
     PUT /posts/{id} — full update
     """
@@ -95,7 +98,7 @@ def test_update_post_put(default: Default, host: str):
 
     endpoint = endpoint_helper(point, host, put_in_path={"id": 1})
 
-    client = ApiClient(endpoint)
+    client = api_client(endpoint)
     client.data = body
     try:
         data = client.request()
@@ -108,7 +111,7 @@ def test_update_post_put(default: Default, host: str):
     assert data["userId"] == 1
 
 
-def test_update_post_patch(default: Default, host: str):
+def test_update_post_patch(default: Default, host: str, api_client):
     """
     PATCH /posts/{id} — partial update
     """
@@ -118,7 +121,7 @@ def test_update_post_patch(default: Default, host: str):
 
     endpoint = endpoint_helper(point, host, put_in_path={"id": 1})
 
-    client = ApiClient(endpoint)
+    client = api_client(endpoint)
     client.data = body
 
     try:
@@ -130,7 +133,7 @@ def test_update_post_patch(default: Default, host: str):
     assert data["title"] == "patched title"
 
 
-def test_delete_post(default: Default, host: str):
+def test_delete_post(default: Default, host: str, api_client):
     """
     DELETE /posts/{id}
     """
@@ -138,7 +141,7 @@ def test_delete_post(default: Default, host: str):
 
     endpoint = endpoint_helper(point, host, put_in_path={"id": 1})
 
-    client = ApiClient(endpoint)
+    client = api_client(endpoint)
 
     try:
         data = client.request()
@@ -148,7 +151,7 @@ def test_delete_post(default: Default, host: str):
     assert data == {} or data is None
 
 
-def test_get_post_comments(default: Default, host: str):
+def test_get_post_comments(default: Default, host: str, api_client):
     """
     GET /posts/{id}/comments
     """
@@ -156,7 +159,7 @@ def test_get_post_comments(default: Default, host: str):
    
     endpoint = endpoint_helper(point, host, put_in_path={"id": 1})
 
-    client = ApiClient(endpoint)
+    client = api_client(endpoint)
 
     try:
         data = client.request()
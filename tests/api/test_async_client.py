@@ -0,0 +1,116 @@
+import asyncio
+
+import niquests
+import pytest
+from pydantic import BaseModel
+
+from api.endpoints.json_placeholder import Default
+from framework_api.async_client import AsyncApiClient
+from framework_api.client import APIError
+from framework_api.retry import RetryPolicy
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+class Post(BaseModel):
+    id: int
+    title: str
+
+
+@pytest.fixture()
+def server():
+    routes = {
+        f"GET /posts/{i}": [(200, {}, {"id": i, "title": f"post {i}"})]
+        for i in range(1, 6)
+    }
+    routes["GET /posts"] = [(200, {}, [{"id": 1, "title": "post 1"}])]
+    with LocalServer(routes) as srv:
+        yield srv
+
+
+def test_async_request(default: Default, server: LocalServer):
+    """
+    Single async request returns decoded body
+    """
+    endpoint = endpoint_helper(default.posts_get, server.url)
+
+    async def run():
+        async with AsyncApiClient(endpoint) as client:
+            return await client.request()
+
+    assert asyncio.run(run()) == [{"id": 1, "title": "post 1"}]
+
+
+def test_request_many_keeps_input_order(default: Default, server: LocalServer):
+    """
+    Concurrent fan-out returns results in the order endpoints were given
+    """
+    ids = [5, 3, 1, 4, 2]
+    endpoints = [
+        endpoint_helper(default.posts_id_get, server.url, put_in_path={"id": i})
+        for i in ids
+    ]
+
+    async def run():
+        async with AsyncApiClient(endpoints[0], validate_response=True) as client:
+            return await client.request_many(
+                [(point, Post) for point in endpoints], concurrency=3
+            )
+
+    data = asyncio.run(run())
+
+    assert [item["id"] for item in data] == ids
+
+
+def test_request_many_raises_api_error(default: Default, server: LocalServer):
+    """
+    Non-2xx responses raise APIError when validation is on
+    """
+    missing = endpoint_helper(default.posts_id_get, server.url, put_in_path={"id": 99})
+
+    async def run():
+        async with AsyncApiClient(missing, validate_response=True) as client:
+            return await client.request_many([missing], return_exceptions=True)
+
+    (error,) = asyncio.run(run())
+
+    assert isinstance(error, APIError)
+    assert error.status_code == 404
+
+
+def test_retried_response_released_before_backoff(default: Default, monkeypatch):
+    """
+    A response that is going to be retried is closed, so its connection
+    returns to the pool instead of being held through the backoff
+    """
+    closed = []
+    close = niquests.Response.close
+
+    def counting(resp):
+        closed.append(resp.status_code)
+        return close(resp)
+
+    monkeypatch.setattr(niquests.Response, "close", counting)
+    routes = {"GET /posts": [(503, {}, None), (200, {}, [{"id": 1}])]}
+    retry = RetryPolicy(retry_count=1, retry_delay=0, jitter=False)
+
+    async def run(url):
+        endpoint = endpoint_helper(default.posts_get, url)
+        async with AsyncApiClient(endpoint, retry=retry) as client:
+            return await client.request()
+
+    with LocalServer(routes) as srv:
+        assert asyncio.run(run(srv.url)) == [{"id": 1}]
+    assert closed[0] == 503
+
+
+@pytest.mark.parametrize("method", ["stream", "paginate"])
+def test_sync_only_methods_rejected(default: Default, method):
+    """
+    Sync streaming and paging would hand back un-awaited coroutines
+    """
+    client = AsyncApiClient(endpoint_helper(default.posts_get, "http://local"))
+
+    with pytest.raises(TypeError, match=f"does not support {method}"):
+        getattr(client, method)()
+    with pytest.raises(TypeError, match="_send_async"):
+        client._fetch_page({"_page": 1})
@@ -0,0 +1,46 @@
+from benchmarks.suite import compare, format_comparison, run_suite
+
+
+def metric(value, better="lower", gate=True):
+    return {"value": value, "unit": "us", "better": better, "gate": gate}
+
+
+def test_compare_flags_regressions_past_threshold():
+    baseline = {
+        "metrics": {
+            "plain.mean_us": metric(100),
+            "plain.rps": metric(1000, better="higher"),
+            "plain.p99_us": metric(200, gate=False),
+            "cached.mean_us": metric(50),
+        }
+    }
+    current = {
+        "metrics": {
+            "plain.mean_us": metric(125),
+            "plain.rps": metric(950, better="higher"),
+            "plain.p99_us": metric(400, gate=False),
+        }
+    }
+
+    rows = {row["metric"]: row for row in compare(baseline, current, threshold=0.1)}
+
+    assert rows["plain.mean_us"]["regressed"]
+    assert abs(rows["plain.rps"]["change"] - 0.05) < 1e-9
+    assert not rows["plain.rps"]["regressed"]
+    assert not rows["plain.p99_us"]["regressed"]
+    assert rows["cached.mean_us"]["missing"] and rows["cached.mean_us"]["regressed"]
+    report = format_comparison(list(rows.values()))
+    assert "REGRESSION" in report and "missing" in report
+
+
+def test_suite_produces_baseline():
+    result = run_suite(
+        iterations=10, only=["plain", "cached", "connections"], repeats=1
+    )
+
+    metrics = result["metrics"]
+    assert result["meta"]["iterations"] == 10
+    assert {"plain.mean_us", "raw_session.mean_us", "overhead.plain_us"} <= set(metrics)
+    assert metrics["cached.mean_us"]["value"] > 0
+    assert metrics["connection.setup_us"]["value"] >= 0
+    assert all(not compare(result, result)[i]["regressed"] for i in range(len(metrics)))
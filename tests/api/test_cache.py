@@ -0,0 +1,177 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from api.endpoints.json_placeholder import Default
+from framework_api.cache import CacheEntry, ResponseCache
+from framework_api.client import ApiClient
+from tests.api.helper import LocalServer, endpoint_helper
+
+POSTS = [{"id": 1, "title": "foo"}]
+
+
+def test_fresh_get_served_from_cache(default: Default):
+    """
+    GET within max-age is answered without touching the network
+    """
+    cache = ResponseCache()
+    routes = {"GET /posts": [(200, {"Cache-Control": "max-age=60"}, POSTS)]}
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        first = ApiClient(point, cache=cache).request()
+        second = ApiClient(point, cache=cache).request()
+
+    assert first == second == POSTS
+    assert len(server.requests) == 1
+    assert cache.hits == 1
+
+
+def test_stale_entry_revalidated_with_etag(default: Default):
+    """
+    no-cache entries are revalidated with If-None-Match; 304 reuses the body
+    and keeps the stored no-cache, so the next call revalidates again
+    """
+    cache = ResponseCache()
+    routes = {
+        "GET /posts": [
+            (200, {"Cache-Control": "no-cache", "ETag": '"v1"'}, POSTS),
+            (304, {"ETag": '"v1"'}, None),
+        ]
+    }
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        ApiClient(point, cache=cache).request()
+        data = ApiClient(point, cache=cache).request()
+        ApiClient(point, cache=cache).request()
+
+    assert data == POSTS
+    assert server.requests[1][2]["If-None-Match"] == '"v1"'
+    assert len(server.requests) == 3
+    assert cache.revalidations == 2
+
+
+def test_non_get_and_opted_out_endpoints_not_cached(default: Default):
+    """
+    POST is never cached, Endpoint.cache=False bypasses the cache for GET
+    """
+    cache = ResponseCache()
+    routes = {
+        "GET /posts": [(200, {"Cache-Control": "max-age=60"}, POSTS)],
+        "POST /posts": [(201, {"Cache-Control": "max-age=60"}, {"id": 101})],
+    }
+    with LocalServer(routes) as server:
+        post = endpoint_helper(default.posts_post, server.url)
+        get = replace(endpoint_helper(default.posts_get, server.url), cache=False)
+        for _ in range(2):
+            client = ApiClient(post, cache=cache)
+            client.data = {"title": "foo", "body": "bar", "userId": 1}
+            client.request()
+            ApiClient(get, cache=cache).request()
+
+    assert len(server.requests) == 4
+    assert len(cache) == 0
+
+
+def test_disk_tier_survives_new_cache_instance(default: Default, tmp_path):
+    """
+    Entries written to disk_dir are visible to another cache instance
+    """
+    routes = {"GET /posts": [(200, {"Cache-Control": "max-age=60"}, POSTS)]}
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        ApiClient(point, cache=ResponseCache(disk_dir=tmp_path)).request()
+        data = ApiClient(point, cache=ResponseCache(disk_dir=tmp_path)).request()
+
+    assert data == POSTS
+    assert len(server.requests) == 1
+
+
+def test_key_and_vary_separate_variants(default: Default):
+    """
+    Different credentials never share an entry; a response with
+    Vary: X-Tenant is not served to a request with another X-Tenant
+    """
+    cache = ResponseCache()
+    headers = {"Cache-Control": "max-age=60", "Vary": "X-Tenant"}
+    with LocalServer({"GET /posts": [(200, headers, POSTS)]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        for sent in (
+            {"Authorization": "Bearer a"},
+            {"Authorization": "Bearer b"},
+            {"Authorization": "Bearer b"},
+            {"Authorization": "Bearer b", "X-Tenant": "2"},
+        ):
+            ApiClient(point, headers=sent, cache=cache).request()
+
+    assert len(server.requests) == 3
+    assert cache.hits == 1
+
+
+def test_fresh_hit_skips_response_time_budget(default: Default):
+    """
+    A cache hit sends nothing, so it is not held to the latency budget
+    """
+    routes = {"GET /posts": [(200, {"Cache-Control": "max-age=60"}, POSTS)]}
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        client = ApiClient(
+            point,
+            cache=ResponseCache(),
+            max_response_time=60,
+            enforce_response_time=True,
+        )
+        client.request()
+        client.max_response_time = 0.0
+
+        assert client.request() == POSTS
+
+
+def test_concurrent_disk_writes_of_one_key(tmp_path):
+    """
+    Writers of the same key use their own temp files and never collide
+    """
+    cache = ResponseCache(disk_dir=tmp_path)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: cache._write_disk("k", _entry(b"x" * 1024)), range(64)))
+
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+    assert cache._read_disk("k").content == b"x" * 1024
+
+
+def test_lru_respects_byte_cap():
+    cache = ResponseCache(max_bytes=10)
+    for name in ("a", "b", "c"):
+        cache._put(name, _entry(b"12345"))
+
+    assert len(cache) == 2
+    assert cache.size_bytes == 10
+    assert cache.get("a") is None
+
+
+def test_oversized_update_drops_old_entry(tmp_path):
+    """
+    A new response too big to cache replaces the old one with nothing
+    """
+    cache = ResponseCache(max_bytes=10, disk_dir=tmp_path)
+    cache._put("a", _entry(b"12345"))
+    cache._put("a", _entry(b"x" * 11))
+
+    assert cache.get("a") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disk_tier_drops_oldest_files_past_cap(tmp_path):
+    cache = ResponseCache(disk_dir=tmp_path, max_disk_bytes=1000)
+    for n, name in enumerate("abcdef"):
+        cache._write_disk(name, _entry(b"x" * 200))
+        os.utime(cache._disk_path(name), ns=(n, n))  # distinct write order
+
+    assert sum(p.stat().st_size for p in tmp_path.iterdir()) <= 1000
+    assert cache._read_disk("f") is not None
+    assert cache._read_disk("a") is None
+
+
+def _entry(content: bytes) -> CacheEntry:
+    return CacheEntry(
+        url="", status_code=200, headers={}, content=content, expires_at=1e12
+    )
@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from api.endpoints.json_placeholder import Default
+from framework_api.cassette import Cassette
+from framework_api.client import APIError, ApiClient
+from framework_api.response import build_response
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def test_record_then_replay_offline(default: Default, tmp_path):
+    """
+    Recorded exchanges are served back after the server is gone
+    """
+    tape_path = tmp_path / "requests.jsonl"
+    routes = {
+        "GET /posts/1": [(200, {}, {"id": 1, "title": "foo"})],
+        "POST /posts": [(201, {}, {"id": 101, "title": "new"})],
+    }
+    with LocalServer(routes) as server, Cassette(tape_path, "record") as tape:
+        get = endpoint_helper(default.posts_id_get, server.url, put_in_path={"id": 1})
+        post = endpoint_helper(default.posts_post, server.url)
+        ApiClient(get, cassette=tape).request()
+        client = ApiClient(post, cassette=tape)
+        client.data = {"title": "new", "body": "x", "userId": 1}
+        client.request()
+
+    lines = tape_path.read_text().splitlines()
+    assert [json.loads(line)["method"] for line in lines] == ["GET", "POST"]
+
+    with Cassette(tape_path, "replay") as tape:
+        assert len(tape) == 2
+        assert ApiClient(get, cassette=tape).request() == {"id": 1, "title": "foo"}
+
+        client = ApiClient(post, cassette=tape)
+        client.data = {"title": "new", "body": "x", "userId": 1}
+        assert client.request()["id"] == 101
+
+        other_body = ApiClient(post, cassette=tape)
+        other_body.data = {"title": "other", "body": "x", "userId": 1}
+        with pytest.raises(APIError, match="No recorded response"):
+            other_body.request()
+
+
+def test_record_truncates_and_append_keeps(tmp_path):
+    """
+    Re-recording starts a fresh cassette; append mode extends it
+    """
+    tape_path = tmp_path / "requests.jsonl"
+    resp = build_response(200, {}, b"[]", "http://local/posts")
+    for mode, expected in (("record", 1), ("record", 1), ("append", 2)):
+        with Cassette(tape_path, mode) as tape:
+            tape.record("GET", "http://local/posts", None, None, resp)
+        assert len(tape_path.read_bytes().splitlines()) == expected
+
+
+def test_replay_skips_foreign_lines(tmp_path):
+    """
+    Lines that are not cassette records do not break index building
+    """
+    tape_path = tmp_path / "requests.jsonl"
+    record = {
+        "method": "GET",
+        "url": "http://local/posts",
+        "body_hash": "",
+        "status_code": 200,
+        "headers": {"Content-Type": "application/json"},
+        "body_b64": "W10=",
+    }
+    tape_path.write_text('{"request_id": "x"}\nnot json\n' + json.dumps(record) + "\n")
+
+    with Cassette(tape_path, "replay") as tape:
+        resp = tape.replay("GET", "http://local/posts", None, None)
+
+    assert len(tape) == 1
+    assert resp.json() == []
@@ -0,0 +1,136 @@
+import time
+
+import pytest
+
+from api.endpoints.json_placeholder import Default
+from framework_api.circuit import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakers,
+)
+from framework_api.client import APIError, ApiClient, CircuitOpenError
+from framework_api.pool import SessionPool
+from framework_api.request_spec import RequestSpec
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def test_opens_after_threshold_and_recovers():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.1)
+    breaker.on_failure()
+    assert breaker.state == CLOSED
+    breaker.on_failure()
+    assert breaker.state == OPEN
+    assert breaker.allow() > 0
+
+    time.sleep(0.12)
+    assert breaker.allow() is None
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() == 0.0  # only one trial call in half-open
+    breaker.on_success()
+    assert breaker.state == CLOSED
+    assert breaker.rejected == 2
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=0)
+    for _ in range(3):
+        breaker.on_failure()
+    assert breaker.allow() is None
+    breaker.on_failure()
+    assert breaker.state == OPEN
+
+
+def test_late_failures_and_lost_trials():
+    """
+    Failures reported while open do not extend the outage; a trial that
+    never reports back is released or written off after recovery_timeout
+    """
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
+    breaker.on_failure()
+    opened_at = breaker.opened_at
+    breaker.on_failure()
+    assert breaker.opened_at == opened_at
+
+    time.sleep(0.12)
+    assert breaker.allow() is None
+    breaker.release()
+    assert breaker.allow() is None  # the released slot is free again
+    assert breaker.allow() == 0.0
+    time.sleep(0.12)
+    assert breaker.allow() is None  # the lost trial was written off
+
+
+def test_key_folds_ids_into_template():
+    key = CircuitBreakers.make_key
+    assert key("get", "http://H:1/posts/1/comments") == "GET h:1/posts/{}/comments"
+    assert key("GET", "http://h/posts/2") == key("GET", "http://h/posts/3")
+    assert key("GET", "http://h/posts/2", "/posts/{id}") == "GET h/posts/{}"
+    assert key("GET", "http://h/posts") != key("DELETE", "http://h/posts")
+
+
+def test_client_fails_fast_when_open(default: Default):
+    """
+    After the threshold the client raises CircuitOpenError without sending
+    """
+    routes = {"GET /posts/1": [(503, {}, None)], "GET /posts": [(200, {}, [])]}
+    breakers = CircuitBreakers(failure_threshold=2, recovery_timeout=60)
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_id_get, server.url, {"id": 1})
+        for _ in range(2):
+            with pytest.raises(APIError) as error:
+                ApiClient(
+                    point, validate_response=True, circuit_breakers=breakers
+                ).request()
+            assert error.value.status_code == 503
+
+        spec = RequestSpec.from_endpoint(default.posts_id_get, server.url, {"id": 7})
+        with pytest.raises(CircuitOpenError) as error:
+            ApiClient(spec, circuit_breakers=breakers).request()
+
+        # other endpoints are not affected
+        posts = endpoint_helper(default.posts_get, server.url)
+        assert ApiClient(posts, circuit_breakers=breakers).request() == []
+
+    assert len(server.requests) == 3
+    assert error.value.retry_in > 59
+    assert breakers.states()[f"GET {server.url[7:]}/posts/{{}}"] == OPEN
+
+
+def test_connection_errors_count_as_failures(default: Default):
+    with LocalServer() as server:
+        url = server.url
+    point = endpoint_helper(default.posts_get, url)
+    breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=60)
+
+    with pytest.raises(APIError) as error:
+        ApiClient(point, timeout=1, circuit_breakers=breakers).request()
+    assert not isinstance(error.value, CircuitOpenError)
+    with pytest.raises(CircuitOpenError):
+        ApiClient(point, timeout=1, circuit_breakers=breakers).request()
+
+
+def test_interrupted_trial_is_released(default: Default, monkeypatch):
+    """
+    A half-open trial interrupted by a non-HTTP error does not leave the
+    breaker rejecting every later call
+    """
+    breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=0)
+    with LocalServer({"GET /posts": [(200, {}, [])]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        breaker = breakers.get(CircuitBreakers.make_key("GET", point.endpoint))
+        breaker.on_failure()
+        # own pool: the patched session must not serve the next client
+        client = ApiClient(point, circuit_breakers=breakers, pool=SessionPool())
+
+        def interrupted(**kwargs):
+            raise RuntimeError("interrupted")
+
+        monkeypatch.setattr(client.session, "request", interrupted)
+        with pytest.raises(RuntimeError):
+            client._send(client._request_kwargs())
+        assert breaker.state == HALF_OPEN
+
+        assert ApiClient(point, circuit_breakers=breakers).request() == []
+    assert breaker.state == CLOSED
@@ -0,0 +1,93 @@
+import sys
+
+import pytest
+
+from api.endpoints.json_placeholder import Default, Posts_Id_Patch_Body, Posts_Post_Body
+from framework_api import codec as codec_module
+from framework_api.client import ApiClient
+from framework_api.codec import (
+    EncodedBody,
+    JsonCodec,
+    encode_body,
+    get_codec,
+    to_payload,
+)
+from framework_api.request_spec import RequestSpec
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+@pytest.mark.parametrize("name", ["stdlib", "orjson", "msgspec"])
+def test_codec_roundtrip(name):
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    data = {"title": "тест", "ids": [1, 2.5, None, True]}
+
+    assert codec.loads(codec.dumps(data)) == data
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_auto_falls_back_to_stdlib(monkeypatch):
+    """
+    auto skips backends that cannot be imported
+    """
+    monkeypatch.setattr(codec_module, "_instances", {})
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+
+    assert type(get_codec("auto")) is JsonCodec
+
+
+@pytest.mark.parametrize("name", ["stdlib", "auto"])
+def test_client_encodes_and_decodes_with_codec(default: Default, name):
+    routes = {"POST /posts": [(201, {}, {"id": 101, "title": "foo"})]}
+    with LocalServer(routes) as server:
+        client = ApiClient(endpoint_helper(default.posts_post, server.url), codec=name)
+        client.data = Posts_Post_Body(title="foo", body="bar", userId=1)
+        data = client.request()
+
+    _, _, headers, raw = server.requests[0]
+    assert data == {"id": 101, "title": "foo"}
+    assert headers["Content-Type"] == "application/json"
+    assert client.codec.loads(raw) == {"title": "foo", "body": "bar", "userId": 1}
+
+
+def test_generated_to_dict_omits_none():
+    patch = Posts_Id_Patch_Body(title="patched")
+
+    assert to_payload(patch) == {"title": "patched"}
+    assert to_payload(patch, omit_none=False) == {
+        "title": "patched",
+        "body": None,
+        "userId": None,
+    }
+    assert to_payload(Posts_Id_Patch_Body) == {}
+
+
+class CountingCodec(JsonCodec):
+    def __init__(self):
+        self.dumped = 0
+
+    def dumps(self, obj):
+        self.dumped += 1
+        return super().dumps(obj)
+
+
+def test_encoded_body_is_reused(default: Default):
+    """
+    A pre-encoded body is serialized once and sent byte-for-byte each time
+    """
+    codec = CountingCodec()
+    encoded = encode_body(Posts_Post_Body("foo", "bar", 1), codec)
+    routes = {"POST /posts": [(201, {}, {"id": 101})]}
+    with LocalServer(routes) as server:
+        spec = RequestSpec.from_endpoint(default.posts_post, server.url, body=encoded)
+        for _ in range(3):
+            ApiClient(spec, codec=codec).request()
+
+    assert isinstance(encoded, EncodedBody)
+    assert codec.dumped == 1
+    assert {raw for _, _, _, raw in server.requests} == {encoded.content}
+    assert server.requests[0][2]["Content-Type"] == "application/json"
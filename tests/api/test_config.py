@@ -0,0 +1,73 @@
+import os
+import shutil
+
+import pytest
+
+from framework_api import config as config_module
+from framework_api.config import SNAPSHOT_ENV, ConfigManager, clear_config_cache
+
+
+@pytest.fixture()
+def config_file(tmp_path, monkeypatch):
+    """Private copy of the test config and an empty config cache"""
+    monkeypatch.delenv(SNAPSHOT_ENV, raising=False)
+    clear_config_cache()
+    path = tmp_path / "test.yaml"
+    shutil.copy("./configs/test.yaml", path)
+    yield path
+    clear_config_cache()
+
+
+@pytest.fixture()
+def parses(monkeypatch):
+    """Counts config files actually parsed"""
+    calls = []
+    parse = config_module._parse_config
+
+    def counting(path):
+        calls.append(path)
+        return parse(path)
+
+    monkeypatch.setattr(config_module, "_parse_config", counting)
+    return calls
+
+
+def test_config_cached_until_file_changes(config_file, parses):
+    """
+    Repeated loads reuse the parsed config; an edit invalidates it
+    """
+    first = ConfigManager(str(config_file))
+    first.config.api.timeout = 1
+    second = ConfigManager(str(config_file))
+
+    assert len(parses) == 1
+    assert second.config.api.timeout != 1  # each manager has its own copy
+
+    text = config_file.read_text(encoding="utf-8")
+    config_file.write_text(text.replace("name: test", "name: edited"), "utf-8")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    assert ConfigManager(str(config_file)).config.name == "edited"
+    assert len(parses) == 2
+
+
+def test_snapshot_used_only_for_matching_file(
+    config_file, parses, tmp_path, monkeypatch
+):
+    """
+    A fresh process loads the snapshot instead of parsing, unless the
+    source file changed after the snapshot was taken
+    """
+    snapshot = ConfigManager(str(config_file)).write_snapshot(tmp_path / "snap.json")
+    monkeypatch.setenv(SNAPSHOT_ENV, str(snapshot))
+    clear_config_cache()
+    loaded = ConfigManager(str(config_file)).config
+    assert len(parses) == 1
+    assert loaded.api.base_portal
+
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    clear_config_cache()
+    ConfigManager(str(config_file))
+    assert len(parses) == 2
@@ -0,0 +1,230 @@
+import copy
+from pathlib import Path
+
+import yaml
+
+from api.models import endpoint_generator as generator
+
+SPEC = {
+    "openapi": "3.0.0",
+    "paths": {
+        "/posts": {
+            "post": {
+                "tags": ["Posts"],
+                "requestBody": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/Post"}
+                        }
+                    }
+                },
+            }
+        },
+        "/users": {
+            "get": {
+                "tags": ["Users"],
+                "summary": "List users",
+                "x-pagination": {"cursor_param": "after", "style": "cursor"},
+            }
+        },
+    },
+    "components": {
+        "schemas": {
+            "Post": {
+                "type": "object",
+                "required": ["title"],
+                "properties": {"title": {"type": "string"}},
+            }
+        }
+    },
+}
+
+
+def test_incremental_regenerates_only_changed_classes():
+    """
+    Only classes whose operations or referenced schemas changed are
+    regenerated, and the result always equals a full generation
+    """
+    code, manifest, changed = generator.generate_incremental(SPEC)
+    assert code == generator.generate(SPEC)
+    assert changed == ["Posts", "Users"]
+    assert '{"cursor_param": "after", "style": "cursor"}' in code
+    assert "\n\n\n@dataclass\nclass Users:" in code
+
+    _, manifest, changed = generator.generate_incremental(SPEC, manifest)
+    assert changed == []
+
+    spec = copy.deepcopy(SPEC)
+    spec["paths"]["/users"]["get"]["summary"] = "All users"
+    code, manifest, changed = generator.generate_incremental(spec, manifest)
+    assert changed == ["Users"]
+    assert code == generator.generate(spec)
+
+    spec["components"]["schemas"]["Post"]["properties"]["body"] = {"type": "string"}
+    code, _, changed = generator.generate_incremental(spec, manifest)
+    assert changed == ["Posts"]
+    assert code == generator.generate(spec)
+
+
+def test_incremental_matches_full_build_for_cyclic_schemas():
+    """
+    A class rebuilt alone resolves mutually recursive schemas exactly as
+    the full build does
+    """
+
+    def operation(tag, schema):
+        ref = {"$ref": f"#/components/schemas/{schema}"}
+        return {
+            "post": {
+                "tags": [tag],
+                "summary": tag,
+                "requestBody": {"content": {"application/json": {"schema": ref}}},
+            }
+        }
+
+    def obj(name, target):
+        ref = {"$ref": f"#/components/schemas/{target}"}
+        return {name: {"type": "object", "properties": {target.lower(): ref}}}
+
+    spec = {
+        "openapi": "3.0.0",
+        "paths": {"/x": operation("X", "A"), "/y": operation("Y", "B")},
+        "components": {"schemas": {**obj("A", "B"), **obj("B", "A")}},
+    }
+    _, manifest, _ = generator.generate_incremental(spec)
+
+    spec["paths"]["/y"]["post"]["summary"] = "changed"
+    code, _, changed = generator.generate_incremental(spec, manifest)
+
+    assert changed == ["Y"]
+    assert code == generator.generate(spec)
+    assert "    a: dict = None" in code
+
+
+def test_generated_module_is_up_to_date():
+    """
+    json_placeholder.py and endpoint.py are exactly what the generator emits
+    """
+    models = Path(generator.__file__).parent
+    endpoints = models.parent / "endpoints"
+    generated = generator.main(models / "json_placeholder.yaml")
+
+    assert generated == (endpoints / "json_placeholder.py").read_text("utf-8")
+    assert generator.generate_endpoint_class() == (endpoints / "endpoint.py").read_text(
+        "utf-8"
+    )
+
+
+def test_build_skips_identical_writes(tmp_path):
+    """
+    An unchanged spec leaves the module untouched; a hand-edited module
+    makes the manifest untrusted and is regenerated in full
+    """
+    spec_file = tmp_path / "api.yaml"
+    spec_file.write_text(yaml.safe_dump(SPEC), encoding="utf-8")
+    pyfile = tmp_path / "api.py"
+
+    assert generator.build(spec_file, pyfile) == ["Posts", "Users"]
+    mtime = pyfile.stat().st_mtime_ns
+    assert generator.build(spec_file, pyfile) == []
+    assert pyfile.stat().st_mtime_ns == mtime
+
+    pyfile.write_text("# edited\n", encoding="utf-8")
+    assert generator.build(spec_file, pyfile) == ["Posts", "Users"]
+    assert pyfile.read_text(encoding="utf-8") == generator.generate(SPEC)
+
+
+def test_resolver_follows_nested_refs_all_of_and_cycles(monkeypatch):
+    """
+    Nested refs and allOf are resolved, recursion ends at the cycle and
+    components are looked up through the index, each resolved once
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Base": {
+                    "type": "object",
+                    "required": ["id"],
+                    "properties": {"id": {"type": "integer"}},
+                },
+                "Author": {
+                    "type": "object",
+                    "properties": {"name": {"type": "string"}},
+                },
+                "Node": {
+                    "type": "object",
+                    "properties": {"child": {"$ref": "#/components/schemas/Node"}},
+                },
+                "Post": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Base"},
+                        {
+                            "required": ["title"],
+                            "properties": {
+                                "title": {"type": "string"},
+                                "author": {"$ref": "#/components/schemas/Author"},
+                                "tree": {"$ref": "#/components/schemas/Node"},
+                            },
+                        },
+                    ]
+                },
+            }
+        }
+    }
+    walks = []
+    walk = generator.resolve_schema_ref
+    monkeypatch.setattr(
+        generator, "resolve_schema_ref", lambda *a: walks.append(a) or walk(*a)
+    )
+    resolver = generator.SchemaResolver(spec)
+
+    post = resolver.resolve({"$ref": "#/components/schemas/Post"})
+    assert post["required"] == ["id", "title"]
+    assert list(post["properties"]) == ["id", "title", "author", "tree"]
+    assert post["properties"]["author"]["properties"]["name"] == {"type": "string"}
+    tree = post["properties"]["tree"]
+    assert tree["properties"]["child"] == {"$ref": "#/components/schemas/Node"}
+    assert resolver.resolve({"$ref": "#/components/schemas/Post"}) is post
+    assert walks == []
+    assert resolver.dependencies({"$ref": "#/components/schemas/Post"}) == [
+        "#/components/schemas/Author",
+        "#/components/schemas/Base",
+        "#/components/schemas/Node",
+        "#/components/schemas/Post",
+    ]
+
+    body = {"content": {"application/json": {"schema": post}}}
+    fields = generator.extract_body_fields(body, spec, resolver)
+    assert [(f["name"], f["type"], f["required"]) for f in fields] == [
+        ("id", "int", True),
+        ("title", "str", True),
+        ("author", "dict", False),
+        ("tree", "dict", False),
+    ]
+
+    # mutual recursion: a ref resolves the same whichever side came first
+    cyclic = {
+        "components": {
+            "schemas": {
+                "A": {
+                    "type": "object",
+                    "properties": {"b": {"$ref": "#/components/schemas/B"}},
+                },
+                "B": {
+                    "type": "object",
+                    "properties": {"a": {"$ref": "#/components/schemas/A"}},
+                },
+            }
+        }
+    }
+    a_ref, b_ref = ({"$ref": f"#/components/schemas/{n}"} for n in "AB")
+    a_first = generator.SchemaResolver(cyclic)
+    b_first = generator.SchemaResolver(cyclic)
+    a_first.resolve(a_ref)
+    assert a_first.resolve(b_ref) == b_first.resolve(b_ref)
+    assert a_first.resolve(a_ref) == b_first.resolve(a_ref)
+    b = b_first.resolve(b_ref)
+    assert b["properties"]["a"]["properties"]["b"] == b_ref
+    body = {"content": {"application/json": {"schema": b_ref}}}
+    fields = generator.extract_body_fields(body, cyclic, a_first)
+    assert [(f["name"], f["type"]) for f in fields] == [("a", "dict")]
@@ -0,0 +1,51 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+# generous: cold imports on a loaded CI runner; the module checks are the gate
+BUDGET = 1.0
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+print(json.dumps([time.perf_counter() - started, sorted(sys.modules)]))
+"""
+
+
+def _import(module: str):
+    """Seconds to import module in a fresh interpreter, modules loaded by then"""
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    elapsed, modules = json.loads(out.stdout)
+    return elapsed, {name.partition(".")[0] for name in modules}
+
+
+@pytest.mark.parametrize(
+    "module, deferred",
+    [
+        ("framework.element", {"playwright"}),
+        ("framework.driver_factory", {"playwright"}),
+        ("framework_api.config", {"dotenv", "yaml", "niquests", "playwright"}),
+        ("framework_api.report", {"niquests", "pydantic", "playwright"}),
+        ("framework_api.client", {"dotenv", "yaml", "playwright"}),
+    ],
+)
+def test_import_defers_heavy_dependencies(module, deferred):
+    """
+    Importing a framework module does not load dependencies it only needs
+    on first use, and stays within the import-time budget
+    """
+    elapsed, loaded = _import(module)
+
+    assert not deferred & loaded
+    assert elapsed < BUDGET
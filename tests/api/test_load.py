@@ -0,0 +1,123 @@
+import time
+
+from api.endpoints.json_placeholder import Default
+from framework_api.histogram import LatencyHistogram
+from framework_api.load import (
+    LoadProfile,
+    run_load,
+    run_load_multiprocess,
+    shard_profile,
+    targets_from_names,
+)
+from framework_api.mock_server import MockServer
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def test_histogram_percentiles_and_merge():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record_many(n / 1000 for n in range(1, 501))
+    second.record_many(n / 1000 for n in range(501, 1001))
+
+    merged = LatencyHistogram().merge(first).merge(second)
+    restored = LatencyHistogram.from_dict(merged.to_dict())
+
+    assert merged.count == 1000
+    assert abs(merged.percentile(50) - 0.5) < 0.5 * 0.001
+    assert abs(merged.percentile(99.9) - 0.999) < 0.999 * 0.001
+    assert restored.summary() == merged.summary()
+
+
+def test_open_loop_run_against_mock(default: Default, mock_server: MockServer):
+    """
+    Target rate is held and every request succeeds against the stand-in
+    """
+    profile = LoadProfile(
+        targets=targets_from_names(
+            default, mock_server.url, ["posts_get", "posts_id_get:id=1"]
+        ),
+        rate=200,
+        duration=0.5,
+    )
+
+    result = run_load(profile)
+    report = result.report()
+
+    assert result.sent == 100
+    assert report["error_rate"] == 0
+    assert 0 < report["latency"]["p50"] <= report["latency"]["p99.9"]
+
+
+def test_queueing_delay_is_counted(default: Default):
+    """
+    With one worker and a slow server, latency from the intended start
+    grows while service time stays flat (no coordinated omission)
+    """
+
+    def slow(handler):
+        time.sleep(0.02)
+        return []
+
+    with LocalServer({"GET /posts": [(200, {}, slow)]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        profile = LoadProfile([point], rate=200, duration=0.1, max_workers=1)
+        result = run_load(profile)
+
+    assert result.sent == 20
+    assert result.service_time.percentile(99) < 0.1
+    assert result.latency.percentile(99) > 0.2
+
+
+def test_shards_reproduce_schedule(default: Default):
+    a, b, c = targets_from_names(
+        default, "http://h", ["posts_get", "posts_id_get:id=1", "posts_id_get:id=2"]
+    )
+    profile = LoadProfile([a, b, c], rate=300, duration=1, weights=[3, 2, 1])
+
+    shards = shard_profile(profile, 4)
+
+    assert [shard.rate for shard in shards] == [75] * 4
+    combined = [shards[n % 4].schedule()[n // 4 % 6] for n in range(24)]
+    assert combined == profile.schedule() * 4
+
+
+def test_shards_keep_the_remainder(default: Default):
+    """
+    Requests that do not divide evenly go to the first shards, none are lost
+    """
+    point = targets_from_names(default, "http://h", ["posts_get"])
+    profile = LoadProfile(point, rate=10, duration=1)
+
+    shards = shard_profile(profile, 3)
+
+    assert [shard.total for shard in shards] == [4, 3, 3]
+    assert sum(shard.total for shard in shards) == profile.total == 10
+
+
+def test_total_survives_float_error(default: Default):
+    """
+    rate * duration is rounded, not truncated: 0.57 * 100 is just under 57
+    """
+    point = targets_from_names(default, "http://h", ["posts_get"])
+
+    assert LoadProfile(point, rate=0.57, duration=100).total == 57
+
+
+def test_multiprocess_run_merges_workers(default: Default, mock_server: MockServer):
+    """
+    Shards run in two processes; counts and histograms add up exactly
+    """
+    profile = LoadProfile(
+        targets=targets_from_names(default, mock_server.url, ["posts_id_get:id=1"]),
+        rate=400,
+        duration=1.0,
+    )
+    snapshots = []
+
+    result = run_load_multiprocess(
+        profile, processes=2, on_progress=snapshots.append, progress_interval=0.2
+    )
+
+    assert result.sent == 400
+    assert result.errors == 0
+    assert result.latency.count == result.service_time.count == 400
+    assert snapshots and all(s.sent <= 400 for s in snapshots)
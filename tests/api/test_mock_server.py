@@ -0,0 +1,83 @@
+import niquests
+import pytest
+
+from api.endpoints.json_placeholder import Default, Posts_Post_Body
+from framework_api.client import APIError, ApiClient
+from tests.api.helper import endpoint_helper
+
+
+def test_mock_crud_roundtrip(default: Default, mock_host: str):
+    """
+    Created post is readable, patchable and deletable
+    """
+    create = ApiClient(endpoint_helper(default.posts_post, mock_host))
+    create.data = Posts_Post_Body(title="foo", body="bar", userId=7)
+    created = create.request()
+    path = {"id": created["id"]}
+
+    patch = ApiClient(endpoint_helper(default.posts_id_patch, mock_host, path))
+    patch.data = {"title": "patched"}
+    patched = patch.request()
+    ApiClient(endpoint_helper(default.posts_id_delete, mock_host, path)).request()
+    missing = ApiClient(
+        endpoint_helper(default.posts_id_get, mock_host, path), validate_response=True
+    )
+
+    assert patched == {
+        "id": created["id"],
+        "title": "patched",
+        "body": "bar",
+        "userId": 7,
+    }
+    with pytest.raises(APIError) as error:
+        missing.request()
+    assert error.value.status_code == 404
+
+
+def test_mock_rejects_invalid_body(default: Default, mock_host: str):
+    """
+    Request schema is enforced: missing required fields give 400
+    """
+    client = ApiClient(
+        endpoint_helper(default.posts_post, mock_host), validate_response=True
+    )
+    client.data = {"title": "only title"}
+
+    with pytest.raises(APIError) as error:
+        client.request()
+
+    assert error.value.status_code == 400
+    assert "userId: required" in error.value.message
+
+
+def test_mock_nested_and_filtered_collections(default: Default, mock_host: str):
+    """
+    /posts/{id}/comments is scoped to the post, query params filter lists
+    """
+    comments = ApiClient(
+        endpoint_helper(default.posts_id_comments_get, mock_host, {"id": 3})
+    ).request()
+    posts = ApiClient(endpoint_helper(default.posts_get, mock_host))
+    posts.params = {"userId": 1}
+
+    assert comments and {c["postId"] for c in comments} == {3}
+    assert all(post["userId"] == 1 for post in posts.request())
+
+
+def test_mock_rejects_bad_paging_and_non_object_bodies(mock_host: str):
+    """
+    Malformed paging and non-object JSON bodies are 400s, HEAD mirrors GET
+    """
+    session = niquests.Session()
+    try:
+        for query in ("_limit=x", "_page=abc", "_page=0", "_limit=0"):
+            resp = session.get(f"{mock_host}/posts?{query}")
+            assert resp.status_code == 400, query
+        assert session.post(f"{mock_host}/posts", json=[1, 2]).status_code == 400
+        assert session.put(f"{mock_host}/posts/1", json="x").status_code == 400
+
+        head = session.head(f"{mock_host}/posts/1")
+        assert head.status_code == 200 and head.content == b""
+        assert session.get(f"{mock_host}/posts?_page=2&_limit=3").json()[0]["id"] == 4
+    finally:
+        session.close()
@@ -0,0 +1,130 @@
+import json
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from api.endpoints.json_placeholder import Default
+from framework_api.client import APIError, ApiClient
+from framework_api.mock_server import MockServer
+from framework_api.pagination import Pagination, iter_pages
+from framework_api.request_spec import RequestSpec
+
+
+class Post(BaseModel):
+    id: int
+    title: str
+
+
+@pytest.fixture()
+def many_posts(mock_server: MockServer, mock_host: str) -> str:
+    """25 posts on the mock server"""
+    for n in range(15):
+        body = json.dumps({"title": f"t{n}", "body": "b", "userId": 2}).encode()
+        mock_server.api.handle("POST", "/posts", body)
+    return mock_host
+
+
+def test_generated_endpoint_has_pagination(default: Default):
+    config = Pagination.from_dict(default.posts_get.pagination)
+    assert config.page_param == "_page"
+    assert config.limit == 10
+    assert default.posts_id_get.pagination is None
+
+
+def test_page_style_walks_all_pages(default: Default, many_posts: str):
+    spec = RequestSpec.from_endpoint(default.posts_get, many_posts)
+    client = ApiClient(spec, schema=list[Post], validate_response=True)
+
+    posts = list(client.paginate(prefetch=0))
+
+    assert [post["id"] for post in posts] == list(range(1, 26))
+    assert len(client.timings) == 3  # the short third page ends the walk
+
+
+def test_prefetch_keeps_order_and_filters(default: Default, many_posts: str):
+    spec = RequestSpec.from_endpoint(default.posts_get, many_posts, query={"userId": 2})
+    client = ApiClient(spec)
+
+    posts = list(client.paginate(prefetch=3))
+
+    assert [post["id"] for post in posts] == list(range(11, 26))
+    # pages requested ahead of the end are bounded by prefetch
+    assert 2 <= len(client.timings) <= 2 + 3
+
+
+def test_page_error_is_raised(default: Default, mock_host: str):
+    spec = RequestSpec.from_endpoint(default.posts_get, mock_host + "/missing")
+    with pytest.raises(APIError):
+        next(ApiClient(spec, validate_response=True).paginate())
+
+
+def test_endpoint_without_pagination(default: Default, mock_host: str):
+    spec = RequestSpec.from_endpoint(
+        default.posts_id_comments_get, mock_host, {"id": 1}
+    )
+    with pytest.raises(ValueError):
+        next(ApiClient(spec).paginate())
+
+
+def cursor_api(pages: int, size: int = 3, delay: float = 0.0):
+    """fetch() serving `pages` cursor pages of `size` numbers"""
+    calls = []
+
+    def fetch(params):
+        calls.append(dict(params))
+        time.sleep(delay)
+        n = int(params.get("cursor", 0))
+        body = {"data": {"items": list(range(n * size, (n + 1) * size))}}
+        if n + 1 < pages:
+            body["meta"] = {"next": str(n + 1)}
+        return body
+
+    return fetch, calls
+
+
+CURSOR = Pagination(style="cursor", items="data.items", next_cursor="meta.next")
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_cursor_style(prefetch: int):
+    fetch, calls = cursor_api(pages=4)
+
+    pages = list(iter_pages(fetch, CURSOR, prefetch=prefetch))
+
+    assert sum(pages, []) == list(range(12))
+    assert [c.get("cursor") for c in calls] == [None, "1", "2", "3"]
+
+
+def test_cursor_read_ahead_is_bounded():
+    fetch, calls = cursor_api(pages=50)
+    pages = iter_pages(fetch, CURSOR, prefetch=2)
+
+    assert next(pages) == [0, 1, 2]
+    time.sleep(0.2)
+    # the current page, two queued ones and one waiting to be queued
+    assert len(calls) <= 4
+    pages.close()
+    time.sleep(0.2)
+    assert len(calls) <= 5
+    assert not [t for t in threading.enumerate() if t.name == "cursor-page"]
+
+
+def test_cursor_error_reaches_consumer():
+    def fetch(params):
+        if params.get("cursor"):
+            raise RuntimeError("boom")
+        return {"items": [1], "next_cursor": "x"}
+
+    pages = iter_pages(fetch, Pagination(style="cursor", items="items"), prefetch=1)
+    assert next(pages) == [1]
+    with pytest.raises(RuntimeError):
+        next(pages)
+
+
+def test_bad_config():
+    with pytest.raises(ValueError):
+        Pagination.from_dict({"style": "offset"})
+    with pytest.raises(ValueError):
+        Pagination.from_dict({"pages": 3})
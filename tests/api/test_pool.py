@@ -0,0 +1,82 @@
+import time
+
+from api.endpoints.endpoint import Endpoint
+from api.endpoints.json_placeholder import Default
+from framework_api.client import ApiClient
+from framework_api.pool import SessionPool
+from framework_api.request_spec import RequestSpec
+
+
+def test_clients_for_same_host_share_session(api_client, session_pool: SessionPool):
+    """
+    Two clients for one host borrow the same keep-alive session
+    """
+    first = api_client(Endpoint("GET", "https://example.test/posts"))
+    second = api_client(Endpoint("GET", "https://example.test/posts/1"))
+
+    assert first.session is second.session
+    assert first.pool is session_pool
+
+
+def test_different_headers_get_own_session():
+    """
+    Header set is part of the session key
+    """
+    pool = SessionPool()
+    plain = ApiClient(Endpoint("GET", "https://example.test/posts"), pool=pool)
+    tagged = ApiClient(
+        Endpoint("GET", "https://example.test/posts"),
+        headers={"X-Trace": "1"},
+        pool=pool,
+    )
+
+    assert plain.session is not tagged.session
+    assert len(pool) == 2
+    pool.close()
+    assert len(pool) == 0
+
+
+def test_idle_sessions_are_evicted():
+    """
+    Sessions unused for longer than idle_timeout are closed and dropped
+    """
+    pool = SessionPool(idle_timeout=0.01)
+    session = pool.acquire("https://example.test/posts")
+    time.sleep(0.02)
+
+    assert pool.evict_idle() == 1
+    assert pool.acquire("https://example.test/posts") is not session
+    pool.close()
+
+
+def test_borrowed_sessions_are_not_evicted():
+    """
+    A session held through borrow() outlives idle_timeout until released
+    """
+    pool = SessionPool(idle_timeout=0.01)
+    with pool.borrow("https://example.test/posts") as session:
+        time.sleep(0.02)
+        assert pool.evict_idle() == 0
+        assert pool.acquire("https://example.test/posts") is session
+    time.sleep(0.02)
+
+    assert pool.evict_idle() == 1
+    pool.close()
+
+
+def test_open_paginate_keeps_session(default: Default, mock_host: str):
+    """
+    Idle eviction leaves alone the session of a paged walk still in progress
+    """
+    pool = SessionPool(idle_timeout=0.01)
+    spec = RequestSpec.from_endpoint(default.posts_get, mock_host)
+    client = ApiClient(spec, pool=pool)
+    pages = client.paginate(prefetch=0)
+    next(pages)
+    time.sleep(0.02)
+
+    assert pool.evict_idle() == 0
+    assert len(list(pages)) == 9
+    time.sleep(0.02)
+    assert pool.evict_idle() == 1
+    pool.close()
@@ -0,0 +1,96 @@
+import threading
+import time
+
+from api.endpoints.json_placeholder import Default
+from framework_api.client import ApiClient
+from framework_api.rate_limit import RateLimiter, TokenBucket
+from framework_api.retry import RetryPolicy
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def test_burst_then_steady_rate():
+    """
+    A full bucket serves `burst` requests at once, the rest are spaced at `rate`
+    """
+    bucket = TokenBucket(rate=50, burst=5)
+    started = time.monotonic()
+    for _ in range(10):
+        bucket.acquire()
+    elapsed = time.monotonic() - started
+
+    # 5 from the burst, 5 more at 50/s take ~0.1s
+    assert 0.08 <= elapsed < 0.5
+
+
+def test_throttle_halves_rate_and_ramps_back():
+    bucket = TokenBucket(rate=100, burst=1, min_rate=10, increase=10)
+    bucket.on_throttle()
+    assert bucket.rate == 50
+    assert bucket.throttled == 1
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 100
+
+    for _ in range(10):
+        bucket.on_throttle()
+    assert bucket.rate == 10
+
+
+def test_retry_after_blocks_bucket():
+    bucket = TokenBucket(rate=1000, burst=10)
+    bucket.on_throttle(retry_after=0.2)
+    assert bucket.try_acquire() > 0.1
+    assert bucket.acquire() >= 0.15
+
+
+def test_buckets_are_per_host():
+    limiter = RateLimiter(rate=10, burst=2, per_host={"slow.example:8080": 1})
+    a = limiter.bucket("http://API.example/posts")
+    assert a is limiter.bucket("https://api.example/users?id=1")
+    assert limiter.bucket("http://slow.example:8080/x").rate == 1
+    assert a.rate == 10
+
+
+def test_shared_by_threads():
+    """
+    Concurrent callers never exceed burst + rate * elapsed grants
+    """
+    bucket = TokenBucket(rate=100, burst=5)
+    granted = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(5):
+            bucket.acquire()
+            with lock:
+                granted.append(time.monotonic())
+
+    started = time.monotonic()
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = max(granted) - started
+
+    assert len(granted) == 30
+    assert elapsed >= (30 - 5) / 100 * 0.9
+
+
+def test_client_backs_off_on_429(default: Default):
+    """
+    A 429 slows the host's bucket and the retry waits for Retry-After
+    """
+    routes = {"GET /posts": [(429, {"Retry-After": "0"}, None), (200, {}, [])]}
+    limiter = RateLimiter(rate=200, burst=1)
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        retry = RetryPolicy(retry_count=1, retry_delay=0, jitter=False)
+        client = ApiClient(point, retry=retry, rate_limiter=limiter)
+
+        assert client.request() == []
+        bucket = limiter.bucket(server.url)
+
+    assert len(server.requests) == 2
+    assert bucket.throttled == 1
+    assert bucket.rate == 100 + bucket.increase
@@ -0,0 +1,128 @@
+import json
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+
+import pytest
+
+from api.endpoints.json_placeholder import Default
+from framework_api.client import APIError, ApiClient
+from framework_api.report import (
+    ReportPlugin,
+    ReportWriter,
+    iter_records,
+    render_html,
+    render_junit,
+    summarize,
+    worker_stream,
+)
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def test_request_records_streamed_with_truncated_body(default: Default, tmp_path):
+    """
+    Every attempt is appended as one JSON line; bodies are cut at
+    max_body_bytes and secrets are redacted
+    """
+    body = [{"id": i, "title": "x" * 50} for i in range(20)]
+    writer = ReportWriter(
+        tmp_path / "report.jsonl", include_response_body=True, max_body_bytes=64
+    )
+    with LocalServer({"GET /posts": [(200, {}, body)]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        client = ApiClient(
+            point, headers={"Authorization": "Bearer secret"}, reporter=writer
+        )
+        client.request()
+        client.request()
+    writer.close()
+
+    lines = (tmp_path / "report.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2 == writer.counts["request"]
+    record = json.loads(lines[0])
+    assert record["type"] == "request"
+    assert record["method"] == "GET" and record["status"] == 200
+    assert len(record["response_body"].encode()) == 64
+    assert record["response_body_size"] == len(json.dumps(body))
+    assert record["request_headers"]["Authorization"] == "***"
+    assert "ts" in record
+
+
+def test_failed_attempts_reported(default: Default, tmp_path):
+    """
+    Attempts that got no response are in the report with their error
+    and count as request errors
+    """
+    writer = ReportWriter(tmp_path / "report.jsonl")
+    point = endpoint_helper(default.posts_get, "http://127.0.0.1:1")
+    client = ApiClient(point, headers={"Authorization": "Bearer x"}, reporter=writer)
+    with pytest.raises(APIError):
+        client.request()
+    writer.close()
+
+    [record] = iter_records(writer.path, "request")
+    assert record["status"] == -1
+    assert record["error"].startswith("ConnectionError")
+    assert record["request_headers"]["Authorization"] == "***"
+    assert summarize(writer.path)["request_errors"] == 1
+    page = render_html(writer.path, tmp_path / "report.html").read_text("utf-8")
+    assert "ConnectionError" in page
+
+
+def test_report_rendered_from_stream(tmp_path):
+    """
+    HTML and JUnit XML are built from the JSON-lines file alone
+    """
+    source = tmp_path / "report.jsonl"
+    with ReportWriter(source, include_timestamps=False) as writer:
+        writer.record_test("tests/api/test_a.py::test_ok", "passed", 0.1)
+        writer.record_test(
+            "tests/api/test_a.py::test_bad", "failed", 0.2, "E  boom\x1b[0m"
+        )
+        writer.record_test("tests/api/test_a.py::test_skip", "skipped", 0.0, "why")
+        writer.record_test("tests/api/test_b.py::test_setup", "error", 0.0, "fixture")
+    with source.open("a", encoding="utf-8") as stream:
+        stream.write('{"type": "test", "nodeid": "torn')  # interrupted run
+
+    assert len(list(iter_records(source, "test"))) == 4
+    assert summarize(source)["failed"] == 1
+
+    suite = ET.parse(render_junit(source, tmp_path / "junit.xml")).find("testsuite")
+    assert suite.attrib["tests"] == "4"
+    assert suite.attrib["failures"] == "1"
+    assert suite.attrib["errors"] == "1"
+    assert suite.attrib["skipped"] == "1"
+    failed = suite.find("testcase[@name='test_bad']")
+    assert failed.attrib["classname"] == "tests.api.test_a"
+    assert failed.find("failure").attrib["message"] == "E  boom\ufffd[0m"
+
+    page = render_html(source, tmp_path / "report.html").read_text(encoding="utf-8")
+    assert "test_bad" in page and "boom" in page
+
+
+def _phase(nodeid, when, outcome="passed", longrepr=None):
+    return SimpleNamespace(
+        nodeid=nodeid, when=when, outcome=outcome, duration=0.1, longrepr=longrepr
+    )
+
+
+def test_plugin_records_one_result_per_test_and_merges_workers(tmp_path):
+    """
+    A teardown error after a passed call is one "error" record; request
+    streams of xdist workers are merged into the controller's report
+    """
+    main = tmp_path / "report.jsonl"
+    with ReportWriter(worker_stream(main, "gw0")) as worker:
+        worker.write({"type": "request", "method": "GET", "status": 200})
+    plugin = ReportPlugin(ReportWriter(main, include_timestamps=False))
+
+    for phase in ("setup", "call"):
+        plugin.pytest_runtest_logreport(_phase("t.py::test_a", phase))
+    plugin.pytest_runtest_logreport(
+        _phase("t.py::test_a", "teardown", "failed", "teardown boom")
+    )
+    plugin.pytest_sessionfinish(None)
+
+    tests = list(iter_records(main, "test"))
+    assert [(t["outcome"], t["message"]) for t in tests] == [("error", "teardown boom")]
+    assert len(list(iter_records(main, "request"))) == 1
+    assert not worker_stream(main, "gw0").exists()
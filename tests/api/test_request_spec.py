@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+from api.endpoints.json_placeholder import Default
+from framework_api.client import ApiClient
+from framework_api.request_spec import RequestSpec, UrlTemplate
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def test_template_is_compiled_once():
+    template = UrlTemplate.compile("/posts/{id}/comments")
+    assert template is UrlTemplate.compile("/posts/{id}/comments")
+    assert template.params == ("id",)
+    assert template.render({"id": 7}) == "/posts/7/comments"
+
+
+@pytest.mark.parametrize(
+    "params", [{}, {"id": 1, "extra": 2}, {"id": None}, {"id": ""}]
+)
+def test_template_rejects_bad_params(params):
+    with pytest.raises(ValueError):
+        UrlTemplate.compile("/posts/{id}").render(params)
+
+
+def test_path_values_are_encoded():
+    """
+    A value cannot add path segments or a query string
+    """
+    assert UrlTemplate("/posts/{id}").render({"id": "1/../2?x"}) == (
+        "/posts/1%2F..%2F2%3Fx"
+    )
+
+
+def test_spec_leaves_endpoint_untouched(default: Default):
+    point = default.posts_id_get
+    spec = RequestSpec.from_endpoint(
+        point, "http://h/", {"id": 3}, {"userId": 1, "skip": None}
+    )
+
+    assert point.endpoint == "/posts/{id}"
+    assert spec.url == "http://h/posts/3"
+    assert dict(spec.params) == {"userId": 1}
+    with pytest.raises(TypeError):
+        spec.params["userId"] = 2
+    assert dict(spec.with_query(_page=2).params) == {"userId": 1, "_page": 2}
+
+
+def test_endpoint_helper_returns_copy(default: Default):
+    point = default.posts_id_get
+    resolved = endpoint_helper(point, "http://h", {"id": 1})
+
+    assert resolved.endpoint == "http://h/posts/1"
+    assert point.endpoint == "/posts/{id}"
+
+
+def test_client_accepts_spec(default: Default):
+    """
+    Specs are shared by concurrent clients without URL corruption
+    """
+    routes = {f"GET /posts/{i}": [(200, {}, {"id": i})] for i in range(8)}
+    with LocalServer(routes) as server:
+        specs = [
+            RequestSpec.from_endpoint(
+                default.posts_id_get, server.url, {"id": i}, {"userId": 1}
+            )
+            for i in range(8)
+        ]
+        results = {}
+
+        def fetch(spec):
+            results[spec.url] = ApiClient(spec).request()
+
+        threads = [threading.Thread(target=fetch, args=(s,)) for s in specs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert results == {spec.url: {"id": i} for i, spec in enumerate(specs)}
+    assert all(path.endswith("?userId=1") for _, path, _, _ in server.requests)
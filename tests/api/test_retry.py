@@ -0,0 +1,110 @@
+import niquests
+import pytest
+
+from api.endpoints.json_placeholder import Default
+from framework_api.client import APIError, ApiClient
+from framework_api.retry import RetryBudget, RetryPolicy
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def policy(**kwargs) -> RetryPolicy:
+    kwargs.setdefault("retry_count", 3)
+    return RetryPolicy(retry_delay=0, jitter=False, **kwargs)
+
+
+def test_get_retried_until_success(default: Default):
+    """
+    Transient 503 on GET is retried, then the success body is returned
+    """
+    routes = {
+        "GET /posts": [(503, {}, None), (503, {}, None), (200, {}, [{"id": 1}])]
+    }
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        data = ApiClient(point, retry=policy()).request()
+
+    assert data == [{"id": 1}]
+    assert len(server.requests) == 3
+
+
+def test_post_not_retried_on_server_error(default: Default):
+    """
+    POST is not idempotent: 503 is returned to the caller without retry
+    """
+    routes = {"POST /posts": [(503, {}, {"error": "down"}), (201, {}, {"id": 101})]}
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_post, server.url)
+        client = ApiClient(point, validate_response=True, retry=policy())
+        client.data = {"title": "foo", "body": "bar", "userId": 1}
+        with pytest.raises(APIError) as error:
+            client.request()
+
+    assert error.value.status_code == 503
+    assert len(server.requests) == 1
+
+
+def test_retry_after_honored_for_post_429(default: Default):
+    """
+    429 means the request was not processed, so even POST is retried
+    after the server-provided Retry-After delay
+    """
+    routes = {
+        "POST /posts": [(429, {"Retry-After": "0"}, None), (201, {}, {"id": 101})]
+    }
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_post, server.url)
+        client = ApiClient(point, retry=policy())
+        client.data = {"title": "foo", "body": "bar", "userId": 1}
+
+        assert client.request() == {"id": 101}
+
+
+def test_budget_caps_total_retries(default: Default):
+    """
+    Shared budget stops retries across clients once exhausted
+    """
+    shared = policy(budget=RetryBudget(max_retries=2))
+    with LocalServer({"GET /posts": [(503, {}, None)]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        ApiClient(point, retry=shared).request()
+        ApiClient(point, retry=shared).request()
+
+    assert shared.budget.remaining == 0
+    assert len(server.requests) == 4
+
+
+def test_backoff_is_exponential_and_capped():
+    retry = RetryPolicy(retry_delay=1.0, max_delay=5.0, jitter=False)
+
+    assert [retry.backoff(n) for n in range(4)] == [1.0, 2.0, 4.0, 5.0]
+    assert retry.backoff(0, retry_after=60) == 60.0
+
+
+def test_retry_after_past_max_delay_not_retried(default: Default):
+    """
+    A Retry-After the policy will not wait for returns the 503 at once
+    instead of retrying before the server accepts requests again
+    """
+    retry = policy()  # max_delay 30s
+    routes = {"GET /posts": [(503, {"Retry-After": "60"}, None), (200, {}, [])]}
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        ApiClient(point, retry=retry).request()
+
+    assert len(server.requests) == 1
+    assert retry.budget.used == 0
+
+
+def test_post_retried_only_when_not_sent():
+    """
+    A refused connection never reached the server, so POST may be retried;
+    a read timeout may have been processed and is not retried
+    """
+    with pytest.raises(niquests.ConnectionError) as refused:
+        niquests.post("http://127.0.0.1:1/posts", timeout=2)
+    retry = policy()
+
+    assert retry.delay_for_error("POST", 0, refused.value) == 0
+    assert retry.delay_for_error("POST", 0, niquests.ConnectTimeout()) == 0
+    assert retry.delay_for_error("POST", 0, niquests.ReadTimeout()) is None
+    assert retry.delay_for_error("GET", 0, niquests.ReadTimeout()) == 0
@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+
+from api.endpoints.json_placeholder import Default
+from framework_api.async_client import AsyncApiClient
+from framework_api.client import ApiClient
+from framework_api.singleflight import SingleFlight
+from framework_api.timing import TimingRecorder
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def slow(body, delay=0.2):
+    def reply(handler):
+        time.sleep(delay)
+        return body
+
+    return reply
+
+
+def run_threads(count, target):
+    results = [None] * count
+    barrier = threading.Barrier(count)
+
+    def worker(i):
+        barrier.wait()
+        results[i] = target()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.2)
+        return "value"
+
+    results = run_threads(5, lambda: flight.do("key", fn))
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"executed": 1, "coalesced": 4}
+    assert flight.in_flight == 0
+
+
+def test_error_is_shared_and_not_remembered():
+    flight = SingleFlight()
+
+    def boom():
+        time.sleep(0.1)
+        raise ValueError("upstream down")
+
+    def call():
+        try:
+            return flight.do("key", boom)
+        except ValueError as exc:
+            return str(exc)
+
+    assert run_threads(3, call) == ["upstream down"] * 3
+    assert flight.do("key", lambda: "recovered") == "recovered"
+
+
+def test_only_safe_methods_are_keyed():
+    key = SingleFlight.make_key
+    assert key("POST", "http://h/posts") is None
+    assert key("get", "http://h/posts", {"b": 2, "a": 1}) == key(
+        "GET", "http://h/posts", {"a": 1, "b": 2}
+    )
+    assert key("GET", "http://h/posts", headers={"Authorization": "a"}) != key(
+        "GET", "http://h/posts", headers={"Authorization": "b"}
+    )
+
+
+def test_client_coalesces_identical_gets(default: Default):
+    """
+    Parallel identical GETs hit the server once, each caller gets its own body
+    """
+    routes = {"GET /posts": [(200, {}, slow([{"id": 1, "name": "Leanne"}]))]}
+    flight = SingleFlight()
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        results = run_threads(
+            4, lambda: ApiClient(point, single_flight=flight).request()
+        )
+
+    assert len(server.requests) == 1
+    assert results == [[{"id": 1, "name": "Leanne"}]] * 4
+    assert len({id(body) for body in results}) == 4
+    assert flight.coalesced == 3
+
+
+def test_async_client_coalesces_identical_gets(default: Default):
+    routes = {"GET /posts": [(200, {}, slow([{"id": 1}]))]}
+    flight = SingleFlight()
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+
+        async def run():
+            async with AsyncApiClient(point, single_flight=flight) as client:
+                return await client.request_many([point] * 3)
+
+        results = asyncio.run(run())
+
+    assert len(server.requests) == 1
+    assert results == [[{"id": 1}]] * 3
+    assert results[0] is not results[1]
+    assert flight.stats() == {"executed": 1, "coalesced": 2}
+
+
+def test_post_is_not_coalesced(default: Default):
+    routes = {"POST /posts": [(201, {}, slow({"id": 101}, 0.1))]}
+    flight = SingleFlight()
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_post, server.url)
+
+        def post():
+            client = ApiClient(point, single_flight=flight)
+            client.data = {"title": "foo"}
+            return client.request()
+
+        run_threads(3, post)
+
+    assert len(server.requests) == 3
+    assert flight.stats() == {"executed": 0, "coalesced": 0}
+
+
+def test_followers_held_to_response_time_budget(default: Default):
+    """
+    Callers served by another caller's request time their own wait, so
+    enforce_response_time applies to every one of them
+    """
+    routes = {"GET /posts": [(200, {}, slow([{"id": 1}]))]}
+    flight = SingleFlight()
+    recorder = TimingRecorder()
+
+    def call():
+        client = ApiClient(
+            point,
+            single_flight=flight,
+            recorder=recorder,
+            max_response_time=0.05,
+            enforce_response_time=True,
+        )
+        try:
+            client.request()
+        except AssertionError:
+            return "over budget"
+        return client.last_timing.total
+
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        results = run_threads(3, call)
+
+    assert results == ["over budget"] * 3
+    assert flight.coalesced == 2
+    assert len(recorder) == 1  # the upstream call, recorded once
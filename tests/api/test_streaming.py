@@ -0,0 +1,95 @@
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from api.endpoints.json_placeholder import Default
+from framework_api.client import APIError, ApiClient
+from framework_api.streaming import iter_json_array
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+class Post(BaseModel):
+    id: int
+    title: str
+
+
+def byte_chunks(data: bytes, size: int = 1):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+def test_iter_json_array_byte_by_byte():
+    """
+    Items split across chunks (numbers, escapes, multibyte chars) decode intact
+    """
+    items = [123456, 'a,]b"c\\', {"t": "тест", "n": [1, {"x": None}]}, -1.5e3, True]
+    raw = json.dumps(items, ensure_ascii=False).encode("utf-8")
+
+    assert list(iter_json_array(byte_chunks(raw))) == items
+    assert list(iter_json_array([b" [ ] "])) == []
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b'[{"id": 1}, {"id"', b"[1 2]", b"[1,2] garbage", b"[1,,2]", b"[1,]", b"[,1]"],
+)
+def test_iter_json_array_rejects_malformed_body(raw):
+    """
+    Truncated bodies, missing or doubled commas and trailing data all fail
+    """
+    with pytest.raises(ValueError):
+        list(iter_json_array(byte_chunks(raw, 2)))
+
+
+def test_iter_json_array_large_item_in_small_chunks():
+    """
+    An item spanning many chunks is decoded once it is complete
+    """
+    items = [{"text": "x" * 200_000}, 1]
+    raw = json.dumps(items).encode("utf-8")
+
+    assert list(iter_json_array(byte_chunks(raw, 512))) == items
+
+
+def test_stream_validates_items_and_stops_early(default: Default):
+    """
+    Items arrive one by one, are validated per item and iteration can stop
+    """
+    posts = [{"id": i, "title": f"post {i}"} for i in range(1, 2001)]
+    with LocalServer({"GET /posts": [(200, {}, posts)]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        client = ApiClient(point)
+
+        first = []
+        for item in client.stream(item_schema=Post, chunk_size=1024):
+            first.append(item)
+            if len(first) == 3:
+                break
+        everything = list(ApiClient(point).stream(item_schema=Post))
+
+    assert first == posts[:3]
+    assert everything == posts
+    assert client.last_timing.size > 0
+
+
+def test_stream_item_validation_failure(default: Default):
+    bad = [{"id": 1, "title": "ok"}, {"id": "x"}]
+    with LocalServer({"GET /posts": [(200, {}, bad)]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        items = ApiClient(point).stream(item_schema=Post)
+
+        assert next(items)["id"] == 1
+        with pytest.raises(AssertionError, match="Schema validation failed"):
+            next(items)
+
+
+def test_stream_raises_on_error_status(default: Default):
+    """
+    A non-2xx response is an APIError even without validate_response
+    """
+    with LocalServer({"GET /posts": [(404, {}, {"error": "gone"})]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+
+        with pytest.raises(APIError, match="gone") as error:
+            list(ApiClient(point).stream())
+        assert error.value.status_code == 404
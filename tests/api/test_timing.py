@@ -0,0 +1,62 @@
+import pytest
+
+from api.endpoints.json_placeholder import Default
+from framework_api.client import APIError, ApiClient
+from framework_api.retry import RetryPolicy
+from framework_api.timing import TimingRecorder
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def test_timing_recorded_per_request(default: Default):
+    """
+    Every call stores latency breakdown and payload size on the client
+    """
+    recorder = TimingRecorder()
+    with LocalServer({"GET /posts": [(200, {}, [{"id": 1}])]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        client = ApiClient(point, recorder=recorder)
+        client.request()
+        client.request()
+
+    timing = client.last_timing
+    assert len(client.timings) == 2
+    assert timing.status_code == 200
+    assert timing.size == len(b'[{"id": 1}]')
+    assert timing.total >= timing.ttfb >= 0
+    assert recorder.summary()["GET /posts"]["count"] == 2
+
+
+def test_response_time_budget_enforced(default: Default):
+    """
+    Calls slower than max_response_time fail when enforcement is on
+    """
+    with LocalServer({"GET /posts": [(200, {}, [])]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        relaxed = ApiClient(point, max_response_time=1e-9)
+        strict = ApiClient(
+            point, max_response_time=1e-9, enforce_response_time=True
+        )
+
+        assert relaxed.request() == []
+        with pytest.raises(AssertionError, match="budget"):
+            strict.request()
+
+
+def test_failed_attempts_recorded(default: Default):
+    """
+    Attempts without a response are timed too, marked with the error
+    """
+    recorder = TimingRecorder()
+    point = endpoint_helper(default.posts_get, "http://127.0.0.1:1")
+    retry = RetryPolicy(retry_count=1, retry_delay=0, jitter=False)
+    client = ApiClient(point, recorder=recorder, retry=retry)
+    with pytest.raises(APIError):
+        client.request()
+
+    assert [(t.status_code, t.error) for t in client.timings] == [
+        (-1, "ConnectionError")
+    ] * 2
+    assert client.last_timing.total > 0
+    summary = recorder.summary()["GET /posts"]
+    assert summary["count"] == summary["errors"] == 2
+    assert summary["mean_size"] == 0.0
@@ -0,0 +1,54 @@
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from api.endpoints.json_placeholder import Default
+from framework_api.client import ApiClient
+from framework_api.validation import Sampling, get_adapter
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+class Post(BaseModel):
+    id: int
+    title: str
+
+
+POSTS = [{"id": i, "title": f"post {i}"} for i in range(10)]
+
+
+def test_adapter_compiled_once_per_shape():
+    assert get_adapter(Post, many=True) is get_adapter(Post, many=True)
+    assert get_adapter(Post) is not get_adapter(Post, many=True)
+    assert get_adapter(List[Post]) is get_adapter(List[Post])
+
+
+@pytest.mark.parametrize("schema", [Post, List[Post], list[Post]])
+def test_list_payload_validated_item_wise(schema):
+    result = ApiClient.validate(POSTS, schema)
+
+    assert [post.id for post in result] == list(range(10))
+    with pytest.raises(AssertionError, match="Schema validation failed"):
+        ApiClient.validate(POSTS + [{"id": "bad"}], schema)
+
+
+def test_sampling_every_nth_and_random_subset():
+    payload = list(POSTS)
+    payload[3] = {"id": "bad"}
+
+    every_second = ApiClient.validate(payload, Post, Sampling(every=2))
+    subset = ApiClient.validate(POSTS, Post, Sampling(size=4, seed=1))
+
+    assert [post.id for post in every_second] == [0, 2, 4, 6, 8]
+    assert len(subset) == 4
+    assert subset == ApiClient.validate(POSTS, Post, Sampling(size=4, seed=1))
+
+
+def test_client_validates_list_response(default: Default):
+    with LocalServer({"GET /posts": [(200, {}, POSTS)]}) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        client = ApiClient(
+            point, schema=Post, validate_response=True, sampling=Sampling(every=3)
+        )
+
+        assert client.request() == POSTS
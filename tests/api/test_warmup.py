@@ -0,0 +1,78 @@
+import threading
+
+from api.endpoints.json_placeholder import Default
+from framework_api.client import ApiClient
+from framework_api.dns import DnsCache
+from framework_api.pool import SessionPool
+from framework_api.warmup import warm_up
+from tests.api.helper import LocalServer, endpoint_helper
+
+
+def test_dns_cache_resolves_once():
+    cache = DnsCache(ttl=60)
+    assert cache.resolve("localhost")
+    assert cache.resolve("LOCALHOST") == cache.resolve("localhost")
+    assert (cache.lookups, cache.hits) == (1, 2)
+    assert cache.resolve("127.0.0.1") == ["127.0.0.1"]
+    assert cache.resolve("no-such-host.invalid") == []
+    assert cache.resolver_for("127.0.0.1") is None
+
+
+def test_pool_sessions_use_cached_dns(default: Default):
+    routes = {"GET /posts": [(200, {}, [])]}
+    cache = DnsCache()
+    pool = SessionPool(dns_cache=cache)
+    with LocalServer(routes) as server:
+        url = server.url.replace("127.0.0.1", "localhost")
+        point = endpoint_helper(default.posts_get, url)
+        for _ in range(3):
+            assert ApiClient(point, pool=pool).request() == []
+    pool.close()
+
+    assert cache.lookups == 1
+
+
+def test_warm_up_opens_reused_connections(default: Default):
+    """
+    Warm-up leaves N keep-alive connections that later requests reuse
+    """
+    ports = {"HEAD": set(), "GET": set()}
+    lock = threading.Lock()
+
+    def remember(handler):
+        with lock:
+            ports[handler.command].add(handler.client_address[1])
+        return None if handler.command == "HEAD" else []
+
+    barrier = threading.Barrier(3)
+
+    def slow_head(handler):
+        # hold every HEAD until all three are in flight: three connections
+        barrier.wait(timeout=2)
+        return remember(handler)
+
+    routes = {"HEAD /": [(200, {}, slow_head)], "GET /posts": [(200, {}, remember)]}
+    pool = SessionPool(pool_maxsize=3)
+    with LocalServer(routes) as server:
+        point = endpoint_helper(default.posts_get, server.url)
+        session = ApiClient(point, pool=pool).session
+
+        result = warm_up(session, server.url + "/", connections=3)
+        for _ in range(5):
+            ApiClient(point, pool=pool).request()
+    pool.close()
+
+    assert result.ok and result.opened == 3 and not result.errors
+    assert len(ports["HEAD"]) == 3
+    assert ports["GET"] <= ports["HEAD"]
+
+
+def test_warm_up_reports_failures():
+    with LocalServer() as server:
+        url = server.url
+    session = SessionPool().acquire(url)
+
+    result = warm_up(session, url, connections=2, timeout=1)
+
+    assert not result.ok
+    assert result.opened == 0 and len(result.errors) == 2